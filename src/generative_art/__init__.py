@@ -4,7 +4,12 @@ provides flow field utilities, perlin noise animations, and tools for
 generating natural-looking patterns.
 """
 
-from generative_art.export import ResolutionConfig, export_multi_resolution
+from generative_art.export import (
+    ResolutionConfig,
+    export_multi_resolution,
+    get_resolution_shorthand,
+    parse_resolution,
+)
 from generative_art.flow_field import (
     ClusteringConfig,
     FlowField,
@@ -34,5 +39,7 @@ __all__ = [
     "fbm_noise1",
     "fbm_noise2",
     "fbm_noise3",
+    "get_resolution_shorthand",
     "init_noise",
+    "parse_resolution",
 ]
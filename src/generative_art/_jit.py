@@ -0,0 +1,38 @@
+"""optional numba support for hot numeric loops.
+
+kernels are decorated with `njit` from here rather than from numba directly.
+when numba is installed they are compiled to machine code; without it the
+decorator is a no-op and the same functions run as plain python, so modules
+stay importable in environments like maya's bundled interpreter. `prange`
+likewise falls back to the builtin range.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range  # type: ignore[misc]
+
+    def njit(*args: Any, **_kwargs: Any) -> Any:  # type: ignore[no-redef]
+        """No-op stand-in for numba.njit when numba is not installed.
+
+        Supports both the bare `@njit` and the configured `@njit(...)` forms.
+
+        Returns:
+            the decorated function unchanged, or a decorator that returns it
+        """
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+
+        def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+            return func
+
+        return decorator
+
+
+__all__ = ["NUMBA_AVAILABLE", "njit", "prange"]
@@ -7,18 +7,167 @@ This sketch demonstrates:
 - Layered composition
 """
 
+import math
+import shutil
+import subprocess
 from pathlib import Path
 
 import click
-from noise import pnoise3
-from py5 import Sketch
+import numpy as np
+from py5 import Py5Graphics, Sketch
+
+from generative_art._jit import NUMBA_AVAILABLE, njit
+from generative_art.export import get_resolution_shorthand, parse_resolution
+from generative_art.particles import (
+    build_step_color_lut,
+    flow_line_colors,
+    particle_base_colors,
+    seed_particles,
+)
+from generative_art.perlin import pnoise3, pnoise3_scalar
+from generative_art.segments import (
+    group_segments_by_color,
+    paths_to_segments,
+    segments_to_triangles,
+)
+
+
+@njit(cache=True, fastmath=True)
+def _advect_particles_jit(
+    xs: np.ndarray,
+    ys: np.ndarray,
+    z: float,
+    noise_scale: float,
+    flow_strength: float,
+    steps: int,
+    width: float,
+    height: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Trace particles one at a time in a numba-compiled loop.
+
+    each particle's steps run without leaving machine code.
+    """
+    num_particles = xs.shape[0]
+    paths = np.empty((num_particles, steps + 1, 2))
+    lengths = np.empty(num_particles, dtype=np.int64)
+
+    for p in range(num_particles):
+        x = xs[p]
+        y = ys[p]
+        paths[p, 0, 0] = x
+        paths[p, 0, 1] = y
+        count = 1
+
+        for _ in range(steps):
+            # convert noise to angle and step along it
+            noise_val = pnoise3_scalar(x * noise_scale, y * noise_scale, z, 3, 0.5, 2.0)
+            angle = noise_val * math.tau * 2
+            x += math.cos(angle) * flow_strength
+            y += math.sin(angle) * flow_strength
+
+            # stop if off canvas
+            if x < 0 or x > width or y < 0 or y > height:
+                break
+
+            paths[p, count, 0] = x
+            paths[p, count, 1] = y
+            count += 1
+
+        lengths[p] = count
+
+    return paths, lengths
+
+
+def _advect_particles_numpy(
+    xs: np.ndarray,
+    ys: np.ndarray,
+    z: float,
+    noise_scale: float,
+    flow_strength: float,
+    steps: int,
+    width: float,
+    height: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Trace particles together, one vectorized step at a time.
+
+    fallback for environments without numba; each step is a handful of array
+    operations over the particles still on the canvas.
+    """
+    x = xs.astype(np.float64)
+    y = ys.astype(np.float64)
+    paths = np.empty((x.shape[0], steps + 1, 2))
+    paths[:, 0, 0] = x
+    paths[:, 0, 1] = y
+    lengths = np.ones(x.shape[0], dtype=np.int64)
+
+    # indices of particles still on the canvas, compacted as particles leave
+    alive = np.arange(x.shape[0])
+
+    for step in range(1, steps + 1):
+        # convert noise to angle and step every live particle along it
+        noise_val = pnoise3(x * noise_scale, y * noise_scale, z, octaves=3)
+        angle = noise_val * np.pi * 4
+        x += np.cos(angle) * flow_strength
+        y += np.sin(angle) * flow_strength
+
+        # particles stop for good once they leave the canvas
+        in_bounds = (x >= 0) & (x <= width) & (y >= 0) & (y <= height)
+        if not in_bounds.all():
+            alive = alive[in_bounds]
+            x = x[in_bounds]
+            y = y[in_bounds]
+            if alive.size == 0:
+                break
+
+        paths[alive, step, 0] = x
+        paths[alive, step, 1] = y
+        lengths[alive] += 1
+
+    return paths, lengths
+
+
+def advect_particles(
+    xs: np.ndarray,
+    ys: np.ndarray,
+    z: float,
+    noise_scale: float,
+    flow_strength: float,
+    steps: int,
+    width: float,
+    height: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Trace every particle through the noise field.
+
+    uses the numba kernel when numba is installed, otherwise advances all
+    particles together with vectorized numpy.
+
+    Args:
+        xs: particle start x positions
+        ys: particle start y positions
+        z: noise time coordinate for this frame
+        noise_scale: scale factor for noise sampling
+        flow_strength: distance moved per step
+        steps: maximum number of steps per particle
+        width: canvas width, particles stop once they leave the canvas
+        height: canvas height
+
+    Returns:
+        tuple of (paths, lengths) where paths has shape (N, steps + 1, 2) and
+        only the first lengths[i] points of paths[i] are valid
+    """
+    advect = _advect_particles_jit if NUMBA_AVAILABLE else _advect_particles_numpy
+    return advect(xs, ys, z, noise_scale, flow_strength, steps, width, height)
 
 
 class AnimatedIncandesceeentPerlinFlow(Sketch):
     """Generate flowing patterns based on Perlin noise fields."""
 
     def __init__(
-        self, width: int = 1920, height: int = 1080, output_path: str | None = None
+        self,
+        width: int = 1920,
+        height: int = 1080,
+        output_path: str | None = None,
+        seed: int | None = None,
     ) -> None:
         """Initialize the sketch parameters.
 
@@ -26,16 +175,35 @@ class AnimatedIncandesceeentPerlinFlow(Sketch):
             width: Canvas width in pixels
             height: Canvas height in pixels
             output_path: If provided, save output to this path
+            seed: Random seed for particle placement (random if not provided)
         """
         super().__init__()
         self.canvas_width = width
         self.canvas_height = height
         self.output_path = output_path
+        self.rng = np.random.default_rng(seed)
         self.num_particles = 3000
         self.noise_scale = 0.003
         self.flow_strength = 2.0
         self.time_offset = 0.0  # time dimension for evolving noise field
-        self.particles: list[list[float]] = []
+        self.line_steps = 250  # increased so particles travel further
+        self.line_width = 1.5
+
+        # particle start positions as structure-of-arrays, filled in setup
+        self.px = np.empty(0, dtype=np.float32)
+        self.py = np.empty(0, dtype=np.float32)
+
+        # per-step color shifts and alpha, filled in setup
+        self._step_lut = np.empty((0, 4), dtype=np.float32)
+
+        # live preview accumulates short trails in an offscreen buffer that
+        # fades a little each frame instead of retracing every full line
+        self.trail_steps = 20  # steps traced per preview frame
+        self.trail_fade = 12  # alpha of the background wash over old trails
+        self.trail_buffer: Py5Graphics | None = None
+        self.head_x = np.empty(0)
+        self.head_y = np.empty(0)
+        self.head_age = np.empty(0, dtype=np.int64)
 
     def settings(self) -> None:
         """Configure the sketch size and renderer."""
@@ -46,53 +214,33 @@ class AnimatedIncandesceeentPerlinFlow(Sketch):
         self.background(8, 10, 20)
         # note: no no_loop() call - this enables animation
 
-        # Calculate center
-        center_x = self.canvas_width / 2
-        center_y = self.canvas_height / 2
-
-        # Initialize particles at random positions (50% of total)
-        random_count = int(self.num_particles * 0.5)
-        for _ in range(random_count):
-            x = self.random(self.canvas_width)
-            y = self.random(self.canvas_height)
-            self.particles.append([x, y])
-
-        # Add particles in concentric rings around center (20% of total)
-        # This ensures particles flow THROUGH the center area
-        ring_count = int(self.num_particles * 0.2)
-        num_rings = 5
-        particles_per_ring = ring_count // num_rings
-
-        for ring in range(num_rings):
-            # Rings at different radii from very close to medium distance
-            ring_radius = (ring + 1) * 80  # 80, 160, 240, 320, 400 pixels
-            for _ in range(particles_per_ring):
-                angle = self.random(self.TWO_PI)
-                # Add some variation to the radius
-                radius = ring_radius + self.random(-30, 30)
-                x = center_x + self.cos(angle) * radius
-                y = center_y + self.sin(angle) * radius
-                self.particles.append([x, y])
-
-        # Add MANY particles right AT the center (30% of total)
-        # These will immediately start flowing outward/around
-        exact_center_count = int(self.num_particles * 0.3)
-        for _ in range(exact_center_count):
-            # Very tight cluster at exact center
-            angle = self.random(self.TWO_PI)
-            radius = self.random(5)  # Within 5 pixels of dead center
-            x = center_x + self.cos(angle) * radius
-            y = center_y + self.sin(angle) * radius
-            self.particles.append([x, y])
+        self._step_lut = build_step_color_lut(self.line_steps)
+
+        self.px, self.py = seed_particles(
+            self.rng, self.num_particles, self.canvas_width, self.canvas_height
+        )
+
+        # preview only; saved frames always show the full lines
+        if self.output_path is None:
+            self.trail_buffer = self.create_graphics(
+                self.canvas_width, self.canvas_height
+            )
+            with self.trail_buffer.begin_draw():
+                self.trail_buffer.background(8, 10, 20)
+            self.head_x = self.px.astype(np.float64)
+            self.head_y = self.py.astype(np.float64)
+            self.head_age = np.zeros(len(self.px), dtype=np.int64)
 
     def draw(self) -> None:
         """Main drawing function."""
-        # clear canvas each frame for animation
-        self.background(8, 10, 20)
-
-        # draw flow lines for each particle
-        for i, particle in enumerate(self.particles):
-            self.draw_flow_line(particle, i)
+        z = self.time_offset * 0.01  # time dimension - evolves the field
+        if self.trail_buffer is not None:
+            self.draw_trails(self.trail_buffer, z)
+            self.image(self.trail_buffer, 0, 0)
+        else:
+            # clear canvas each frame for animation
+            self.background(8, 10, 20)
+            self.draw_flow_lines(z)
 
         # apply blur for smooth aesthetic
         self.apply_filter(self.BLUR, 1)
@@ -106,141 +254,171 @@ class AnimatedIncandesceeentPerlinFlow(Sketch):
             print(f"    Saved: {self.output_path}")
             self.exit_sketch()
 
-    def draw_flow_line(self, start_pos: list[float], particle_id: int) -> None:
-        """Draw a flowing line following the noise field.
+    def draw_flow_lines(self, z: float) -> None:
+        """Trace all particles through the noise field and draw their lines.
 
         Args:
-            start_pos: Starting [x, y] position
-            particle_id: Unique particle identifier for color variation
+            z: noise z coordinate of the current frame
         """
-        x, y = start_pos
-        steps = 250  # Increased so particles travel further
-
-        # Color based on particle position and ID
-        hue = (particle_id * 0.5 + x * 0.1) % 360
-        r = int((self.sin(hue * 0.02) + 1) * 100 + 80)
-        g = int((self.cos(hue * 0.03 + 2) + 1) * 90 + 100)
-        b = int((self.sin(hue * 0.025 + 4) + 1) * 100 + 120)
-
-        self.stroke_weight(1.5)
-        self.no_fill()
-
-        # Draw line using individual line segments with changing colors
-        prev_x, prev_y = x, y
-
-        for step in range(steps):
-            # get noise value at current position with time dimension
-            noise_val = pnoise3(
-                x * self.noise_scale,
-                y * self.noise_scale,
-                self.time_offset * 0.01,  # time dimension - evolves the field
-                octaves=3,
-                persistence=0.5
-            )
-
-            # Convert noise to angle
-            angle = noise_val * self.TWO_PI * 2
-
-            # Calculate velocity from angle
-            vx = self.cos(angle) * self.flow_strength
-            vy = self.sin(angle) * self.flow_strength
-
-            # Update position
-            x += vx
-            y += vy
-
-            # Boundary check - stop if off canvas
-            if x < 0 or x > self.canvas_width or y < 0 or y > self.canvas_height:
-                break
-
-            # Fade alpha over the line
-            alpha = 255 * (1 - step / steps) * 0.4
+        paths, lengths = advect_particles(
+            self.px,
+            self.py,
+            z,
+            self.noise_scale,
+            self.flow_strength,
+            self.line_steps,
+            float(self.canvas_width),
+            float(self.canvas_height),
+        )
+        segments, particle_ids, step_ids = paths_to_segments(paths, lengths)
+        base_colors = particle_base_colors(self.px)
+        colors = flow_line_colors(base_colors[particle_ids], step_ids, self._step_lut)
+        self.draw_segments(self, segments, colors)
 
-            # Update color slightly as we move
-            r_shift = int(r + self.sin(step * 0.1) * 20)
-            g_shift = int(g + self.cos(step * 0.1) * 20)
-            b_shift = int(b + self.sin(step * 0.15) * 20)
+    def draw_trails(self, buffer: Py5Graphics, z: float) -> None:
+        """Extend every particle's trail by a few steps in the trail buffer.
 
-            self.stroke(r_shift, g_shift, b_shift, alpha)
+        particles continue from where the previous frame left them and start
+        over at their seed position once they leave the canvas or reach the
+        end of a full line.
 
-            # Draw line segment from previous position to current
-            self.line(prev_x, prev_y, x, y)
+        Args:
+            buffer: offscreen graphics holding the trails drawn so far
+            z: noise z coordinate of the current frame
+        """
+        paths, lengths = advect_particles(
+            self.head_x,
+            self.head_y,
+            z,
+            self.noise_scale,
+            self.flow_strength,
+            self.trail_steps,
+            float(self.canvas_width),
+            float(self.canvas_height),
+        )
+        segments, particle_ids, step_ids = paths_to_segments(paths, lengths)
+        ages = np.minimum(self.head_age[particle_ids] + step_ids, self.line_steps - 1)
+        base_colors = particle_base_colors(self.px)
+        colors = flow_line_colors(base_colors[particle_ids], ages, self._step_lut)
+
+        with buffer.begin_draw():
+            # fade the existing trails instead of clearing them
+            buffer.no_stroke()
+            buffer.fill(8, 10, 20, self.trail_fade)
+            buffer.rect(0, 0, self.canvas_width, self.canvas_height)
+            self.draw_segments(buffer, segments, colors)
+
+        # move each head to the end of its new segment
+        last = lengths - 1
+        self.head_x = paths[np.arange(len(last)), last, 0]
+        self.head_y = paths[np.arange(len(last)), last, 1]
+        self.head_age += last
+
+        # restart particles that left the canvas or finished their line
+        finished = (lengths <= self.trail_steps) | (self.head_age >= self.line_steps)
+        self.head_x[finished] = self.px[finished]
+        self.head_y[finished] = self.py[finished]
+        self.head_age[finished] = 0
+
+    def draw_segments(
+        self, target: Sketch | Py5Graphics, segments: np.ndarray, colors: np.ndarray
+    ) -> None:
+        """Draw line segments as filled triangles, batched by color.
 
-            # Update previous position
-            prev_x, prev_y = x, y
+        Args:
+            target: sketch or offscreen graphics to draw on
+            segments: (K, 4) array of (x1, y1, x2, y2) segments
+            colors: (K, 4) array of RGBA colors, one per segment
+        """
+        # lines are drawn as filled triangles, one fill + vertices call per
+        # color bucket, which skips the renderer's per-line stroke geometry
+        target.no_stroke()
+        for color, bucket in group_segments_by_color(segments, colors):
+            target.fill(*color)
+            with target.begin_shape(self.TRIANGLES):
+                target.vertices(segments_to_triangles(bucket, self.line_width))
 
 
-def get_resolution_shorthand(width: int, height: int) -> str:
-    """Convert resolution to shorthand notation.
+class FfmpegVideoWriter:
+    """Encode frames to H.264 video by piping raw RGB pixels into ffmpeg."""
 
-    Args:
-        width: Width in pixels
-        height: Height in pixels
+    def __init__(
+        self, ffmpeg_path: str, output_file: Path, frame_rate: int = 30
+    ) -> None:
+        """Initialize the writer; ffmpeg starts when the first frame arrives.
 
-    Returns:
-        Shorthand string like "1080p", "4k", "720p", etc.
-    """
-    common_resolutions = {
-        (3840, 2160): "4k",
-        (2560, 1440): "1440p",
-        (1920, 1080): "1080p",
-        (1280, 720): "720p",
-        (1440, 2560): "1440p_portrait",
-    }
-
-    resolution = (width, height)
-    if resolution in common_resolutions:
-        return common_resolutions[resolution]
-    else:
-        return f"{width}x{height}"
+        Args:
+            ffmpeg_path: Path to the ffmpeg executable
+            output_file: Video file to write
+            frame_rate: Frames per second of the output video
+        """
+        self.ffmpeg_path = ffmpeg_path
+        self.output_file = output_file
+        self.frame_rate = frame_rate
+        self.process: subprocess.Popen[bytes] | None = None
 
+    def write(self, rgb: np.ndarray) -> None:
+        """Send one frame to the encoder.
 
-def parse_resolution(resolution_str: str) -> tuple[int, int]:
-    """Parse resolution string to (width, height) tuple.
+        Args:
+            rgb: uint8 array of shape (height, width, 3)
+        """
+        # frame size is only known once the first frame has been rendered
+        if self.process is None:
+            height, width = rgb.shape[:2]
+            command = [
+                self.ffmpeg_path,
+                "-y",
+                "-loglevel",
+                "error",
+                "-f",
+                "rawvideo",
+                "-pix_fmt",
+                "rgb24",
+                "-s",
+                f"{width}x{height}",
+                "-r",
+                str(self.frame_rate),
+                "-i",
+                "-",
+                "-c:v",
+                "libx264",
+                "-pix_fmt",
+                "yuv420p",
+                str(self.output_file),
+            ]
+            self.process = subprocess.Popen(command, stdin=subprocess.PIPE)  # noqa: S603
+
+        assert self.process.stdin is not None
+        self.process.stdin.write(np.ascontiguousarray(rgb, dtype=np.uint8).tobytes())
+
+    def close(self) -> None:
+        """Flush the remaining frames, wait for ffmpeg and report the result."""
+        if self.process is None:
+            click.echo("error: no frames were written to the video", err=True)
+            return
+        assert self.process.stdin is not None
+        self.process.stdin.close()
+        if self.process.wait() != 0:
+            click.echo("error: ffmpeg failed to encode the video", err=True)
+            return
+        click.echo(f"\n📹 video saved: {self.output_file.absolute()}\n")
+
+
+def open_video_writer(output_file: Path) -> FfmpegVideoWriter | None:
+    """Create a video writer if ffmpeg is installed.
 
     Args:
-        resolution_str: Resolution as shorthand (e.g., "1080p", "4k") or "WIDTHxHEIGHT"
+        output_file: Video file to write
 
     Returns:
-        Tuple of (width, height) in pixels
-
-    Raises:
-        ValueError: If resolution string is invalid
+        a writer for output_file, or None when ffmpeg is not on PATH
     """
-    # map of common shorthand names to resolutions
-    shorthand_map = {
-        "4k": (3840, 2160),
-        "1440p": (2560, 1440),
-        "1080p": (1920, 1080),
-        "720p": (1280, 720),
-        "1440p_portrait": (1440, 2560),
-        "qhd_portrait": (1440, 2560),
-    }
-
-    # try shorthand first
-    resolution_lower = resolution_str.lower()
-    if resolution_lower in shorthand_map:
-        return shorthand_map[resolution_lower]
-
-    # try WIDTHxHEIGHT format
-    if "x" in resolution_str:
-        try:
-            parts = resolution_str.split("x")
-            if len(parts) == 2:
-                width = int(parts[0])
-                height = int(parts[1])
-                if width > 0 and height > 0:
-                    return (width, height)
-        except ValueError:
-            pass
-
-    # if we get here, format is invalid
-    valid_formats = ", ".join(shorthand_map.keys())
-    msg = (
-        f"invalid resolution: '{resolution_str}'. "
-        f"use shorthand ({valid_formats}) or WIDTHxHEIGHT format (e.g., '1920x1080')"
-    )
-    raise ValueError(msg)
+    ffmpeg_path = shutil.which("ffmpeg")
+    if ffmpeg_path is None:
+        click.echo("   ffmpeg not found on PATH, saving png frames instead")
+        return None
+    return FfmpegVideoWriter(ffmpeg_path, output_file)
 
 
 def render_animation_sequential(
@@ -248,6 +426,7 @@ def render_animation_sequential(
     num_frames: int = 900,
     resolution: tuple[int, int] = (1920, 1080),  # default to 1080p for space savings
     seed: int | None = None,
+    encode_video: bool = True,
 ) -> None:
     """Render animation frames sequentially (macOS-compatible).
 
@@ -260,6 +439,8 @@ def render_animation_sequential(
         num_frames: Number of frames to render (900 = 30 sec at 30fps)
         resolution: (width, height) tuple
         seed: Random seed for deterministic output (auto-generated if not provided)
+        encode_video: Pipe frames straight into ffmpeg to write an mp4 instead of
+            saving a png per frame (falls back to pngs if ffmpeg is not installed)
     """
     import random
     import time
@@ -271,14 +452,23 @@ def render_animation_sequential(
     width, height = resolution
     res_shorthand = get_resolution_shorthand(width, height)
 
+    seed_str = f"s{seed}"
     output_path = Path(output_dir) / "frames"
-    output_path.mkdir(parents=True, exist_ok=True)
+    video_file = Path(output_dir) / f"{res_shorthand}_{seed_str}_animation.mp4"
+    video = open_video_writer(video_file) if encode_video else None
+    if video:
+        video_file.parent.mkdir(parents=True, exist_ok=True)
+        destination = f"\n   📹 OUTPUT VIDEO: {video_file.absolute()}\n"
+    else:
+        output_path.mkdir(parents=True, exist_ok=True)
+        destination = (
+            f"\n   📁 OUTPUT DIRECTORY: {output_path.absolute()}\n"
+            f"   files will be saved as: {res_shorthand}_{seed_str}_frame_NNNN.png\n"
+        )
 
-    seed_str = f"s{seed}"
     click.echo(f"\n🎬 rendering {num_frames} frames at {width}x{height} ({res_shorthand})")
     click.echo(f"   seed: {seed} (use --seed {seed} to reproduce)")
-    click.echo(f"\n   📁 OUTPUT DIRECTORY: {output_path.absolute()}")
-    click.echo(f"   files will be saved as: {res_shorthand}_{seed_str}_frame_NNNN.png\n")
+    click.echo(destination)
     click.echo(f"   ⏱️  estimated time: ~{num_frames * 2 / 60:.0f}-{num_frames * 4 / 60:.0f} minutes")
     click.echo(f"   (actual time varies based on resolution and system performance)\n")
 
@@ -287,35 +477,31 @@ def render_animation_sequential(
 
         def __init__(self) -> None:
             """Initialize sequential renderer."""
-            super().__init__(width=width, height=height)
+            super().__init__(width=width, height=height, seed=seed)
             self.frame_num = 0
             self.total_frames = num_frames
             self.start_time = time.time()
-
-        def setup(self) -> None:
-            """Set up the drawing environment with seed."""
-            self.random_seed(seed)
-
-            # call parent setup
-            super().setup()
+            self.video = video
 
         def draw(self) -> None:
             """Draw and save frame."""
             # clear canvas each frame for animation
             self.background(8, 10, 20)
 
-            # draw flow lines for each particle
-            for i, particle in enumerate(self.particles):
-                self.draw_flow_line(particle, i)
+            self.draw_flow_lines(self.time_offset * 0.01)
 
             # apply blur for smooth aesthetic
             self.apply_filter(self.BLUR, 1)
 
-            # save frame with resolution, seed, and zero-padded numbering
-            # format: {resolution}_{seed}_frame_{number}.png
-            # example: 1080p_s42_frame_0000.png
-            frame_file = output_path / f"{res_shorthand}_{seed_str}_frame_{self.frame_num:04d}.png"
-            self.save(str(frame_file))
+            if self.video:
+                self.load_np_pixels()
+                self.video.write(self.np_pixels[:, :, 1:])  # drop alpha from argb
+            else:
+                # save frame with resolution, seed, and zero-padded numbering
+                # format: {resolution}_{seed}_frame_{number}.png
+                # example: 1080p_s42_frame_0000.png
+                frame_file = output_path / f"{res_shorthand}_{seed_str}_frame_{self.frame_num:04d}.png"
+                self.save(str(frame_file))
 
             # progress reporting
             if self.frame_num % 10 == 0 or self.frame_num == 0:
@@ -341,12 +527,15 @@ def render_animation_sequential(
             if self.frame_num >= self.total_frames:
                 elapsed = time.time() - self.start_time
                 click.echo(f"\n✨ rendering complete in {elapsed / 60:.1f} minutes!")
-                click.echo(f"\n📹 compile animation with ffmpeg:")
-                click.echo(f"   cd {output_path.absolute()}")
-                click.echo(
-                    f"   ffmpeg -framerate 30 -i '{res_shorthand}_{seed_str}_frame_%04d.png' "
-                    f"-c:v libx264 -pix_fmt yuv420p ../{res_shorthand}_{seed_str}_animation.mp4\n"
-                )
+                if self.video:
+                    self.video.close()
+                else:
+                    click.echo(f"\n📹 compile animation with ffmpeg:")
+                    click.echo(f"   cd {output_path.absolute()}")
+                    click.echo(
+                        f"   ffmpeg -framerate 30 -i '{res_shorthand}_{seed_str}_frame_%04d.png' "
+                        f"-c:v libx264 -pix_fmt yuv420p ../{res_shorthand}_{seed_str}_animation.mp4\n"
+                    )
                 self.exit_sketch()
 
     sketch = SequentialRenderer()
@@ -381,12 +570,18 @@ def render_animation_sequential(
     default="./output",
     help="directory to save rendered frames (default: ./output)",
 )
+@click.option(
+    "--png-frames",
+    is_flag=True,
+    help="save a png per frame instead of piping frames into ffmpeg",
+)
 def main(
     render_animation: bool,
     resolution: str,
     frames: int,
     seed: int | None,
     output_dir: str,
+    png_frames: bool,
 ) -> None:
     """Run the sketch in different modes.
 
@@ -407,6 +602,7 @@ def main(
             num_frames=frames,
             resolution=resolution_tuple,
             seed=seed,
+            encode_video=not png_frames,
         )
     else:
         # preview mode - live animation in window
@@ -422,7 +618,7 @@ def main(
         click.echo("   run with --render-animation to save frames")
         click.echo("   use --help for all options")
 
-        sketch = AnimatedIncandesceeentPerlinFlow(width=width, height=height)
+        sketch = AnimatedIncandesceeentPerlinFlow(width=width, height=height, seed=seed)
         sketch.run_sketch()
 
 
@@ -1,9 +1,36 @@
 """Export utilities for multi-resolution rendering."""
 
+import re
+from collections import deque
+from collections.abc import Mapping
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
-import py5
+# read-only map of common shorthand names to resolutions
+SHORTHAND_MAP: Mapping[str, tuple[int, int]] = MappingProxyType(
+    {
+        "4k": (3840, 2160),
+        "1440p": (2560, 1440),
+        "1080p": (1920, 1080),
+        "720p": (1280, 720),
+        "1440p_portrait": (1440, 2560),
+        "qhd_portrait": (1440, 2560),
+    }
+)
+
+# custom WIDTHxHEIGHT resolutions
+_CUSTOM_RESOLUTION = re.compile(r"(\d+)x(\d+)")
+
+# preferred shorthand for each common resolution, used in output file names
+RESOLUTION_SHORTHANDS: dict[tuple[int, int], str] = {
+    (3840, 2160): "4k",
+    (2560, 1440): "1440p",
+    (1920, 1080): "1080p",
+    (1280, 720): "720p",
+    (1440, 2560): "1440p_portrait",
+}
 
 
 class ResolutionConfig:
@@ -20,6 +47,119 @@ class ResolutionConfig:
     }
 
 
+@lru_cache(maxsize=16)
+def parse_resolution(resolution_str: str) -> tuple[int, int]:
+    """Parse resolution string to (width, height) tuple.
+
+    Args:
+        resolution_str: Resolution as shorthand (e.g., "1080p", "4k") or "WIDTHxHEIGHT"
+
+    Returns:
+        Tuple of (width, height) in pixels
+
+    Raises:
+        ValueError: If resolution string is invalid
+    """
+    # try shorthand first
+    resolution_lower = resolution_str.lower()
+    if resolution_lower in SHORTHAND_MAP:
+        return SHORTHAND_MAP[resolution_lower]
+
+    # try WIDTHxHEIGHT format
+    match = _CUSTOM_RESOLUTION.fullmatch(resolution_str)
+    if match:
+        width = int(match[1])
+        height = int(match[2])
+        if width > 0 and height > 0:
+            return (width, height)
+
+    # if we get here, format is invalid
+    valid_formats = ", ".join(SHORTHAND_MAP.keys())
+    msg = (
+        f"invalid resolution: '{resolution_str}'. "
+        f"use shorthand ({valid_formats}) or WIDTHxHEIGHT format (e.g., '1920x1080')"
+    )
+    raise ValueError(msg)
+
+
+def get_resolution_shorthand(width: int, height: int) -> str:
+    """Convert resolution to shorthand notation.
+
+    Args:
+        width: Width in pixels
+        height: Height in pixels
+
+    Returns:
+        Shorthand string like "1080p", "4k", "720p", etc.
+    """
+    return RESOLUTION_SHORTHANDS.get((width, height), f"{width}x{height}")
+
+
+class MultiResolutionMixin:
+    """Sketch mixin that renders a queue of resolutions in one run.
+
+    mixed in ahead of a sketch class; each frame renders and saves the next
+    queued resolution, then resizes the window for the one after it.
+    """
+
+    def __init__(self, queue: deque[tuple[str, int, int, Path]]) -> None:
+        """Initialize the sketch at the first queued size.
+
+        Args:
+            queue: Renders to do, in order, as (name, width, height, output file)
+        """
+        super().__init__()
+        self.queue = queue
+        self.resized = False
+        _, width, height, _ = queue[0]
+        self.use_size(width, height)
+
+    def use_size(self, width: int, height: int) -> None:
+        """Point the sketch's own size attributes at a new resolution."""
+        if hasattr(self, "canvas_width"):
+            self.canvas_width = width
+            self.canvas_height = height
+
+    def settings(self) -> None:
+        """Size the window for the first render."""
+        parent_settings = getattr(super(), "settings", None)
+        if parent_settings is not None:
+            parent_settings()
+
+        # sketches with canvas_width/canvas_height already sized themselves
+        if not hasattr(self, "canvas_width"):
+            _, width, height, _ = self.queue[0]
+            self.size(width, height)  # type: ignore[attr-defined]
+
+    def draw(self) -> None:
+        """Render and save the current resolution."""
+        # the window was resized for this render, rebuild size-dependent state
+        parent_setup = getattr(super(), "setup", None)
+        if self.resized and parent_setup is not None:
+            parent_setup()
+        self.resized = False
+
+        res_name, width, height, output_file = self.queue.popleft()
+        print(f"  ├─ {res_name} ({width}x{height})...", end=" ", flush=True)
+        super().draw()  # type: ignore[misc]
+        self.save(str(output_file))  # type: ignore[attr-defined]
+        print("✓")
+
+        if not self.queue:
+            self.no_loop()  # type: ignore[attr-defined]
+            self.exit_sketch()  # type: ignore[attr-defined]
+            return
+
+        _, next_width, next_height, _ = self.queue[0]
+        self.use_size(next_width, next_height)
+        self.window_resize(next_width, next_height)  # type: ignore[attr-defined]
+        self.resized = True
+
+        # redraw() is cleared once draw() returns, so sketches that call
+        # no_loop() only get the next frame by looping until the queue empties
+        self.loop()  # type: ignore[attr-defined]
+
+
 def export_multi_resolution(
     sketch_class: type,
     sketch_name: str,
@@ -28,6 +168,11 @@ def export_multi_resolution(
 ) -> None:
     """Export a sketch at multiple resolutions.
 
+    a single sketch instance renders every resolution in turn, resizing its
+    window between renders, so the JVM and Processing start only once.
+    sketches that keep their size in canvas_width/canvas_height have those
+    updated, and setup runs again at each new size.
+
     Args:
         sketch_class: The sketch class to instantiate and render
         sketch_name: Base name for output files (e.g., "rotating_fractals")
@@ -37,38 +182,28 @@ def export_multi_resolution(
     """
     if resolutions is None:
         resolutions = ResolutionConfig.ALL_RESOLUTIONS
+    if not resolutions:
+        return
 
     # Create output directory
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
-    print(f"\n🎨 Rendering {sketch_name}...")
-
-    for res_name, (width, height) in resolutions.items():
-        print(f"  ├─ {res_name} ({width}x{height})...", end=" ", flush=True)
-
-        # Create sketch instance with specified resolution
-        sketch = sketch_class()
-        sketch.width = width
-        sketch.height = height
-
-        # Run sketch and save
-        output_file = output_path / f"{sketch_name}_{res_name}.png"
-
-        # Add save call to the draw method
-        original_draw = sketch.draw
+    # renders still to do, in order: (name, width, height, output file)
+    queue = deque(
+        (res_name, width, height, output_path / f"{sketch_name}_{res_name}.png")
+        for res_name, (width, height) in resolutions.items()
+    )
 
-        def draw_and_save() -> None:
-            """Wrapper to call original draw and save."""
-            original_draw()
-            py5.save(str(output_file))
-
-        sketch.draw = draw_and_save
-
-        # Run the sketch
-        py5.run_sketch(py5_object=sketch)
+    print(f"\n🎨 Rendering {sketch_name}...")
 
-        print("✓")
+    sketch_type = type(
+        f"MultiResolution{sketch_class.__name__}",
+        (MultiResolutionMixin, sketch_class),
+        {},
+    )
+    sketch = sketch_type(queue)
+    sketch.run_sketch(block=True)
 
     print(f"\n✨ All renders complete! Saved to: {output_path.absolute()}\n")
 
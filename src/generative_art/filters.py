@@ -0,0 +1,136 @@
+"""image filters for numpy pixel arrays.
+
+py5's apply_filter() runs processing's filters on the jvm in a single
+thread. these reproduce them over numpy arrays, such as a sketch's
+np_pixels, so they can run compiled and across cpu cores with numba.
+"""
+
+import math
+
+import numpy as np
+
+from generative_art._jit import NUMBA_AVAILABLE, njit, prange
+
+
+def blur_kernel(radius: float) -> np.ndarray:
+    """Build the 1D blur kernel processing uses for filter(BLUR, radius).
+
+    Args:
+        radius: blur radius as passed to apply_filter
+
+    Returns:
+        odd-length int64 array of integer tap weights, centered on the pixel
+    """
+    # processing widens the requested radius and weights taps quadratically
+    taps = min(max(int(radius * 3.5), 1), 248)
+    offsets = np.arange(-taps + 1, taps)
+    return (taps - np.abs(offsets)) ** 2
+
+
+def _tap_weights(length: int, kernel: np.ndarray) -> np.ndarray:
+    """Sum the weight of the kernel taps inside a line of pixels.
+
+    taps that fall outside the image are dropped, so pixels near the edges
+    are normalized by a smaller total.
+    """
+    half = kernel.shape[0] // 2
+    weight = np.zeros(length)
+    for k, tap in enumerate(kernel):
+        offset = k - half
+        weight[max(0, -offset) : min(length, length - offset)] += tap
+    return weight
+
+
+@njit(cache=True, parallel=True)
+def _blur_lines_jit(
+    lines: np.ndarray, kernel: np.ndarray, weight: np.ndarray, stride: int
+) -> np.ndarray:
+    """Blur along each row of a 2D array in a compiled, parallel loop.
+
+    elements `stride` apart are neighbors, so interleaved channels are
+    blurred separately while the inner loops stay contiguous.
+    """
+    rows, length = lines.shape
+    half = kernel.shape[0] // 2
+    out = np.empty_like(lines)
+    for row in prange(rows):
+        total = np.zeros(length)
+        for k in range(kernel.shape[0]):
+            offset = (k - half) * stride
+            tap = kernel[k]
+            for i in range(max(0, -offset), min(length, length - offset)):
+                total[i] += tap * lines[row, i + offset]
+        for i in range(length):
+            out[row, i] = math.floor(total[i] / weight[i // stride])
+    return out
+
+
+@njit(cache=True, parallel=True)
+def _blur_across_lines_jit(
+    lines: np.ndarray, kernel: np.ndarray, weight: np.ndarray
+) -> np.ndarray:
+    """Blur down the columns of a 2D array, one output row at a time."""
+    rows, length = lines.shape
+    half = kernel.shape[0] // 2
+    out = np.empty_like(lines)
+    for row in prange(rows):
+        total = np.zeros(length)
+        for k in range(max(0, half - row), min(kernel.shape[0], rows - row + half)):
+            tap = kernel[k]
+            source = row + k - half
+            for i in range(length):
+                total[i] += tap * lines[source, i]
+        for i in range(length):
+            out[row, i] = math.floor(total[i] / weight[row])
+    return out
+
+
+def _blur_axis_numpy(
+    image: np.ndarray, kernel: np.ndarray, weight: np.ndarray, axis: int
+) -> np.ndarray:
+    """Blur an (H, W, C) image along one axis with one slice per kernel tap."""
+    length = image.shape[axis]
+    half = kernel.shape[0] // 2
+    total = np.zeros(image.shape)
+    for k, tap in enumerate(kernel):
+        offset = k - half
+        lo = max(0, -offset)
+        hi = min(length, length - offset)
+        target = [slice(None)] * 3
+        source = [slice(None)] * 3
+        target[axis] = slice(lo, hi)
+        source[axis] = slice(lo + offset, hi + offset)
+        total[tuple(target)] += tap * image[tuple(source)]
+    shape = [1, 1, 1]
+    shape[axis] = length
+    return np.asarray(total // weight.reshape(shape), dtype=image.dtype)
+
+
+def blur(image: np.ndarray, radius: float = 1.0) -> np.ndarray:
+    """Blur an image the way processing's filter(BLUR, radius) does.
+
+    the kernel is applied along rows and then columns with integer
+    arithmetic, and taps falling outside the image are left out of the
+    weighting, so results match processing's pixels exactly.
+
+    Args:
+        image: (H, W, C) uint8 array of color channels to blur
+        radius: blur radius as passed to apply_filter
+
+    Returns:
+        blurred (H, W, C) uint8 array
+    """
+    kernel = blur_kernel(radius).astype(np.float64)
+    height, width, channels = image.shape
+    width_weight = _tap_weights(width, kernel)
+    height_weight = _tap_weights(height, kernel)
+
+    if not NUMBA_AVAILABLE:
+        rows_blurred = _blur_axis_numpy(image, kernel, width_weight, axis=1)
+        return _blur_axis_numpy(rows_blurred, kernel, height_weight, axis=0)
+
+    # blur interleaved rows first, then whole rows into each other
+    lines = np.ascontiguousarray(image).reshape(height, width * channels)
+    rows_blurred = _blur_lines_jit(lines, kernel, width_weight, channels)
+    blurred = _blur_across_lines_jit(rows_blurred, kernel, height_weight)
+    return blurred.reshape(image.shape)
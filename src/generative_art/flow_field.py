@@ -7,26 +7,42 @@ for both py5 visualization and maya grass animation. the core features are:
 - point clustering around obstacles
 """
 
-from dataclasses import dataclass
+import functools
+import math
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
 import numpy as np
+import numpy.typing as npt
 
-from generative_art.noise_utils import fbm_noise3
+from generative_art._jit import NUMBA_AVAILABLE, njit, prange
+from generative_art.noise_utils import fbm_noise3, fbm_noise3_array
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 # epsilon for floating point comparisons (distance from exact center)
 DISTANCE_EPSILON = 0.001
+# points per squared radius that bridson sampling packs into an open area
+BRIDSON_PACKING = 0.65
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Obstacle:
     """Defines an obstacle that flow should avoid.
 
+    obstacles are frozen, so they can be hashed and their squared radii are
+    computed once for the distance checks in hot loops. slots keep each one
+    small when there are many.
+
     Attributes:
         x: center x position
         y: center y position
         radius: obstacle radius
         influence_radius: how far the obstacle affects flow (default: 2x radius)
         strength: how strongly the obstacle deflects flow (0-1)
+        radius_sq: radius squared
+        influence_radius_sq: influence radius squared
     """
 
     x: float
@@ -34,17 +50,27 @@ class Obstacle:
     radius: float
     influence_radius: float | None = None
     strength: float = 1.0
+    radius_sq: float = field(init=False, repr=False, compare=False)
+    influence_radius_sq: float = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
-        """Set default influence radius if not provided."""
-        if self.influence_radius is None:
-            self.influence_radius = self.radius * 2.5
+        """Set default influence radius if not provided and cache the squares."""
+        influence_radius = self.influence_radius
+        if influence_radius is None:
+            influence_radius = self.radius * 2.5
+            object.__setattr__(self, "influence_radius", influence_radius)
+        object.__setattr__(self, "radius_sq", self.radius * self.radius)
+        object.__setattr__(
+            self, "influence_radius_sq", influence_radius * influence_radius
+        )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FlowFieldConfig:
     """Configuration for flow field generation.
 
+    configs are frozen; use dataclasses.replace to derive a changed one.
+
     Attributes:
         noise_scale: scale factor for perlin noise sampling
         flow_strength: magnitude of flow vectors
@@ -60,6 +86,224 @@ class FlowFieldConfig:
     time_scale: float = 0.01
 
 
+def _obstacles_near(fields: np.ndarray, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+    """Keep the obstacle columns whose reach box overlaps the points' bounds.
+
+    obstacles outside it neither deflect flow nor change density at any of
+    the points, so they are dropped before the per-point distance math.
+    """
+    reach = fields[5]
+    near = (
+        (fields[0] + reach >= xs.min())
+        & (fields[0] - reach <= xs.max())
+        & (fields[1] + reach >= ys.min())
+        & (fields[1] - reach <= ys.max())
+    )
+    return fields[:, near]
+
+
+class _ObstacleArrays:
+    """Structure-of-arrays copy of an obstacle list.
+
+    hot loops read obstacle fields from contiguous float arrays instead of
+    attributes on each dataclass. the arrays are rebuilt only when the list
+    differs from the one they were built from, so lists shared between
+    objects or edited directly stay in sync. obstacles themselves are
+    frozen, so they cannot change behind the arrays' back.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no obstacles."""
+        self._source: list[Obstacle] = []
+        self._fields = np.empty((6, 0))
+
+    def of(self, obstacles: list[Obstacle]) -> np.ndarray:
+        """Get the fields of the given obstacles.
+
+        Args:
+            obstacles: obstacles to convert
+
+        Returns:
+            (6, M) array with rows x, y, radius, influence_radius, strength
+            and reach, the larger of radius and influence_radius
+        """
+        if obstacles != self._source:
+            rows = []
+            for o in obstacles:
+                # __post_init__ always fills in the default influence radius
+                assert o.influence_radius is not None
+                reach = max(o.radius, o.influence_radius)
+                rows.append((o.x, o.y, o.radius, o.influence_radius, o.strength, reach))
+            self._fields = np.ascontiguousarray(
+                np.array(rows, dtype=np.float64).reshape(-1, 6).T
+            )
+            self._source = list(obstacles)
+        return self._fields
+
+
+@njit(cache=True)
+def _deflect(
+    to_point_x: float,
+    to_point_y: float,
+    radius: float,
+    influence_radius: float,
+    strength: float,
+    flow_strength: float,
+) -> tuple[float, float]:
+    """Deflection vector of one obstacle at an offset from its center."""
+    # squared distance from obstacle center, rooted only when it is needed
+    dist_sq = to_point_x * to_point_x + to_point_y * to_point_y
+
+    # if inside obstacle or at center, return strong outward push
+    if dist_sq < radius * radius:
+        dist = math.sqrt(dist_sq)
+        if dist < DISTANCE_EPSILON:
+            # at exact center, push in random direction
+            return (strength * flow_strength, 0.0)
+        # normalize and scale for strong outward push
+        scale = (strength * flow_strength * 2) / dist
+        return (to_point_x * scale, to_point_y * scale)
+
+    # check if within influence radius
+    if dist_sq > influence_radius * influence_radius:
+        return (0.0, 0.0)
+    dist = math.sqrt(dist_sq)
+
+    # calculate falloff (smooth from edge of obstacle to influence radius)
+    # 1.0 at obstacle edge, 0.0 at influence radius edge
+    influence_dist = influence_radius - radius
+    dist_from_obstacle = dist - radius
+    falloff = 1.0 - (dist_from_obstacle / influence_dist)
+    falloff = falloff**2  # quadratic falloff for smoother transition
+
+    # tangential deflection - perpendicular to radial direction
+    # this creates the "flow around" effect
+    norm_x = to_point_x / dist
+    norm_y = to_point_y / dist
+
+    # tangent is perpendicular (rotate 90 degrees)
+    # use consistent direction based on position to avoid discontinuities
+    tangent_x = -norm_y
+    tangent_y = norm_x
+
+    # determine which way to curve based on flow direction
+    # this ensures flow curves smoothly around the obstacle
+    deflection_strength = falloff * strength * flow_strength
+
+    return (tangent_x * deflection_strength, tangent_y * deflection_strength)
+
+
+@njit(cache=True)
+def _add_deflections(
+    vx: float, vy: float, x: float, y: float, fields: np.ndarray, flow_strength: float
+) -> tuple[float, float]:
+    """Add every obstacle's deflection at (x, y) to a flow vector, in order."""
+    for i in range(fields.shape[1]):
+        to_x = x - fields[0, i]
+        to_y = y - fields[1, i]
+        # outside the reach box the deflection is zero, skip it cheaply
+        if abs(to_x) > fields[5, i] or abs(to_y) > fields[5, i]:
+            continue
+        dx, dy = _deflect(
+            to_x, to_y, fields[2, i], fields[3, i], fields[4, i], flow_strength
+        )
+        vx += dx
+        vy += dy
+    return (vx, vy)
+
+
+@njit(cache=True, parallel=True)
+def _add_deflections_points(
+    vx: np.ndarray,
+    vy: np.ndarray,
+    xs: np.ndarray,
+    ys: np.ndarray,
+    fields: np.ndarray,
+    flow_strength: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Add every obstacle's deflection to flow vectors at many points."""
+    out_x = np.empty_like(vx)
+    out_y = np.empty_like(vy)
+    for i in prange(xs.shape[0]):
+        out_x[i], out_y[i] = _add_deflections(
+            vx[i], vy[i], xs[i], ys[i], fields, flow_strength
+        )
+    return (out_x, out_y)
+
+
+@njit(cache=True)
+def _bilinear(
+    vx: np.ndarray, vy: np.ndarray, gx: float, gy: float
+) -> tuple[float, float]:
+    """Interpolate two node grids at fractional grid coordinates (gx, gy)."""
+    col = min(int(gx), vx.shape[1] - 2)
+    row = min(int(gy), vx.shape[0] - 2)
+    fx = gx - col
+    fy = gy - row
+    w00 = (1.0 - fx) * (1.0 - fy)
+    w01 = fx * (1.0 - fy)
+    w10 = (1.0 - fx) * fy
+    w11 = fx * fy
+    return (
+        w00 * vx[row, col]
+        + w01 * vx[row, col + 1]
+        + w10 * vx[row + 1, col]
+        + w11 * vx[row + 1, col + 1],
+        w00 * vy[row, col]
+        + w01 * vy[row, col + 1]
+        + w10 * vy[row + 1, col]
+        + w11 * vy[row + 1, col + 1],
+    )
+
+
+@dataclass
+class _BakedFlow:
+    """Flow vectors sampled on a regular grid of nodes one tile apart.
+
+    Attributes:
+        vx: (rows, cols) float32 x components, node (r, c) sits at
+            (c * tile, r * tile)
+        vy: (rows, cols) float32 y components
+        tile: spacing between nodes
+        width: width of the covered canvas
+        height: height of the covered canvas
+        time: time offset the flow was sampled at
+        config: flow field config the flow was sampled with
+        obstacles: obstacle fields the flow was sampled with
+    """
+
+    vx: np.ndarray
+    vy: np.ndarray
+    tile: float
+    width: float
+    height: float
+    time: float
+    config: FlowFieldConfig
+    obstacles: np.ndarray
+
+    def sample(self, x: float, y: float) -> tuple[float, float]:
+        """Bilinearly interpolate the flow at one point on the canvas."""
+        return _bilinear(self.vx, self.vy, x / self.tile, y / self.tile)
+
+    def sample_array(
+        self, xs: np.ndarray, ys: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Bilinearly interpolate the flow at many points on the canvas."""
+        rows, cols = self.vx.shape
+        gx = xs / self.tile
+        gy = ys / self.tile
+        col = np.minimum(gx.astype(np.intp), cols - 2)
+        row = np.minimum(gy.astype(np.intp), rows - 2)
+        fx = gx - col
+        fy = gy - row
+        result = []
+        for grid in (self.vx, self.vy):
+            top = grid[row, col] * (1.0 - fx) + grid[row, col + 1] * fx
+            bottom = grid[row + 1, col] * (1.0 - fx) + grid[row + 1, col + 1] * fx
+            result.append(top * (1.0 - fy) + bottom * fy)
+        return (result[0], result[1])
+
+
 class FlowField:
     """Flow field generator with obstacle avoidance.
 
@@ -80,6 +324,10 @@ class FlowField:
         """
         self.config = config or FlowFieldConfig()
         self.obstacles = obstacles or []
+        self._obstacle_arrays = _ObstacleArrays()
+        self._baked: _BakedFlow | None = None
+        self._base_flow_cache: Callable[..., tuple[float, float]] | None = None
+        self._base_flow_cache_config: FlowFieldConfig | None = None
 
     def add_obstacle(self, obstacle: Obstacle) -> None:
         """Add an obstacle to the flow field.
@@ -93,6 +341,89 @@ class FlowField:
         """Remove all obstacles from the flow field."""
         self.obstacles.clear()
 
+    def precompute(
+        self, width: float, height: float, tile: float = 8.0, time: float = 0.0
+    ) -> None:
+        """Bake the flow over a canvas into a coarse grid for fast lookups.
+
+        the exact flow is sampled every `tile` pixels. afterwards get_flow
+        and get_flow_batch interpolate bilinearly between those samples for
+        points on the canvas at the baked time, instead of evaluating noise
+        and obstacles per point. the grid is small enough to stay in cache,
+        so lookups are much cheaper, at the cost of smoothing detail finer
+        than a tile. changing the obstacles or replacing the config drops
+        the baked grid.
+
+        Args:
+            width: canvas width to cover, from x = 0
+            height: canvas height to cover, from y = 0
+            tile: spacing between sampled nodes in pixels
+            time: time offset to sample the flow at
+
+        Raises:
+            ValueError: if the canvas is empty or tile is not positive
+        """
+        if width <= 0 or height <= 0 or tile <= 0:
+            msg = f"width, height and tile must be positive, got {width}, {height}, {tile}"
+            raise ValueError(msg)
+
+        self._baked = None
+        xs = np.arange(math.ceil(width / tile) + 1) * tile
+        ys = np.arange(math.ceil(height / tile) + 1) * tile
+        vx, vy = self.get_flow_batch(xs[np.newaxis, :], ys[:, np.newaxis], time)
+        self._baked = _BakedFlow(
+            vx=vx.astype(np.float32),
+            vy=vy.astype(np.float32),
+            tile=tile,
+            width=width,
+            height=height,
+            time=time,
+            config=self.config,
+            obstacles=self._obstacle_arrays.of(self.obstacles),
+        )
+
+    def cache_base_flow(self, maxsize: int = 65536) -> None:
+        """Memoize base flow samples on a quantized grid.
+
+        afterwards get_base_flow snaps positions to whole pixels and time to
+        hundredths, and nearby particles landing on the same key reuse one
+        noise evaluation from an lru cache. this trades exactness below a
+        pixel for skipping the noise entirely on repeated samples. replacing
+        the config drops the cache; call cache_base_flow again after
+        reseeding the noise.
+
+        Args:
+            maxsize: most samples to keep
+
+        Raises:
+            ValueError: if maxsize is not positive
+        """
+        if maxsize <= 0:
+            msg = f"maxsize must be positive, got {maxsize}"
+            raise ValueError(msg)
+
+        self._base_flow_cache = functools.lru_cache(maxsize=maxsize)(
+            self._quantized_base_flow
+        )
+        self._base_flow_cache_config = self.config
+
+    def _quantized_base_flow(self, ix: int, iy: int, it: int) -> tuple[float, float]:
+        """Sample the base flow at a whole pixel and a time in hundredths."""
+        return self._sample_base_flow(ix, iy, it / 100)
+
+    def _baked_for(self, time: float) -> _BakedFlow | None:
+        """Get the baked grid if it still matches this time, config and obstacles."""
+        baked = self._baked
+        if baked is None or time != baked.time:
+            return None
+        if (
+            self.config is not baked.config
+            or self._obstacle_arrays.of(self.obstacles) is not baked.obstacles
+        ):
+            self._baked = None
+            return None
+        return baked
+
     def get_base_flow(self, x: float, y: float, time: float = 0.0) -> tuple[float, float]:
         """Get the base perlin noise flow vector at a position.
 
@@ -104,6 +435,15 @@ class FlowField:
         Returns:
             tuple of (vx, vy) flow vector
         """
+        cache = self._base_flow_cache
+        if cache is not None:
+            if self.config is self._base_flow_cache_config:
+                return cache(round(x), round(y), round(time * 100))
+            self._base_flow_cache = None
+        return self._sample_base_flow(x, y, time)
+
+    def _sample_base_flow(self, x: float, y: float, time: float) -> tuple[float, float]:
+        """Evaluate the base flow noise at a position, without caching."""
         # sample 3d opensimplex noise (x, y, time)
         noise_val = fbm_noise3(
             x * self.config.noise_scale,
@@ -115,12 +455,38 @@ class FlowField:
         )
 
         # convert noise to angle
-        angle = noise_val * np.pi * 4  # maps noise range to full rotation range
+        angle = noise_val * math.pi * 4  # maps noise range to full rotation range
+
+        # calculate velocity from angle, math avoids numpy's per-scalar overhead
+        vx = math.cos(angle) * self.config.flow_strength
+        vy = math.sin(angle) * self.config.flow_strength
+
+        return (vx, vy)
+
+    def get_base_flow_array(
+        self, xs: npt.ArrayLike, ys: npt.ArrayLike, time: float = 0.0
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Get the base perlin noise flow vectors at many positions at once.
 
-        # calculate velocity from angle
+        Args:
+            xs: x positions
+            ys: y positions
+            time: time offset for animation
+
+        Returns:
+            tuple of (vx, vy) arrays with the broadcast shape of xs and ys
+        """
+        noise_val = fbm_noise3_array(
+            np.asarray(xs, dtype=np.float64) * self.config.noise_scale,
+            np.asarray(ys, dtype=np.float64) * self.config.noise_scale,
+            time * self.config.time_scale,
+            octaves=self.config.octaves,
+            persistence=self.config.persistence,
+            lacunarity=2.0,
+        )
+        angle = noise_val * np.pi * 4
         vx = np.cos(angle) * self.config.flow_strength
         vy = np.sin(angle) * self.config.flow_strength
-
         return (vx, vy)
 
     def get_obstacle_deflection(
@@ -139,48 +505,82 @@ class FlowField:
         Returns:
             tuple of (dx, dy) deflection vector
         """
+        influence_radius = obstacle.influence_radius
+        assert influence_radius is not None
+
         # vector from obstacle center to point
-        to_point_x = x - obstacle.x
-        to_point_y = y - obstacle.y
-
-        # distance from obstacle center
-        dist = np.sqrt(to_point_x**2 + to_point_y**2)
-
-        # if inside obstacle or at center, return strong outward push
-        if dist < obstacle.radius:
-            if dist < DISTANCE_EPSILON:
-                # at exact center, push in random direction
-                return (obstacle.strength * self.config.flow_strength, 0.0)
-            # normalize and scale for strong outward push
-            scale = (obstacle.strength * self.config.flow_strength * 2) / dist
-            return (to_point_x * scale, to_point_y * scale)
-
-        # check if within influence radius
-        if dist > obstacle.influence_radius:
-            return (0.0, 0.0)
-
-        # calculate falloff (smooth from edge of obstacle to influence radius)
-        # 1.0 at obstacle edge, 0.0 at influence radius edge
-        influence_dist = obstacle.influence_radius - obstacle.radius
-        dist_from_obstacle = dist - obstacle.radius
-        falloff = 1.0 - (dist_from_obstacle / influence_dist)
-        falloff = falloff**2  # quadratic falloff for smoother transition
-
-        # tangential deflection - perpendicular to radial direction
-        # this creates the "flow around" effect
-        norm_x = to_point_x / dist
-        norm_y = to_point_y / dist
-
-        # tangent is perpendicular (rotate 90 degrees)
-        # use consistent direction based on position to avoid discontinuities
-        tangent_x = -norm_y
-        tangent_y = norm_x
-
-        # determine which way to curve based on flow direction
-        # this ensures flow curves smoothly around the obstacle
-        deflection_strength = falloff * obstacle.strength * self.config.flow_strength
-
-        return (tangent_x * deflection_strength, tangent_y * deflection_strength)
+        return _deflect(
+            x - obstacle.x,
+            y - obstacle.y,
+            obstacle.radius,
+            influence_radius,
+            obstacle.strength,
+            self.config.flow_strength,
+        )
+
+    def get_obstacle_deflection_array(
+        self, xs: np.ndarray, ys: np.ndarray, obstacle: Obstacle
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Calculate the deflection vectors from a single obstacle at many points.
+
+        same rules as get_obstacle_deflection, with each branch applied as a
+        mask over the point arrays.
+
+        Args:
+            xs: x positions
+            ys: y positions
+            obstacle: the obstacle to deflect from
+
+        Returns:
+            tuple of (dx, dy) deflection arrays
+        """
+        influence_radius = obstacle.influence_radius
+        assert influence_radius is not None
+        return self._deflection_arrays(
+            xs - obstacle.x,
+            ys - obstacle.y,
+            obstacle.radius,
+            influence_radius,
+            obstacle.strength,
+        )
+
+    def _deflection_arrays(
+        self,
+        to_point_x: np.ndarray,
+        to_point_y: np.ndarray,
+        radius: float | np.ndarray,
+        influence_radius: float | np.ndarray,
+        strength: float | np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Deflection vectors from offsets to obstacle centers.
+
+        obstacle parameters broadcast against the offsets, so a trailing axis
+        of obstacles computes every obstacle's deflection in one pass.
+        """
+        dist = np.sqrt(to_point_x * to_point_x + to_point_y * to_point_y)
+        inside = dist < radius
+        influenced = ~inside & (dist <= influence_radius)
+
+        # unit vector away from the center, clamped so the center stays finite
+        inv_dist = 1.0 / np.maximum(dist, DISTANCE_EPSILON)
+        norm_x = to_point_x * inv_dist
+        norm_y = to_point_y * inv_dist
+
+        # outward push inside, quadratic falloff across the influence band
+        influence_dist = np.maximum(influence_radius - radius, DISTANCE_EPSILON)
+        falloff = (1.0 - (dist - radius) / influence_dist) ** 2
+        weight = np.where(inside, 2.0, np.where(influenced, falloff, 0.0))
+        weight *= strength * self.config.flow_strength
+
+        # radial inside the obstacle, tangential around it
+        dx = np.where(inside, norm_x, -norm_y) * weight
+        dy = np.where(inside, norm_y, norm_x) * weight
+
+        # at the exact center there is no direction, push along x
+        center = dist < DISTANCE_EPSILON
+        dx = np.where(center, strength * self.config.flow_strength, dx)
+        dy = np.where(center, 0.0, dy)
+        return (dx, dy)
 
     def get_flow(self, x: float, y: float, time: float = 0.0) -> tuple[float, float]:
         """Get the flow vector at a position, accounting for all obstacles.
@@ -193,26 +593,106 @@ class FlowField:
         Returns:
             tuple of (vx, vy) flow vector
         """
+        baked = self._baked_for(time)
+        if baked is not None and 0 <= x <= baked.width and 0 <= y <= baked.height:
+            return baked.sample(x, y)
+
         # start with base perlin noise flow
         vx, vy = self.get_base_flow(x, y, time)
 
         # add deflection from each obstacle
-        for obstacle in self.obstacles:
-            dx, dy = self.get_obstacle_deflection(x, y, obstacle)
-            vx += dx
-            vy += dy
-
-        # normalize if resulting vector is too strong
-        magnitude = np.sqrt(vx**2 + vy**2)
+        if NUMBA_AVAILABLE:
+            fields = self._obstacle_arrays.of(self.obstacles)
+            vx, vy = _add_deflections(vx, vy, x, y, fields, self.config.flow_strength)
+        else:
+            for obstacle in self.obstacles:
+                to_x = x - obstacle.x
+                to_y = y - obstacle.y
+                # the obstacle still pushes outward inside it, even when its
+                # influence radius is smaller than its radius
+                reach_sq = max(obstacle.radius_sq, obstacle.influence_radius_sq)
+                if to_x * to_x + to_y * to_y > reach_sq:
+                    continue
+                dx, dy = self.get_obstacle_deflection(x, y, obstacle)
+                vx += dx
+                vy += dy
+
+        # normalize if resulting vector is too strong, compared squared
+        magnitude_sq = vx * vx + vy * vy
         max_magnitude = self.config.flow_strength * 2
 
-        if magnitude > max_magnitude:
-            scale = max_magnitude / magnitude
+        if magnitude_sq > max_magnitude * max_magnitude:
+            scale = max_magnitude / math.sqrt(magnitude_sq)
             vx *= scale
             vy *= scale
 
         return (vx, vy)
 
+    def get_flow_batch(
+        self, xs: npt.ArrayLike, ys: npt.ArrayLike, time: float = 0.0
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Get the flow vectors at many positions at once.
+
+        equivalent to calling get_flow per point. the noise and obstacle
+        deflections are each added in a single compiled pass; without numba
+        the deflections are masked numpy arithmetic broadcast along a
+        trailing obstacle axis, so there is no per-point python loop.
+
+        Args:
+            xs: x positions
+            ys: y positions
+            time: time offset for animation
+
+        Returns:
+            tuple of (vx, vy) arrays with the broadcast shape of xs and ys
+        """
+        xs, ys = np.broadcast_arrays(
+            np.asarray(xs, dtype=np.float64), np.asarray(ys, dtype=np.float64)
+        )
+        baked = self._baked_for(time)
+        if (
+            baked is not None
+            and ((xs >= 0) & (xs <= baked.width)).all()
+            and ((ys >= 0) & (ys <= baked.height)).all()
+        ):
+            return baked.sample_array(xs, ys)
+
+        vx, vy = self.get_base_flow_array(xs, ys, time)
+
+        if self.obstacles and NUMBA_AVAILABLE:
+            # one compiled pass over the points, obstacles in order per point
+            vx, vy = _add_deflections_points(
+                vx.ravel(),
+                vy.ravel(),
+                xs.ravel(),
+                ys.ravel(),
+                self._obstacle_arrays.of(self.obstacles),
+                self.config.flow_strength,
+            )
+            vx = vx.reshape(xs.shape)
+            vy = vy.reshape(xs.shape)
+        elif self.obstacles and xs.size:
+            ox, oy, radius, influence_radius, strength, _ = _obstacles_near(
+                self._obstacle_arrays.of(self.obstacles), xs, ys
+            )
+            dx, dy = self._deflection_arrays(
+                xs[..., np.newaxis] - ox,
+                ys[..., np.newaxis] - oy,
+                radius,
+                influence_radius,
+                strength,
+            )
+            vx = vx + dx.sum(axis=-1)
+            vy = vy + dy.sum(axis=-1)
+
+        # normalize vectors that ended up too strong, rooting only those
+        magnitude_sq = vx * vx + vy * vy
+        max_magnitude = self.config.flow_strength * 2
+        too_strong = magnitude_sq > max_magnitude * max_magnitude
+        scale = np.ones_like(magnitude_sq)
+        scale[too_strong] = max_magnitude / np.sqrt(magnitude_sq[too_strong])
+        return (vx * scale, vy * scale)
+
     def get_flow_angle(self, x: float, y: float, time: float = 0.0) -> float:
         """Get the flow angle at a position in radians.
 
@@ -227,11 +707,123 @@ class FlowField:
         vx, vy = self.get_flow(x, y, time)
         return np.arctan2(vy, vx)
 
+    def get_flow_angle_array(
+        self, xs: npt.ArrayLike, ys: npt.ArrayLike, time: float = 0.0
+    ) -> np.ndarray:
+        """Get the flow angles at many positions at once, in radians.
 
-@dataclass
+        equivalent to calling get_flow_angle per point, see get_flow_batch.
+
+        Args:
+            xs: x positions
+            ys: y positions
+            time: time offset for animation
+
+        Returns:
+            array of angles in radians with the broadcast shape of xs and ys
+        """
+        vx, vy = self.get_flow_batch(xs, ys, time)
+        return np.asarray(np.arctan2(vy, vx))
+
+
+@njit(cache=True)
+def _min_sqdist(xs: np.ndarray, ys: np.ndarray, x: float, y: float) -> float:
+    """Return the smallest squared distance from (x, y) to any of the points."""
+    nearest = np.inf
+    for i in range(xs.shape[0]):
+        dx = xs[i] - x
+        dy = ys[i] - y
+        nearest = min(nearest, dx * dx + dy * dy)
+    return nearest
+
+
+@njit(cache=True)
+def _grid_has_neighbor(
+    grid: np.ndarray, points: np.ndarray, x: float, y: float, cell: float
+) -> bool:
+    """Check a 5x5 cell window for a stored point closer than two cells.
+
+    the grid holds at most one point index per cell (-1 when empty), with
+    cells half the minimum distance wide, so the window covers every point
+    that could be within that distance of (x, y).
+    """
+    rows, cols = grid.shape
+    row = int(y / cell)
+    col = int(x / cell)
+    min_sq = (2 * cell) ** 2
+    for r in range(max(row - 2, 0), min(row + 3, rows)):
+        for c in range(max(col - 2, 0), min(col + 3, cols)):
+            i = grid[r, c]
+            if i >= 0:
+                dx = points[i, 0] - x
+                dy = points[i, 1] - y
+                if dx * dx + dy * dy < min_sq:
+                    return True
+    return False
+
+
+@njit(cache=True)
+def _density_boost(
+    dist: float,
+    radius: float,
+    influence_radius: float,
+    edge_offset: float,
+    cluster_falloff: float,
+    multiplier: float,
+) -> float:
+    """Density one obstacle adds at a distance from its center outside it."""
+    # distance from obstacle edge
+    edge_dist = dist - radius
+
+    # peak density at edge_offset distance from edge
+    influence_range = influence_radius - radius
+    if edge_dist >= influence_range:
+        return 0.0
+
+    # gaussian-like density around the edge
+    dist_from_peak = abs(edge_dist - edge_offset)
+    sigma = influence_range * cluster_falloff
+    boost = math.exp(-(dist_from_peak**2) / (2 * sigma**2))
+    return boost * (multiplier - 1)
+
+
+@njit(cache=True)
+def _density_at(
+    x: float,
+    y: float,
+    fields: np.ndarray,
+    edge_offset: float,
+    cluster_falloff: float,
+    multiplier: float,
+) -> float:
+    """Point density at (x, y) from obstacle fields, 0.0 inside any obstacle."""
+    density = 1.0
+    for i in range(fields.shape[1]):
+        dx = x - fields[0, i]
+        dy = y - fields[1, i]
+        dist_sq = dx * dx + dy * dy
+        radius = fields[2, i]
+        influence_radius = fields[3, i]
+        if dist_sq < radius * radius:
+            return 0.0
+        if dist_sq < influence_radius * influence_radius:
+            density += _density_boost(
+                math.sqrt(dist_sq),
+                radius,
+                influence_radius,
+                edge_offset,
+                cluster_falloff,
+                multiplier,
+            )
+    return density
+
+
+@dataclass(frozen=True, slots=True)
 class ClusteringConfig:
     """Configuration for point clustering around obstacles.
 
+    configs are frozen; use dataclasses.replace to derive a changed one.
+
     Attributes:
         base_density: base point density (points per unit area)
         obstacle_density_multiplier: how much denser points are near obstacles
@@ -275,6 +867,7 @@ class PointClusterer:
         self.height = height
         self.config = config or ClusteringConfig()
         self.obstacles = obstacles or []
+        self._obstacle_arrays = _ObstacleArrays()
         self.rng = np.random.default_rng(seed)
 
     def add_obstacle(self, obstacle: Obstacle) -> None:
@@ -297,86 +890,159 @@ class PointClusterer:
         Returns:
             relative density value (1.0 = base density)
         """
+        if NUMBA_AVAILABLE:
+            return _density_at(
+                x,
+                y,
+                self._obstacle_arrays.of(self.obstacles),
+                self.config.edge_offset,
+                self.config.cluster_falloff,
+                self.config.obstacle_density_multiplier,
+            )
+
         density = 1.0
 
         for obstacle in self.obstacles:
             # distance from obstacle center
             dx = x - obstacle.x
             dy = y - obstacle.y
-            dist = np.sqrt(dx**2 + dy**2)
+            dist_sq = dx * dx + dy * dy
 
             # skip if inside obstacle
-            if dist < obstacle.radius:
+            if dist_sq < obstacle.radius_sq:
                 return 0.0  # no points inside obstacles
 
-            # distance from obstacle edge
-            edge_dist = dist - obstacle.radius
-
-            # peak density at edge_offset distance from edge
-            peak_dist = self.config.edge_offset
-            influence_range = obstacle.influence_radius - obstacle.radius
-
-            if edge_dist < influence_range:
-                # gaussian-like density around the edge
-                dist_from_peak = abs(edge_dist - peak_dist)
-                sigma = influence_range * self.config.cluster_falloff
-                boost = np.exp(-(dist_from_peak**2) / (2 * sigma**2))
-                density += boost * (self.config.obstacle_density_multiplier - 1)
+            influence_radius = obstacle.influence_radius
+            assert influence_radius is not None
+            density += _density_boost(
+                math.sqrt(dist_sq),
+                obstacle.radius,
+                influence_radius,
+                self.config.edge_offset,
+                self.config.cluster_falloff,
+                self.config.obstacle_density_multiplier,
+            )
 
         return density
 
-    def is_valid_point(
-        self, x: float, y: float, existing_points: list[tuple[float, float]]
-    ) -> bool:
-        """Check if a point is valid (not inside obstacle, not too close to others).
+    def get_density_array(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Calculate point density at many positions at once.
+
+        same rules as get_density_at, with every obstacle broadcast along a
+        trailing obstacle axis of the point arrays.
 
         Args:
-            x: x position
-            y: y position
-            existing_points: list of already placed points
+            xs: x positions
+            ys: y positions
 
         Returns:
-            true if point is valid
+            relative density values (1.0 = base density, 0.0 inside obstacles)
         """
+        xs, ys = np.broadcast_arrays(
+            np.asarray(xs, dtype=np.float64), np.asarray(ys, dtype=np.float64)
+        )
+        fields = self._obstacle_arrays.of(self.obstacles)
+        if xs.size:
+            fields = _obstacles_near(fields, xs, ys)
+        ox, oy, radius, influence_radius, _, _ = fields
+        xs = xs[..., np.newaxis]
+        ys = ys[..., np.newaxis]
+        dist = np.sqrt((xs - ox) ** 2 + (ys - oy) ** 2)
+        inside = (dist < radius).any(axis=-1)
+
+        # gaussian-like density around the edge
+        edge_dist = dist - radius
+        influence_range = influence_radius - radius
+        dist_from_peak = np.abs(edge_dist - self.config.edge_offset)
+        sigma = influence_range * self.config.cluster_falloff
+        boost = np.exp(-(dist_from_peak**2) / (2 * sigma**2))
+        density = 1.0 + np.where(
+            edge_dist < influence_range,
+            boost * (self.config.obstacle_density_multiplier - 1),
+            0.0,
+        ).sum(axis=-1)
+
+        return np.where(inside, 0.0, density)
+
+    def _in_open_space(self, x: float, y: float) -> bool:
+        """Check that a point is inside the field and outside every obstacle."""
         # check boundaries
         if x < 0 or x > self.width or y < 0 or y > self.height:
             return False
 
-        # check obstacle collision
+        # check obstacle collision, compared squared
         for obstacle in self.obstacles:
             dx = x - obstacle.x
             dy = y - obstacle.y
-            dist = np.sqrt(dx**2 + dy**2)
-            if dist < obstacle.radius:
-                return False
-
-        # check minimum distance from existing points
-        for px, py in existing_points:
-            dx = x - px
-            dy = y - py
-            dist = np.sqrt(dx**2 + dy**2)
-            if dist < self.config.min_distance:
+            if dx * dx + dy * dy < obstacle.radius_sq:
                 return False
 
         return True
 
+    def _outside_obstacles(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Mask the points that lie outside every obstacle, compared squared."""
+        ox, oy, radius, _, _, _ = self._obstacle_arrays.of(self.obstacles)
+        dx = xs[..., np.newaxis] - ox
+        dy = ys[..., np.newaxis] - oy
+        return np.all(dx * dx + dy * dy >= radius * radius, axis=-1)
+
+    def is_valid_point(
+        self,
+        x: float,
+        y: float,
+        existing_points: list[tuple[float, float]] | np.ndarray,
+    ) -> bool:
+        """Check if a point is valid (not inside obstacle, not too close to others).
+
+        Args:
+            x: x position
+            y: y position
+            existing_points: already placed points, as (x, y) tuples or an
+                (N, 2) array
+
+        Returns:
+            true if point is valid
+        """
+        if not self._in_open_space(x, y):
+            return False
+
+        # check minimum distance from existing points, compared squared
+        existing = np.asarray(existing_points, dtype=np.float64).reshape(-1, 2)
+        nearest = _min_sqdist(existing[:, 0], existing[:, 1], x, y)
+        return bool(nearest >= self.config.min_distance**2)
+
     def generate_points(self, num_points: int) -> list[tuple[float, float]]:
         """Generate clustered points using rejection sampling.
 
+        rejection slows down as the canvas fills, since most candidates land
+        too close to an accepted point. for dense fills, use
+        generate_points_bridson, which enforces spacing by construction.
+
         Args:
             num_points: target number of points to generate
 
         Returns:
             list of (x, y) point positions
         """
-        points: list[tuple[float, float]] = []
+        # accepted points fill a preallocated array and are indexed by a grid
+        # of half min_distance cells, so the spacing check only looks at the
+        # few cells around a candidate instead of every accepted point
+        points = np.empty((num_points, 2))
+        count = 0
+        cell = self.config.min_distance / 2
+        if cell > 0:
+            grid = np.full(
+                (int(self.height / cell) + 1, int(self.width / cell) + 1),
+                -1,
+                dtype=np.int32,
+            )
         max_attempts = num_points * 100  # limit total attempts
         attempts = 0
 
         # calculate max density for acceptance ratio
         max_density = 1.0 + (self.config.obstacle_density_multiplier - 1)
 
-        while len(points) < num_points and attempts < max_attempts:
+        while count < num_points and attempts < max_attempts:
             attempts += 1
 
             # generate random candidate
@@ -391,10 +1057,121 @@ class PointClusterer:
                 continue
 
             # check validity
-            if self.is_valid_point(x, y, points):
-                points.append((x, y))
+            if not self._in_open_space(x, y):
+                continue
+            if cell > 0:
+                if _grid_has_neighbor(grid, points, x, y, cell):
+                    continue
+                grid[int(y / cell), int(x / cell)] = count
+            points[count] = (x, y)
+            count += 1
 
-        return points
+        return [(x, y) for x, y in points[:count].tolist()]
+
+    def generate_points_bridson(
+        self, num_points: int, k: int = 30
+    ) -> list[tuple[float, float]]:
+        """Generate clustered points with bridson's poisson disk sampling.
+
+        each point keeps the others out of a radius that shrinks with the
+        local density, so points pack closer near obstacles. candidates are
+        drawn in an annulus around an active point and only checked against
+        their neighbors in a background grid, so the cost grows linearly with
+        the number of points. the base radius is sized so that filling the
+        whole canvas yields about num_points, and is never smaller than
+        min_distance.
+
+        Args:
+            num_points: target number of points to generate
+            k: candidates tried around an active point before retiring it
+
+        Returns:
+            list of (x, y) point positions
+        """
+        if num_points <= 0:
+            return []
+
+        max_density = self.config.obstacle_density_multiplier
+        probe_x, probe_y = np.meshgrid(
+            np.linspace(0, self.width, 64), np.linspace(0, self.height, 64)
+        )
+        mean_density = self.get_density_array(probe_x, probe_y).mean()
+        area = self.width * self.height
+        base_radius = max(
+            self.config.min_distance,
+            math.sqrt(BRIDSON_PACKING * area * mean_density / num_points),
+        )
+        min_radius = max(self.config.min_distance, base_radius / math.sqrt(max_density))
+
+        # at most one point fits in a cell, neighbors lie within `reach` cells
+        cell = min_radius / math.sqrt(2)
+        cols = int(self.width / cell) + 1
+        rows = int(self.height / cell) + 1
+        grid = np.full(rows * cols, -1, dtype=np.int32)
+        window = math.ceil(base_radius / cell)
+        reach = np.arange(-window, window + 1)
+
+        # zeroed so lookups of empty cells (index -1) read finite coordinates
+        points = np.zeros((num_points, 2))
+        radii = np.empty(num_points)
+        count = 0
+        active: list[int] = []
+
+        def radius_at(density: np.ndarray) -> np.ndarray:
+            return np.clip(base_radius / np.sqrt(density), min_radius, base_radius)
+
+        def insert(x: float, y: float, density: float) -> None:
+            nonlocal count
+            points[count] = (x, y)
+            radii[count] = radius_at(np.asarray(density))
+            grid[int(y / cell) * cols + int(x / cell)] = count
+            active.append(count)
+            count += 1
+
+        # seed with the first random position outside every obstacle
+        for _ in range(100):
+            x = self.rng.uniform(0, self.width)
+            y = self.rng.uniform(0, self.height)
+            density = self.get_density_at(x, y)
+            if density > 0:
+                insert(x, y, density)
+                break
+
+        while active and count < num_points:
+            slot = int(self.rng.integers(len(active)))
+            parent = active[slot]
+
+            # k candidates in the annulus between one and two parent radii
+            angle = self.rng.uniform(0, 2 * np.pi, k)
+            dist = self.rng.uniform(1, 2, k) * radii[parent]
+            cx = points[parent, 0] + np.cos(angle) * dist
+            cy = points[parent, 1] + np.sin(angle) * dist
+            in_bounds = (cx >= 0) & (cx < self.width) & (cy >= 0) & (cy < self.height)
+            candidate_density = self.get_density_array(cx, cy)
+            valid = in_bounds & (candidate_density > 0)
+            radius = radius_at(np.where(valid, candidate_density, 1.0))
+
+            # look up the existing points in the grid cells around each candidate
+            row = np.clip((cy / cell).astype(np.intp), 0, rows - 1)
+            col = np.clip((cx / cell).astype(np.intp), 0, cols - 1)
+            near_row = np.clip(row[:, None, None] + reach[None, :, None], 0, rows - 1)
+            near_col = np.clip(col[:, None, None] + reach[None, None, :], 0, cols - 1)
+            near = grid[near_row * cols + near_col].reshape(k, -1)
+            near_x = points[near, 0]
+            near_y = points[near, 1]
+            sqdist = (near_x - cx[:, None]) ** 2 + (near_y - cy[:, None]) ** 2
+            clash = ((near >= 0) & (sqdist < radius[:, None] ** 2)).any(axis=1)
+            valid &= ~clash
+
+            if valid.any():
+                i = int(np.argmax(valid))
+                insert(cx[i], cy[i], candidate_density[i])
+            else:
+                # nothing fits around this point any more, retire it
+                active[slot] = active[-1]
+                active.pop()
+
+        return [(x, y) for x, y in points[:count].tolist()]
 
     def generate_points_grid_based(
         self, num_points: int
@@ -419,64 +1196,58 @@ class PointClusterer:
         cell_width = self.width / grid_cols
         cell_height = self.height / grid_rows
 
-        points: list[tuple[float, float]] = []
-
-        # phase 1: generate jittered grid points for even base distribution
-        for row in range(grid_rows):
-            for col in range(grid_cols):
-                # center of cell
-                cx = (col + 0.5) * cell_width
-                cy = (row + 0.5) * cell_height
-
-                # add random jitter (up to 40% of cell size)
-                jitter_x = self.rng.uniform(-0.4, 0.4) * cell_width
-                jitter_y = self.rng.uniform(-0.4, 0.4) * cell_height
+        # phase 1: generate jittered grid points for even base distribution.
+        # the jitter for every cell is drawn in one call, which yields the same
+        # values as drawing x then y cell by cell in row-major order
+        rows, cols = np.mgrid[0:grid_rows, 0:grid_cols]
+        jitter = self.rng.uniform(-0.4, 0.4, (grid_rows, grid_cols, 2))
 
-                px = cx + jitter_x
-                py = cy + jitter_y
+        # center of cell plus up to 40% of cell size, clamped to bounds
+        px = (cols + 0.5) * cell_width + jitter[..., 0] * cell_width
+        py = (rows + 0.5) * cell_height + jitter[..., 1] * cell_height
+        px = np.maximum(0, np.minimum(self.width - 1, px)).ravel()
+        py = np.maximum(0, np.minimum(self.height - 1, py)).ravel()
 
-                # clamp to bounds
-                px = max(0, min(self.width - 1, px))
-                py = max(0, min(self.height - 1, py))
-
-                # check not inside obstacle
-                if self.get_density_at(px, py) > 0:
-                    points.append((px, py))
+        # keep points not inside an obstacle
+        keep = self._outside_obstacles(px, py)
+        points = list(zip(px[keep].tolist(), py[keep].tolist(), strict=True))
 
         # phase 2: add extra points clustered around obstacle edges
         if self.obstacles:
             # calculate how many extra points to add based on multiplier
             extra_ratio = self.config.obstacle_density_multiplier - 1.0
-            extra_points_per_obstacle = int(
-                (num_points * extra_ratio) / (len(self.obstacles) * 3)
+            extra_points_per_obstacle = max(
+                0, int((num_points * extra_ratio) / (len(self.obstacles) * 3))
             )
 
             for obstacle in self.obstacles:
+                influence_radius = obstacle.influence_radius
+                assert influence_radius is not None
+
                 # add points in rings around the obstacle edge
                 inner_radius = obstacle.radius + self.config.edge_offset * 0.5
-                outer_radius = obstacle.radius + obstacle.influence_radius * 0.4
-
-                for _ in range(extra_points_per_obstacle):
-                    # random angle
-                    angle = self.rng.uniform(0, 2 * np.pi)
-
-                    # random radius with bias toward edge_offset distance
-                    # use gaussian-ish distribution centered on edge_offset
-                    target_dist = obstacle.radius + self.config.edge_offset
-                    spread = (outer_radius - inner_radius) * 0.5
-                    dist = self.rng.normal(target_dist, spread)
-                    dist = max(inner_radius, min(outer_radius, dist))
-
-                    px = obstacle.x + np.cos(angle) * dist
-                    py = obstacle.y + np.sin(angle) * dist
-
-                    # check bounds
-                    if px < 0 or px >= self.width or py < 0 or py >= self.height:
-                        continue
-
-                    # check not inside any obstacle
-                    if self.get_density_at(px, py) > 0:
-                        points.append((px, py))
+                outer_radius = obstacle.radius + influence_radius * 0.4
+
+                # random radius with bias toward edge_offset distance
+                # use gaussian-ish distribution centered on edge_offset
+                target_dist = obstacle.radius + self.config.edge_offset
+                spread = (outer_radius - inner_radius) * 0.5
+
+                # angle and radius draws alternate, so they stay one at a time
+                angle = np.empty(extra_points_per_obstacle)
+                dist = np.empty(extra_points_per_obstacle)
+                for i in range(extra_points_per_obstacle):
+                    angle[i] = self.rng.uniform(0, 2 * np.pi)
+                    dist[i] = self.rng.normal(target_dist, spread)
+                dist = np.maximum(inner_radius, np.minimum(outer_radius, dist))
+
+                px = obstacle.x + np.cos(angle) * dist
+                py = obstacle.y + np.sin(angle) * dist
+
+                # check bounds and not inside any obstacle
+                keep = (px >= 0) & (px < self.width) & (py >= 0) & (py < self.height)
+                keep &= self._outside_obstacles(px, py)
+                points.extend(zip(px[keep].tolist(), py[keep].tolist(), strict=True))
 
         return points
 
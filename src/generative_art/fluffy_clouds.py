@@ -11,10 +11,36 @@ This sketch demonstrates:
 from pathlib import Path
 
 import click
+import numpy as np
 import py5
-from noise import pnoise2
 from py5 import Sketch
 
+from generative_art.export import parse_resolution
+from generative_art.perlin import pnoise2
+
+
+def upsample_bilinear(
+    coarse: np.ndarray, row_pos: np.ndarray, col_pos: np.ndarray
+) -> np.ndarray:
+    """Bilinearly interpolate a coarse grid at fractional lattice positions.
+
+    Args:
+        coarse: 2D array of values sampled on an integer lattice
+        row_pos: fractional row position of each output row
+        col_pos: fractional column position of each output column
+
+    Returns:
+        array of shape (len(row_pos), len(col_pos))
+    """
+    r0 = np.clip(np.floor(row_pos).astype(int), 0, coarse.shape[0] - 2)
+    c0 = np.clip(np.floor(col_pos).astype(int), 0, coarse.shape[1] - 2)
+    fr = (row_pos - r0)[:, np.newaxis]
+    fc = col_pos - c0
+
+    # interpolate between coarse rows first, then between coarse columns
+    rows = coarse[r0] * (1.0 - fr) + coarse[r0 + 1] * fr
+    return np.asarray(rows[:, c0] * (1.0 - fc) + rows[:, c0 + 1] * fc)
+
 
 class FluffyClouds(Sketch):
     """Generate soft, fluffy clouds using layered Perlin noise."""
@@ -43,10 +69,25 @@ class FluffyClouds(Sketch):
         # domain warping for organic distortion
         self.warp_strength = 40.0
         self.warp_scale = 0.001
+        self.warp_tile = 8  # samples per warp field cell, the field is smooth
 
         # cloud density thresholds
         self.cloud_threshold = 0.3  # values above this are clouds
         self.cloud_softness = 0.2  # gradient falloff range
+        self.min_visible_alpha = 5  # cells at or below this alpha are skipped
+
+        # soft sky blue background
+        self.sky_color = (173, 216, 230)
+
+        # sample at lower resolution for performance, then upscale with blur
+        self.sample_step = 2  # sample every 2nd pixel
+        self.sample_xs: np.ndarray = np.empty((0, 0))
+        self.sample_ys: np.ndarray = np.empty((0, 0))
+        self.sample_warp: tuple[np.ndarray, np.ndarray] | None = None
+
+        # integer color lookup tables, filled in setup
+        self.gradient_lut: np.ndarray = np.empty((0, 3), dtype=np.uint32)
+        self.brightness_lut: np.ndarray = np.empty(0, dtype=np.uint32)
 
     def settings(self) -> None:
         """Configure the sketch size and renderer."""
@@ -54,31 +95,22 @@ class FluffyClouds(Sketch):
 
     def setup(self) -> None:
         """Set up the drawing environment."""
-        # soft sky blue background
-        self.background(173, 216, 230)
+        self.background(*self.sky_color)
         self.no_loop()
         self.no_stroke()
 
+        # pixel coordinates of every sample, evaluated as one array per frame
+        self.sample_xs, self.sample_ys = np.meshgrid(
+            np.arange(0, self.canvas_width, self.sample_step, dtype=np.float64),
+            np.arange(0, self.canvas_height, self.sample_step, dtype=np.float64),
+        )
+        self.sample_warp = self.tiled_warp_field(self.sample_xs.shape)
+        self.gradient_lut, self.brightness_lut = self.build_color_luts()
+
     def draw(self) -> None:
         """Main drawing function."""
-        # draw clouds using rectangles (safer than pixel manipulation in py5)
-        self.no_stroke()
-
-        # sample at lower resolution for performance, then upscale with blur
-        sample_step = 2  # sample every 2nd pixel
-
-        for y in range(0, self.canvas_height, sample_step):
-            for x in range(0, self.canvas_width, sample_step):
-                # calculate cloud density at this position
-                cloud_value = self.fbm_noise(x, y)
-
-                # map cloud value to color
-                r, g, b, a = self.cloud_color(cloud_value, x, y)
-
-                # only draw if there's some opacity
-                if a > 5:
-                    self.fill(r, g, b, a)
-                    self.rect(x, y, sample_step, sample_step)
+        # write the whole frame in one pixel update instead of per-cell rects
+        self.set_np_pixels(self.render_frame(), bands="RGB")
 
         # apply multiple blur passes for soft, dreamy look
         self.apply_filter(self.BLUR, 3)
@@ -90,19 +122,54 @@ class FluffyClouds(Sketch):
             print(f"    Saved: {self.output_path}")
             self.exit_sketch()
 
-    def fbm_noise(self, x: float, y: float) -> float:
-        """Calculate fractional Brownian motion noise at position.
+    def render_frame(self) -> np.ndarray:
+        """Render the clouds composited over the sky as a full-size image.
+
+        Returns:
+            uint8 array of shape (canvas_height, canvas_width, 3) in RGB order
+        """
+        # calculate cloud density for the whole sample grid at once, skipping
+        # cells that cannot reach the cloud threshold
+        cloud_values = self.fbm_noise(
+            self.sample_xs,
+            self.sample_ys,
+            cutoff=self.cloud_threshold,
+            warp=self.sample_warp,
+        )
+
+        # color and alpha-blend only the cloud cells over the sky
+        cells = np.empty((*cloud_values.shape, 3), dtype=np.uint8)
+        cells[...] = self.sky_color
+        cloudy = cloud_values >= self.cloud_threshold
+        colors = self.cloud_color(
+            cloud_values[cloudy], self.sample_xs[cloudy], self.sample_ys[cloudy]
+        )
+
+        # leave near-transparent cells untouched
+        alpha = colors[:, 3:].astype(np.float64)
+        alpha[alpha <= self.min_visible_alpha] = 0.0
+        alpha /= 255.0
+        sky = np.array(self.sky_color, dtype=np.float64)
+        blended = colors[:, :3] * alpha + sky * (1.0 - alpha)
+        cells[cloudy] = np.rint(blended).astype(np.uint8)
 
-        Uses domain warping for organic cloud distortion.
+        # upscale each sample to a sample_step x sample_step block
+        step = self.sample_step
+        frame = np.repeat(np.repeat(cells, step, axis=0), step, axis=1)
+        return frame[: self.canvas_height, : self.canvas_width]
+
+    def warp_offsets(
+        self, x: np.ndarray, y: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Calculate the domain warp noise at positions.
 
         Args:
-            x: X coordinate in pixels
-            y: Y coordinate in pixels
+            x: X coordinates in pixels
+            y: Y coordinates in pixels
 
         Returns:
-            Noise value in range [0, 1]
+            Tuple of (warp_x, warp_y) noise values in range [-1, 1]
         """
-        # domain warping - use noise to distort sampling positions
         warp_x = pnoise2(
             x * self.warp_scale,
             y * self.warp_scale,
@@ -113,129 +180,174 @@ class FluffyClouds(Sketch):
             y * self.warp_scale + 100,
             octaves=2,
         )
+        return warp_x, warp_y
+
+    def tiled_warp_field(self, shape: tuple[int, ...]) -> tuple[np.ndarray, np.ndarray]:
+        """Calculate the domain warp for the sample grid from a coarse grid.
+
+        the warp field varies over hundreds of pixels, so it is evaluated once
+        every warp_tile samples and bilinearly upsampled to the full grid.
+
+        Args:
+            shape: (rows, cols) shape of the sample grid
+
+        Returns:
+            Tuple of (warp_x, warp_y) arrays with the given shape
+        """
+        rows, cols = shape
+        tile = self.warp_tile
+
+        # coarse lattice covering the whole sample grid, in pixel coordinates
+        coarse_rows = np.arange((rows - 1) // tile + 2) * tile
+        coarse_cols = np.arange((cols - 1) // tile + 2) * tile
+        coarse_x, coarse_y = np.meshgrid(
+            coarse_cols * float(self.sample_step),
+            coarse_rows * float(self.sample_step),
+        )
+        coarse_warp_x, coarse_warp_y = self.warp_offsets(coarse_x, coarse_y)
+
+        # fractional coarse lattice position of every sample row and column
+        row_pos = np.arange(rows) / tile
+        col_pos = np.arange(cols) / tile
+        return (
+            upsample_bilinear(coarse_warp_x, row_pos, col_pos),
+            upsample_bilinear(coarse_warp_y, row_pos, col_pos),
+        )
+
+    def fbm_noise(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        cutoff: float | None = None,
+        warp: tuple[np.ndarray, np.ndarray] | None = None,
+    ) -> np.ndarray:
+        """Calculate fractional Brownian motion noise at positions.
+
+        Uses domain warping for organic cloud distortion. each octave is a
+        single vectorized pass over all positions.
+
+        Args:
+            x: X coordinates in pixels
+            y: Y coordinates in pixels
+            cutoff: If provided, positions whose value is certain to end up
+                below cutoff stop being evaluated and are returned as 0.0
+            warp: Precomputed (warp_x, warp_y) for these positions, computed
+                with warp_offsets when not provided
+
+        Returns:
+            Noise values in range [0, 1] with the shape of x and y
+        """
+        # domain warping - use noise to distort sampling positions
+        warp_x, warp_y = warp if warp is not None else self.warp_offsets(x, y)
 
         # apply warp distortion
         warped_x = x + warp_x * self.warp_strength
         warped_y = y + warp_y * self.warp_strength
 
         # calculate fBm with multiple octaves
-        total = 0.0
+        max_value = sum(self.persistence**octave for octave in range(self.octaves))
+        shape = np.shape(warped_x)
         amplitude = 1.0
         frequency = 1.0
-        max_value = 0.0  # for normalization
+        remaining = max_value  # most the unsampled octaves can still add
+        floor = None if cutoff is None else (2 * cutoff - 1) * max_value
+
+        # flat indices of positions still being evaluated
+        flat_x = np.ravel(warped_x)
+        flat_y = np.ravel(warped_y)
+        flat_total = np.zeros(flat_x.size)
+        active = np.arange(flat_x.size)
 
         for _ in range(self.octaves):
             # sample noise at current frequency
             noise_val = pnoise2(
-                warped_x * self.noise_scale * frequency,
-                warped_y * self.noise_scale * frequency,
+                flat_x[active] * self.noise_scale * frequency,
+                flat_y[active] * self.noise_scale * frequency,
             )
 
             # accumulate weighted noise
-            total += noise_val * amplitude
-            max_value += amplitude
+            flat_total[active] += noise_val * amplitude
+            remaining -= amplitude
+
+            # noise is bounded by [-1, 1], so drop positions that stay below
+            # the cutoff even if every remaining octave is at its maximum
+            if floor is not None:
+                reachable = flat_total[active] + remaining >= floor
+                culled = active[~reachable]
+                flat_total[culled] = -max_value
+                active = active[reachable]
 
             # update for next octave
             amplitude *= self.persistence
             frequency *= self.lacunarity
 
         # normalize to [0, 1]
+        total = flat_total.reshape(shape)
         normalized = (total / max_value + 1.0) / 2.0
         return normalized
 
-    def cloud_color(
-        self, cloud_value: float, x: float, y: float
-    ) -> tuple[int, int, int, int]:
-        """Map cloud density to color with pink-to-blue gradient.
+    def build_color_luts(self) -> tuple[np.ndarray, np.ndarray]:
+        """Precompute the cloud color gradient and brightness tables.
 
-        Args:
-            cloud_value: Noise value from fbm_noise (0-1)
-            x: X coordinate for gradient variation
-            y: Y coordinate for gradient variation
+        the gradient only depends on the pixel row and the brightness only on
+        the cloud density, so both are tabulated once and cloud_color reduces
+        to lookups and integer math.
 
         Returns:
-            Tuple of (r, g, b, a) color values
+            Tuple of (gradient_lut, brightness_lut) where gradient_lut holds the
+            (r, g, b) of each canvas row and brightness_lut the 8.8 fixed point
+            brightness of each of 256 density levels
         """
-        # if below threshold, no cloud (transparent)
-        if cloud_value < self.cloud_threshold:
-            return (255, 255, 255, 0)
-
-        # calculate cloud alpha with soft falloff
-        alpha_range = cloud_value - self.cloud_threshold
-        alpha = min(255, int((alpha_range / self.cloud_softness) * 255))
-
-        # create vertical gradient from pink (top) to blue (bottom)
-        gradient_pos = y / self.canvas_height
-
         # pink color (top): soft peachy pink
-        pink_r, pink_g, pink_b = 255, 182, 193
+        pink = np.array([255, 182, 193])
 
         # blue color (bottom): soft periwinkle blue
-        blue_r, blue_g, blue_b = 176, 196, 222
+        blue = np.array([176, 196, 222])
 
         # interpolate between pink and blue based on vertical position
-        r = int(pink_r + (blue_r - pink_r) * gradient_pos)
-        g = int(pink_g + (blue_g - pink_g) * gradient_pos)
-        b = int(pink_b + (blue_b - pink_b) * gradient_pos)
+        gradient_pos = np.arange(self.canvas_height)[:, np.newaxis] / self.canvas_height
+        gradient_lut = (pink + (blue - pink) * gradient_pos).astype(np.uint32)
 
-        # add subtle brightness variation based on cloud density
-        brightness = 0.9 + (cloud_value * 0.3)
-        r = int(min(255, r * brightness))
-        g = int(min(255, g * brightness))
-        b = int(min(255, b * brightness))
+        # subtle brightness variation based on cloud density
+        brightness = 0.9 + np.arange(256) / 255 * 0.3
+        brightness_lut = np.rint(brightness * 256).astype(np.uint32)
+        return gradient_lut, brightness_lut
 
-        # reduce alpha slightly for softer look
-        alpha = int(alpha * 0.85)
+    def cloud_color(
+        self, cloud_value: np.ndarray, x: np.ndarray, y: np.ndarray
+    ) -> np.ndarray:
+        """Map cloud density to color with pink-to-blue gradient.
 
-        return (r, g, b, alpha)
+        Args:
+            cloud_value: Noise values from fbm_noise (0-1)
+            x: X coordinates for gradient variation
+            y: Y coordinates for gradient variation
 
+        Returns:
+            uint8 array of (r, g, b, a) colors with a trailing axis of 4
+        """
+        # calculate cloud alpha with soft falloff
+        alpha_range = cloud_value - self.cloud_threshold
+        alpha = np.minimum(255, (alpha_range / self.cloud_softness * 255).astype(int))
 
-def parse_resolution(resolution_str: str) -> tuple[int, int]:
-    """Parse resolution string to (width, height) tuple.
+        # vertical gradient from pink (top) to blue (bottom), looked up per row
+        rows = np.clip(y.astype(np.intp), 0, len(self.gradient_lut) - 1)
+        rgb = self.gradient_lut[rows]
 
-    Args:
-        resolution_str: Resolution as shorthand (e.g., "1080p", "4k") or "WIDTHxHEIGHT"
+        # add subtle brightness variation based on cloud density
+        levels = np.clip(cloud_value * 255, 0, 255).astype(np.intp)
+        rgb = np.minimum(255, (rgb * self.brightness_lut[levels, np.newaxis]) >> 8)
+        r, g, b = rgb[..., 0], rgb[..., 1], rgb[..., 2]
 
-    Returns:
-        Tuple of (width, height) in pixels
+        # reduce alpha slightly for softer look
+        alpha = (alpha * 0.85).astype(int)
 
-    Raises:
-        ValueError: If resolution string is invalid
-    """
-    # map of common shorthand names to resolutions
-    shorthand_map = {
-        "4k": (3840, 2160),
-        "1440p": (2560, 1440),
-        "1080p": (1920, 1080),
-        "720p": (1280, 720),
-        "1440p_portrait": (1440, 2560),
-        "qhd_portrait": (1440, 2560),
-    }
+        # if below threshold, no cloud (transparent)
+        clear = cloud_value < self.cloud_threshold
+        colors = np.stack([r, g, b, alpha], axis=-1)
+        colors[clear] = (255, 255, 255, 0)
 
-    # try shorthand first
-    resolution_lower = resolution_str.lower()
-    if resolution_lower in shorthand_map:
-        return shorthand_map[resolution_lower]
-
-    # try WIDTHxHEIGHT format
-    if "x" in resolution_str:
-        try:
-            parts = resolution_str.split("x")
-            if len(parts) == 2:
-                width = int(parts[0])
-                height = int(parts[1])
-                if width > 0 and height > 0:
-                    return (width, height)
-        except ValueError:
-            pass
-
-    # if we get here, format is invalid
-    valid_formats = ", ".join(shorthand_map.keys())
-    msg = (
-        f"invalid resolution: '{resolution_str}'. "
-        f"use shorthand ({valid_formats}) or WIDTHxHEIGHT format (e.g., '1920x1080')"
-    )
-    raise ValueError(msg)
+        return colors.astype(np.uint8)
 
 
 def render_all_resolutions(output_dir: str = "../../output") -> None:
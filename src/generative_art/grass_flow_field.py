@@ -18,6 +18,7 @@ import click
 import numpy as np
 from py5 import Sketch
 
+from generative_art.export import parse_resolution
 from generative_art.flow_field import (
     ClusteringConfig,
     FlowField,
@@ -195,7 +196,7 @@ class GrassFlowFieldSketch(Sketch):
             for obs in self.flow_field.obstacles:
                 dx = x - obs.x
                 dy = y - obs.y
-                if np.sqrt(dx**2 + dy**2) < obs.radius:
+                if dx * dx + dy * dy < obs.radius_sq:
                     valid = False
                     break
 
@@ -325,14 +326,17 @@ class GrassFlowFieldSketch(Sketch):
         self.stroke_weight(2.0)
 
         for obstacle in self.flow_field.obstacles:
+            influence_radius = obstacle.influence_radius
+            assert influence_radius is not None
+
             # outer influence radius (faint)
             self.stroke(100, 100, 100, 30)
             self.no_fill()
             self.ellipse(
                 obstacle.x,
                 obstacle.y,
-                obstacle.influence_radius * 2,
-                obstacle.influence_radius * 2,
+                influence_radius * 2,
+                influence_radius * 2,
             )
 
             # inner obstacle (solid)
@@ -378,49 +382,6 @@ class GrassFlowFieldSketch(Sketch):
             print(f"saved: {save_path}")
 
 
-def parse_resolution(resolution_str: str) -> tuple[int, int]:
-    """Parse resolution string to (width, height) tuple.
-
-    Args:
-        resolution_str: resolution as shorthand (e.g., "1080p", "4k") or "WIDTHxHEIGHT"
-
-    Returns:
-        tuple of (width, height) in pixels
-
-    Raises:
-        ValueError: if resolution string is invalid
-    """
-    shorthand_map = {
-        "4k": (3840, 2160),
-        "1440p": (2560, 1440),
-        "1080p": (1920, 1080),
-        "720p": (1280, 720),
-    }
-
-    resolution_lower = resolution_str.lower()
-    if resolution_lower in shorthand_map:
-        return shorthand_map[resolution_lower]
-
-    expected_parts = 2
-    if "x" in resolution_str:
-        try:
-            parts = resolution_str.split("x")
-            if len(parts) == expected_parts:
-                width = int(parts[0])
-                height = int(parts[1])
-                if width > 0 and height > 0:
-                    return (width, height)
-        except ValueError:
-            pass
-
-    valid_formats = ", ".join(shorthand_map.keys())
-    msg = (
-        f"invalid resolution: '{resolution_str}'. "
-        f"use shorthand ({valid_formats}) or WIDTHxHEIGHT format"
-    )
-    raise ValueError(msg)
-
-
 @click.command()
 @click.option(
     "--render",
@@ -7,18 +7,273 @@ This sketch demonstrates:
 - Layered composition
 """
 
+import math
+import sys
+from functools import lru_cache
+from multiprocessing import get_context
 from pathlib import Path
 
 import click
-from noise import pnoise2
-from py5 import Sketch
+import numpy as np
+from py5 import Py5Graphics, Sketch
+
+from generative_art._jit import NUMBA_AVAILABLE, njit, prange
+from generative_art.export import parse_resolution
+from generative_art.filters import blur
+from generative_art.particles import (
+    build_step_color_lut,
+    flow_line_colors,
+    particle_base_colors,
+    seed_particles,
+)
+from generative_art.perlin import pnoise2
+from generative_art.segments import group_segments_by_color, paths_to_segments
+
+# flow noise octaves; the finest one sets how densely the field is sampled
+FLOW_OCTAVES = 3
+# grid samples per cell of the finest noise octave, enough to keep the
+# interpolated flow angle within about a degree of the exact one
+FIELD_SAMPLES_PER_CELL = 16
+# color channel bucket width when batching flow line strokes, fine enough
+# that the faint alpha tail of each line keeps a dozen levels
+LINE_COLOR_QUANTUM = 8
+
+
+def sample_flow_noise(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Sample the 3-octave flow noise at every (x, y) position.
+
+    Args:
+        x: noise-space x coordinates
+        y: noise-space y coordinates
+
+    Returns:
+        float array of noise values in [-1.0, 1.0], shaped like x and y
+    """
+    return pnoise2(x, y, octaves=FLOW_OCTAVES, persistence=0.5)
+
+
+@lru_cache(maxsize=8)
+def build_flow_field(
+    noise_scale: float, width: float, height: float
+) -> tuple[np.ndarray, float]:
+    """Precompute the flow noise on a regular grid covering the canvas.
+
+    the field only depends on position, so sampling it once on a grid and
+    interpolating is much cheaper than evaluating noise for every step of
+    every particle. fields are cached per (noise_scale, width, height) and
+    returned read-only, since every caller shares the same array.
+
+    Args:
+        noise_scale: scale factor for noise sampling
+        width: canvas width in pixels
+        height: canvas height in pixels
+
+    Returns:
+        tuple of (field, spacing) where field is a float32 grid whose
+        field[j, i] is the noise value at pixel (i * spacing, j * spacing),
+        extending at least one sample past the right and bottom canvas edges
+    """
+    finest_cell = 1 / (noise_scale * 2 ** (FLOW_OCTAVES - 1))
+    spacing = finest_cell / FIELD_SAMPLES_PER_CELL
+    cols = math.ceil(width / spacing) + 2
+    rows = math.ceil(height / spacing) + 2
+    grid_x = np.arange(cols) * (spacing * noise_scale)
+    grid_y = np.arange(rows) * (spacing * noise_scale)
+    field = sample_flow_noise(grid_x[np.newaxis, :], grid_y[:, np.newaxis])
+    field = field.astype(np.float32)
+    field.flags.writeable = False
+    return field, spacing
+
+
+def sample_field(
+    field: np.ndarray, spacing: float, x: np.ndarray, y: np.ndarray
+) -> np.ndarray:
+    """Bilinearly interpolate a precomputed field at pixel positions.
+
+    Args:
+        field: (rows, cols) grid from build_flow_field
+        spacing: pixel distance between grid samples
+        x: pixel x positions
+        y: pixel y positions
+
+    Returns:
+        interpolated field values shaped like x and y
+    """
+    u = x / spacing
+    v = y / spacing
+    # keep the cell corners as floats so the weights stay in u's dtype
+    u_floor = np.clip(np.floor(u), 0, field.shape[1] - 2)
+    v_floor = np.clip(np.floor(v), 0, field.shape[0] - 2)
+    fu = u - u_floor
+    fv = v - v_floor
+    i = u_floor.astype(np.int64)
+    j = v_floor.astype(np.int64)
+    top = field[j, i] + fu * (field[j, i + 1] - field[j, i])
+    bottom = field[j + 1, i] + fu * (field[j + 1, i + 1] - field[j + 1, i])
+    return np.asarray(top + fv * (bottom - top))
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _trace_flow_lines_jit(
+    xs: np.ndarray,
+    ys: np.ndarray,
+    field: np.ndarray,
+    spacing: float,
+    flow_strength: float,
+    steps: int,
+    width: float,
+    height: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Trace particles in a numba-compiled loop split across cpu cores.
+
+    particles are independent, so each one runs all of its steps on a single
+    core without any intermediate arrays.
+    """
+    num_particles = xs.shape[0]
+    paths = np.empty((num_particles, steps + 1, 2), dtype=np.float32)
+    lengths = np.empty(num_particles, dtype=np.int64)
+    max_i = field.shape[1] - 2
+    max_j = field.shape[0] - 2
+
+    for p in prange(num_particles):
+        x = xs[p]
+        y = ys[p]
+        paths[p, 0, 0] = x
+        paths[p, 0, 1] = y
+        count = 1
+
+        for _ in range(steps):
+            # bilinearly sample the noise field at the particle
+            u = x / spacing
+            v = y / spacing
+            i = min(max(math.floor(u), 0), max_i)
+            j = min(max(math.floor(v), 0), max_j)
+            fu = u - i
+            fv = v - j
+            top = field[j, i] + fu * (field[j, i + 1] - field[j, i])
+            bottom = field[j + 1, i] + fu * (field[j + 1, i + 1] - field[j + 1, i])
+            noise_val = top + fv * (bottom - top)
+
+            # convert noise to angle and step along it
+            angle = noise_val * math.tau * 2
+            x += math.cos(angle) * flow_strength
+            y += math.sin(angle) * flow_strength
+
+            # stop if off canvas
+            if x < 0 or x > width or y < 0 or y > height:
+                break
+
+            paths[p, count, 0] = x
+            paths[p, count, 1] = y
+            count += 1
+
+        lengths[p] = count
+
+    return paths, lengths
+
+
+def _trace_flow_lines_numpy(
+    xs: np.ndarray,
+    ys: np.ndarray,
+    field: np.ndarray,
+    spacing: float,
+    flow_strength: float,
+    steps: int,
+    width: float,
+    height: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Trace particles together, one vectorized step at a time.
+
+    fallback for environments without numba; each step is a handful of array
+    operations over the particles still on the canvas.
+    """
+    num_particles = xs.shape[0]
+    paths = np.empty((num_particles, steps + 1, 2), dtype=np.float32)
+    lengths = np.ones(num_particles, dtype=np.int64)
+    x = xs.copy()
+    y = ys.copy()
+    paths[:, 0, 0] = x
+    paths[:, 0, 1] = y
+
+    # indices of particles still on the canvas, compacted as particles leave
+    alive = np.arange(num_particles)
+
+    for step in range(1, steps + 1):
+        # convert noise to angle and step every live particle along it
+        angle = sample_field(field, spacing, x, y) * math.tau * 2
+        x += np.cos(angle) * flow_strength
+        y += np.sin(angle) * flow_strength
+
+        # particles stop for good once they leave the canvas
+        in_bounds = (x >= 0) & (x <= width) & (y >= 0) & (y <= height)
+        if not in_bounds.all():
+            alive = alive[in_bounds]
+            x = x[in_bounds]
+            y = y[in_bounds]
+            if alive.size == 0:
+                break
+
+        paths[alive, step, 0] = x
+        paths[alive, step, 1] = y
+        lengths[alive] += 1
+
+    return paths, lengths
+
+
+def trace_flow_lines(
+    xs: np.ndarray,
+    ys: np.ndarray,
+    field: np.ndarray,
+    spacing: float,
+    flow_strength: float,
+    steps: int,
+    width: float,
+    height: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Trace every particle through a precomputed flow field.
+
+    uses the parallel numba kernel when numba is installed, otherwise
+    advances all particles together with vectorized numpy. a particle stops
+    for good the first time it leaves the canvas.
+
+    Args:
+        xs: (N,) starting x positions
+        ys: (N,) starting y positions
+        field: noise grid from build_flow_field
+        spacing: pixel distance between field samples
+        flow_strength: distance travelled per step
+        steps: maximum number of steps per particle
+        width: canvas width
+        height: canvas height
+
+    Returns:
+        tuple of (paths, lengths) where paths is a (N, steps + 1, 2) float32
+        array and lengths holds the number of valid points in each path
+    """
+    # positions are traced in float32, plenty for pixel coordinates and half
+    # the memory traffic of float64
+    trace = _trace_flow_lines_jit if NUMBA_AVAILABLE else _trace_flow_lines_numpy
+    return trace(
+        np.ascontiguousarray(xs, dtype=np.float32),
+        np.ascontiguousarray(ys, dtype=np.float32),
+        np.ascontiguousarray(field, dtype=np.float32),
+        spacing,
+        flow_strength,
+        steps,
+        float(width),
+        float(height),
+    )
 
 
 class IncandesceeentPerlinFlow(Sketch):
     """Generate flowing patterns based on Perlin noise fields."""
 
     def __init__(
-        self, width: int = 1920, height: int = 1080, output_path: str | None = None
+        self,
+        width: int = 1920,
+        height: int = 1080,
+        output_path: str | None = None,
+        seed: int | None = None,
     ) -> None:
         """Initialize the sketch parameters.
 
@@ -26,15 +281,27 @@ class IncandesceeentPerlinFlow(Sketch):
             width: Canvas width in pixels
             height: Canvas height in pixels
             output_path: If provided, save output to this path
+            seed: Random seed for particle placement (random if not provided)
         """
         super().__init__()
         self.canvas_width = width
         self.canvas_height = height
         self.output_path = output_path
+        self.rng = np.random.default_rng(seed)
         self.num_particles = 3000
         self.noise_scale = 0.003
         self.flow_strength = 2.0
-        self.particles: list[list[float]] = []
+        self.line_steps = 250  # increased so particles travel further
+        # particle start positions, one array per coordinate
+        self.px = np.empty(0, dtype=np.float32)
+        self.py = np.empty(0, dtype=np.float32)
+        # per-step color shifts and alpha, see build_step_color_lut
+        self._step_lut = np.empty((0, 4), dtype=np.float32)
+        # flow noise sampled on a grid, see build_flow_field
+        self.field = np.empty((0, 0), dtype=np.float32)
+        self.field_spacing = 1.0
+        # offscreen graphics the flow lines are drawn, blurred and saved in
+        self.line_buffer: Py5Graphics | None = None
 
     def settings(self) -> None:
         """Configure the sketch size and renderer."""
@@ -44,172 +311,100 @@ class IncandesceeentPerlinFlow(Sketch):
         """Set up the drawing environment."""
         self.background(8, 10, 20)
         self.no_loop()
+        self.line_buffer = self.create_graphics(self.canvas_width, self.canvas_height)
 
-        # Calculate center
-        center_x = self.canvas_width / 2
-        center_y = self.canvas_height / 2
-
-        # Initialize particles at random positions (50% of total)
-        random_count = int(self.num_particles * 0.5)
-        for _ in range(random_count):
-            x = self.random(self.canvas_width)
-            y = self.random(self.canvas_height)
-            self.particles.append([x, y])
-
-        # Add particles in concentric rings around center (20% of total)
-        # This ensures particles flow THROUGH the center area
-        ring_count = int(self.num_particles * 0.2)
-        num_rings = 5
-        particles_per_ring = ring_count // num_rings
-
-        for ring in range(num_rings):
-            # Rings at different radii from very close to medium distance
-            ring_radius = (ring + 1) * 80  # 80, 160, 240, 320, 400 pixels
-            for _ in range(particles_per_ring):
-                angle = self.random(self.TWO_PI)
-                # Add some variation to the radius
-                radius = ring_radius + self.random(-30, 30)
-                x = center_x + self.cos(angle) * radius
-                y = center_y + self.sin(angle) * radius
-                self.particles.append([x, y])
-
-        # Add MANY particles right AT the center (30% of total)
-        # These will immediately start flowing outward/around
-        exact_center_count = int(self.num_particles * 0.3)
-        for _ in range(exact_center_count):
-            # Very tight cluster at exact center
-            angle = self.random(self.TWO_PI)
-            radius = self.random(5)  # Within 5 pixels of dead center
-            x = center_x + self.cos(angle) * radius
-            y = center_y + self.sin(angle) * radius
-            self.particles.append([x, y])
+        # Seed particles at random, in rings and at the center
+        self.px, self.py = seed_particles(
+            self.rng, self.num_particles, self.canvas_width, self.canvas_height
+        )
+        self._step_lut = build_step_color_lut(self.line_steps)
+        self.field, self.field_spacing = build_flow_field(
+            self.noise_scale, self.canvas_width, self.canvas_height
+        )
 
     def draw(self) -> None:
         """Main drawing function."""
-        # Draw flow lines for each particle
-        for i, particle in enumerate(self.particles):
-            self.draw_flow_line(particle, i)
-
-        # Apply blur for smooth aesthetic
-        self.apply_filter(self.BLUR, 1)
+        # Trace every particle at once, then draw all flow lines together
+        paths, lengths = trace_flow_lines(
+            self.px,
+            self.py,
+            self.field,
+            self.field_spacing,
+            self.flow_strength,
+            self.line_steps,
+            self.canvas_width,
+            self.canvas_height,
+        )
+        segments, particle_ids, step_ids = paths_to_segments(paths, lengths)
+        base_colors = particle_base_colors(self.px)
+        colors = flow_line_colors(base_colors[particle_ids], step_ids, self._step_lut)
+
+        # Draw offscreen so the window only receives the finished image
+        buffer = self.line_buffer
+        assert buffer is not None
+        with buffer.begin_draw():
+            buffer.background(8, 10, 20)
+            self.draw_segments(buffer, segments, colors)
+
+        # Apply blur for smooth aesthetic, matching apply_filter(BLUR, 1) but
+        # compiled and multithreaded instead of on the jvm's single thread
+        buffer.load_np_pixels()
+        buffer.np_pixels[:, :, 1:] = blur(buffer.np_pixels[:, :, 1:], radius=1)
+        buffer.update_np_pixels()
+        self.image(buffer, 0, 0)
 
         # Save if output path provided
         if self.output_path:
-            self.save(self.output_path)
+            buffer.save(self.output_path)
             print(f"    Saved: {self.output_path}")
             self.exit_sketch()
 
-    def draw_flow_line(self, start_pos: list[float], particle_id: int) -> None:
-        """Draw a flowing line following the noise field.
+    def draw_segments(
+        self, target: Sketch | Py5Graphics, segments: np.ndarray, colors: np.ndarray
+    ) -> None:
+        """Draw flow line segments with one stroke() and lines() call per color.
 
         Args:
-            start_pos: Starting [x, y] position
-            particle_id: Unique particle identifier for color variation
+            target: sketch or offscreen graphics to draw on
+            segments: (K, 4) array of (x1, y1, x2, y2) segments
+            colors: (K, 4) array of (r, g, b, alpha) stroke colors
         """
-        x, y = start_pos
-        steps = 250  # Increased so particles travel further
-
-        # Color based on particle position and ID
-        hue = (particle_id * 0.5 + x * 0.1) % 360
-        r = int((self.sin(hue * 0.02) + 1) * 100 + 80)
-        g = int((self.cos(hue * 0.03 + 2) + 1) * 90 + 100)
-        b = int((self.sin(hue * 0.025 + 4) + 1) * 100 + 120)
-
-        self.stroke_weight(1.5)
-        self.no_fill()
+        target.stroke_weight(1.5)
+        target.no_fill()
 
-        # Draw line using individual line segments with changing colors
-        prev_x, prev_y = x, y
+        # a few thousand color buckets replace a stroke change per segment
+        for color, bucket in group_segments_by_color(
+            segments, colors, quantum=LINE_COLOR_QUANTUM
+        ):
+            target.stroke(*color)
+            target.lines(bucket)
 
-        for step in range(steps):
-            # Get noise value at current position
-            noise_val = pnoise2(
-                x * self.noise_scale, y * self.noise_scale, octaves=3, persistence=0.5
-            )
 
-            # Convert noise to angle
-            angle = noise_val * self.TWO_PI * 2
-
-            # Calculate velocity from angle
-            vx = self.cos(angle) * self.flow_strength
-            vy = self.sin(angle) * self.flow_strength
-
-            # Update position
-            x += vx
-            y += vy
-
-            # Boundary check - stop if off canvas
-            if x < 0 or x > self.canvas_width or y < 0 or y > self.canvas_height:
-                break
-
-            # Fade alpha over the line
-            alpha = 255 * (1 - step / steps) * 0.4
-
-            # Update color slightly as we move
-            r_shift = int(r + self.sin(step * 0.1) * 20)
-            g_shift = int(g + self.cos(step * 0.1) * 20)
-            b_shift = int(b + self.sin(step * 0.15) * 20)
-
-            self.stroke(r_shift, g_shift, b_shift, alpha)
-
-            # Draw line segment from previous position to current
-            self.line(prev_x, prev_y, x, y)
-
-            # Update previous position
-            prev_x, prev_y = x, y
-
-
-def parse_resolution(resolution_str: str) -> tuple[int, int]:
-    """Parse resolution string to (width, height) tuple.
+def _render_resolution(task: tuple[str, int, int, str]) -> str:
+    """Render the sketch once at a single resolution.
 
     Args:
-        resolution_str: Resolution as shorthand (e.g., "1080p", "4k") or "WIDTHxHEIGHT"
+        task: (resolution name, width, height, output file) to render
 
     Returns:
-        Tuple of (width, height) in pixels
-
-    Raises:
-        ValueError: If resolution string is invalid
+        the resolution name, once its image has been saved
     """
-    # map of common shorthand names to resolutions
-    shorthand_map = {
-        "4k": (3840, 2160),
-        "1440p": (2560, 1440),
-        "1080p": (1920, 1080),
-        "720p": (1280, 720),
-        "1440p_portrait": (1440, 2560),
-        "qhd_portrait": (1440, 2560),
-    }
-
-    # try shorthand first
-    resolution_lower = resolution_str.lower()
-    if resolution_lower in shorthand_map:
-        return shorthand_map[resolution_lower]
-
-    # try WIDTHxHEIGHT format
-    if "x" in resolution_str:
-        try:
-            parts = resolution_str.split("x")
-            if len(parts) == 2:
-                width = int(parts[0])
-                height = int(parts[1])
-                if width > 0 and height > 0:
-                    return (width, height)
-        except ValueError:
-            pass
-
-    # if we get here, format is invalid
-    valid_formats = ", ".join(shorthand_map.keys())
-    msg = (
-        f"invalid resolution: '{resolution_str}'. "
-        f"use shorthand ({valid_formats}) or WIDTHxHEIGHT format (e.g., '1920x1080')"
+    res_name, width, height, output_file = task
+    sketch = IncandesceeentPerlinFlow(
+        width=width, height=height, output_path=output_file
     )
-    raise ValueError(msg)
+    sketch.run_sketch(block=True)
+    return res_name
 
 
 def render_all_resolutions(output_dir: str = "../../output") -> None:
     """Render sketch at all standard resolutions.
 
+    each resolution renders in its own process so the renders run
+    concurrently. processes are spawned rather than forked, since the JVM
+    behind py5 does not survive a fork. on macOS py5 cannot run in child
+    processes at all, so the renders run one after another there.
+
     Args:
         output_dir: Directory to save outputs
     """
@@ -224,12 +419,24 @@ def render_all_resolutions(output_dir: str = "../../output") -> None:
 
     print("\n🎨 Rendering incandescent perlin flow at multiple resolutions...")
 
-    for res_name, (width, height) in resolutions.items():
-        output_file = output_path / f"incandescent_perlin_flow_{res_name}.png"
-        print(f"  ├─ {res_name} ({width}x{height})...")
+    tasks = [
+        (
+            res_name,
+            width,
+            height,
+            str(output_path / f"incandescent_perlin_flow_{res_name}.png"),
+        )
+        for res_name, (width, height) in resolutions.items()
+    ]
 
-        sketch = IncandesceeentPerlinFlow(width=width, height=height, output_path=str(output_file))
-        sketch.run_sketch(block=True)
+    if sys.platform == "darwin":
+        for task in tasks:
+            print(f"  ├─ {task[0]} ({task[1]}x{task[2]})...")
+            _render_resolution(task)
+    else:
+        with get_context("spawn").Pool(len(tasks)) as pool:
+            for res_name in pool.imap_unordered(_render_resolution, tasks):
+                print(f"  ├─ {res_name} done")
 
     print("✨ All renders complete!\n")
 
@@ -3,8 +3,20 @@
 drop-in replacement for noise.pnoise2/pnoise3 with octave support.
 """
 
+import numpy as np
+import numpy.typing as npt
 import opensimplex
 
+# the compiled fBm kernels call opensimplex's private jitted noise functions
+# and read its default generator's permutation tables. these names exist in
+# the opensimplex 0.4.x series that requirements.in pins (>=0.4.5,<0.5);
+# all private access goes through these imports and _default_tables, so a
+# version bump that renames them fails here
+from opensimplex import api as _opensimplex_api
+from opensimplex.internals import _noise2, _noise3
+
+from generative_art._jit import njit, prange
+
 
 def init_noise(seed: int | None = None) -> None:
     """Initialize noise generator with seed.
@@ -16,6 +28,69 @@ def init_noise(seed: int | None = None) -> None:
         opensimplex.seed(seed)
 
 
+def _default_tables() -> tuple[np.ndarray, np.ndarray]:
+    """Get the permutation tables of the generator seeded through init_noise.
+
+    Returns:
+        tuple of (perm, perm_grad_index3) arrays for the 2D and 3D kernels
+    """
+    generator = _opensimplex_api._default
+    return (generator._perm, generator._perm_grad_index3)
+
+
+@njit(cache=True)
+def _fbm2(
+    x: float,
+    y: float,
+    octaves: int,
+    persistence: float,
+    lacunarity: float,
+    perm: np.ndarray,
+) -> float:
+    """Sum octaves of 2D opensimplex noise in one compiled loop."""
+    total = 0.0
+    amplitude = 1.0
+    frequency = 1.0
+    max_amplitude = 0.0
+
+    for _ in range(octaves):
+        total += _noise2(x * frequency, y * frequency, perm) * amplitude
+        max_amplitude += amplitude
+        amplitude *= persistence
+        frequency *= lacunarity
+
+    return total / max_amplitude
+
+
+@njit(cache=True)
+def _fbm3(
+    x: float,
+    y: float,
+    z: float,
+    octaves: int,
+    persistence: float,
+    lacunarity: float,
+    perm: np.ndarray,
+    perm_grad_index3: np.ndarray,
+) -> float:
+    """Sum octaves of 3D opensimplex noise in one compiled loop."""
+    total = 0.0
+    amplitude = 1.0
+    frequency = 1.0
+    max_amplitude = 0.0
+
+    for _ in range(octaves):
+        total += (
+            _noise3(x * frequency, y * frequency, z * frequency, perm, perm_grad_index3)
+            * amplitude
+        )
+        max_amplitude += amplitude
+        amplitude *= persistence
+        frequency *= lacunarity
+
+    return total / max_amplitude
+
+
 def fbm_noise2(
     x: float,
     y: float,
@@ -37,18 +112,18 @@ def fbm_noise2(
     Returns:
         noise value in range [-1.0, 1.0]
     """
-    total = 0.0
-    amplitude = 1.0
-    frequency = 1.0
-    max_amplitude = 0.0
-
-    for _ in range(octaves):
-        total += opensimplex.noise2(x * frequency, y * frequency) * amplitude
-        max_amplitude += amplitude
-        amplitude *= persistence
-        frequency *= lacunarity
-
-    return total / max_amplitude
+    # the whole octave loop runs compiled against the seeded generator's table
+    perm, _ = _default_tables()
+    return float(
+        _fbm2(
+            float(x),
+            float(y),
+            octaves,
+            float(persistence),
+            float(lacunarity),
+            perm,
+        )
+    )
 
 
 def fbm_noise3(
@@ -74,20 +149,142 @@ def fbm_noise3(
     Returns:
         noise value in range [-1.0, 1.0]
     """
-    total = 0.0
-    amplitude = 1.0
-    frequency = 1.0
-    max_amplitude = 0.0
+    perm, perm_grad_index3 = _default_tables()
+    return float(
+        _fbm3(
+            float(x),
+            float(y),
+            float(z),
+            octaves,
+            float(persistence),
+            float(lacunarity),
+            perm,
+            perm_grad_index3,
+        )
+    )
 
-    for _ in range(octaves):
-        total += (
-            opensimplex.noise3(x * frequency, y * frequency, z * frequency) * amplitude
+
+@njit(cache=True, parallel=True)
+def _fbm_noise3_points(
+    xs: np.ndarray,
+    ys: np.ndarray,
+    zs: np.ndarray,
+    octaves: int,
+    persistence: float,
+    lacunarity: float,
+    perm: np.ndarray,
+    perm_grad_index3: np.ndarray,
+) -> np.ndarray:
+    """Evaluate 3D fBm at each (xs[i], ys[i], zs[i]) in one compiled loop."""
+    out = np.empty(xs.shape[0])
+    for i in prange(xs.shape[0]):
+        out[i] = _fbm3(
+            xs[i],
+            ys[i],
+            zs[i],
+            octaves,
+            persistence,
+            lacunarity,
+            perm,
+            perm_grad_index3,
         )
-        max_amplitude += amplitude
-        amplitude *= persistence
-        frequency *= lacunarity
+    return out
 
-    return total / max_amplitude
+
+def fbm_noise3_array(
+    x: npt.ArrayLike,
+    y: npt.ArrayLike,
+    z: npt.ArrayLike,
+    octaves: int = 1,
+    persistence: float = 0.5,
+    lacunarity: float = 2.0,
+) -> np.ndarray:
+    """Generate 3D fractal Brownian motion noise at many points at once.
+
+    unlike opensimplex.noise3array, which evaluates the outer product of its
+    axes, inputs are broadcast against each other and sampled pointwise, so
+    the result equals fbm_noise3 applied to each point.
+
+    Args:
+        x: x coordinates
+        y: y coordinates
+        z: z coordinates (use for time-based animation)
+        octaves: number of noise layers (default 1)
+        persistence: amplitude multiplier per octave (default 0.5)
+        lacunarity: frequency multiplier per octave (default 2.0)
+
+    Returns:
+        noise values in range [-1.0, 1.0] with the broadcast shape of the inputs
+    """
+    xs, ys, zs = np.broadcast_arrays(
+        np.asarray(x, dtype=np.float64),
+        np.asarray(y, dtype=np.float64),
+        np.asarray(z, dtype=np.float64),
+    )
+    perm, perm_grad_index3 = _default_tables()
+    values = _fbm_noise3_points(
+        xs.ravel(),
+        ys.ravel(),
+        zs.ravel(),
+        octaves,
+        persistence,
+        lacunarity,
+        perm,
+        perm_grad_index3,
+    )
+    return values.reshape(xs.shape)
+
+
+@njit(cache=True, parallel=True)
+def _fbm_noise2_rows(
+    xs: np.ndarray,
+    ys: np.ndarray,
+    octaves: int,
+    persistence: float,
+    lacunarity: float,
+    perm: np.ndarray,
+) -> np.ndarray:
+    """Evaluate 2D fBm on the grid spanned by xs and ys, one row per task."""
+    out = np.empty((ys.shape[0], xs.shape[0]), dtype=np.float32)
+    for row in prange(ys.shape[0]):
+        for col in range(xs.shape[0]):
+            out[row, col] = _fbm2(
+                xs[col], ys[row], octaves, persistence, lacunarity, perm
+            )
+    return out
+
+
+def fbm_noise2_grid(
+    xs: npt.ArrayLike,
+    ys: npt.ArrayLike,
+    octaves: int = 1,
+    persistence: float = 0.5,
+    lacunarity: float = 2.0,
+) -> np.ndarray:
+    """Generate 2D fractal Brownian motion noise over a regular grid.
+
+    like opensimplex.noise2array, the 1D coordinate axes span a grid, so a
+    whole (height, width) field is filled in one compiled call.
+
+    Args:
+        xs: 1D x coordinates, one per column
+        ys: 1D y coordinates, one per row
+        octaves: number of noise layers (default 1)
+        persistence: amplitude multiplier per octave (default 0.5)
+        lacunarity: frequency multiplier per octave (default 2.0)
+
+    Returns:
+        (len(ys), len(xs)) float32 array of noise values in range [-1.0, 1.0]
+    """
+    perm, _ = _default_tables()
+    return _fbm_noise2_rows(
+        np.ascontiguousarray(xs, dtype=np.float64),
+        np.ascontiguousarray(ys, dtype=np.float64),
+        octaves,
+        float(persistence),
+        float(lacunarity),
+        perm,
+    )
 
 
 def fbm_noise1(
@@ -0,0 +1,117 @@
+"""Particle seeding and coloring shared by the incandescent flow sketches.
+
+the still and animated sketches start their particles from the same layout
+and color each flow line the same way, so both draw these from here.
+"""
+
+import math
+
+import numpy as np
+
+
+def build_step_color_lut(steps: int) -> np.ndarray:
+    """Precompute the color shift and alpha for each step along a flow line.
+
+    none of these depend on the particle, so they are computed once per
+    step instead of once per segment.
+
+    Args:
+        steps: number of steps in a flow line
+
+    Returns:
+        (steps, 4) float32 array of (red shift, green shift, blue shift, alpha)
+    """
+    step = np.arange(steps, dtype=np.float64)
+    lut = np.empty((steps, 4), dtype=np.float32)
+    lut[:, 0] = np.sin(step * 0.1) * 20
+    lut[:, 1] = np.cos(step * 0.1) * 20
+    lut[:, 2] = np.sin(step * 0.15) * 20
+    lut[:, 3] = 255 * (1 - step / steps) * 0.4
+    return lut
+
+
+def seed_particles(
+    rng: np.random.Generator, num_particles: int, width: int, height: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Choose particle start positions, concentrated around the canvas center.
+
+    half the particles are spread over the whole canvas, a fifth sit on
+    concentric rings around the center so particles flow through it, and the
+    rest start within a few pixels of the exact center.
+
+    Args:
+        rng: Random generator for positions
+        num_particles: Approximate number of particles
+        width: Canvas width in pixels
+        height: Canvas height in pixels
+
+    Returns:
+        Tuple of (px, py) float32 arrays of start positions
+    """
+    center_x = width / 2
+    center_y = height / 2
+
+    random_count = int(num_particles * 0.5)
+    num_rings = 5
+    particles_per_ring = int(num_particles * 0.2) // num_rings
+    exact_center_count = int(num_particles * 0.3)
+
+    # particles at random positions (50% of total)
+    random_x = rng.uniform(0, width, random_count)
+    random_y = rng.uniform(0, height, random_count)
+
+    # rings at 80, 160, 240, 320, 400 pixels with some radius variation
+    # (20% of total)
+    ring_index = np.repeat(np.arange(num_rings), particles_per_ring)
+    ring_angle = rng.uniform(0, math.tau, ring_index.size)
+    ring_radius = (ring_index + 1) * 80 + rng.uniform(-30, 30, ring_index.size)
+
+    # very tight cluster within 5 pixels of dead center (30% of total)
+    center_angle = rng.uniform(0, math.tau, exact_center_count)
+    center_radius = rng.uniform(0, 5, exact_center_count)
+
+    angle = np.concatenate([ring_angle, center_angle])
+    radius = np.concatenate([ring_radius, center_radius])
+    px = np.concatenate([random_x, center_x + np.cos(angle) * radius])
+    py = np.concatenate([random_y, center_y + np.sin(angle) * radius])
+    return px.astype(np.float32), py.astype(np.float32)
+
+
+def particle_base_colors(xs: np.ndarray) -> np.ndarray:
+    """Compute each particle's base RGB color from its id and start position.
+
+    Args:
+        xs: (N,) starting x positions, indexed by particle id
+
+    Returns:
+        (N, 3) integer array of base (r, g, b) values
+    """
+    hue = (np.arange(xs.shape[0]) * 0.5 + xs.astype(np.float64) * 0.1) % 360
+    r = (np.sin(hue * 0.02) + 1) * 100 + 80
+    g = (np.cos(hue * 0.03 + 2) + 1) * 90 + 100
+    b = (np.sin(hue * 0.025 + 4) + 1) * 100 + 120
+    return np.stack([r, g, b], axis=1).astype(np.int64)
+
+
+def flow_line_colors(
+    base_colors: np.ndarray, step_ids: np.ndarray, step_lut: np.ndarray
+) -> np.ndarray:
+    """Compute the stroke color of each flow line segment.
+
+    the base color drifts slightly along the line and the alpha fades out
+    towards its end.
+
+    Args:
+        base_colors: (K, 3) base (r, g, b) of the particle each segment
+            belongs to
+        step_ids: (K,) index of each segment along its line
+        step_lut: per-step color shifts and alpha from build_step_color_lut
+
+    Returns:
+        (K, 4) array of (r, g, b, alpha) stroke colors
+    """
+    step_colors = step_lut[step_ids]
+    colors = np.empty((len(step_ids), 4))
+    colors[:, :3] = np.trunc(base_colors + step_colors[:, :3])
+    colors[:, 3] = step_colors[:, 3]
+    return colors
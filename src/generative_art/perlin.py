@@ -0,0 +1,706 @@
+"""vectorized improved perlin noise for numpy arrays.
+
+array counterpart to noise.pnoise2/pnoise3 - uses ken perlin's reference
+permutation table and gradient set, so values match the `noise` package for
+the same coordinates while a whole grid is evaluated per call instead of per
+pixel. scalar kernels are also provided for use inside numba-compiled loops.
+"""
+
+import math
+from typing import cast
+
+import numpy as np
+import numpy.typing as npt
+
+from generative_art._jit import NUMBA_AVAILABLE, njit, prange
+
+# ken perlin's reference permutation, doubled so hashed lookups never wrap
+# fmt: off
+_PERM_256 = [
+    151, 160, 137, 91, 90, 15, 131, 13, 201, 95, 96, 53, 194, 233, 7, 225, 140, 36, 103,
+    30, 69, 142, 8, 99, 37, 240, 21, 10, 23, 190, 6, 148, 247, 120, 234, 75, 0, 26, 197,
+    62, 94, 252, 219, 203, 117, 35, 11, 32, 57, 177, 33, 88, 237, 149, 56, 87, 174, 20,
+    125, 136, 171, 168, 68, 175, 74, 165, 71, 134, 139, 48, 27, 166, 77, 146, 158, 231,
+    83, 111, 229, 122, 60, 211, 133, 230, 220, 105, 92, 41, 55, 46, 245, 40, 244, 102,
+    143, 54, 65, 25, 63, 161, 1, 216, 80, 73, 209, 76, 132, 187, 208, 89, 18, 169, 200,
+    196, 135, 130, 116, 188, 159, 86, 164, 100, 109, 198, 173, 186, 3, 64, 52, 217, 226,
+    250, 124, 123, 5, 202, 38, 147, 118, 126, 255, 82, 85, 212, 207, 206, 59, 227, 47,
+    16, 58, 17, 182, 189, 28, 42, 223, 183, 170, 213, 119, 248, 152, 2, 44, 154, 163,
+    70, 221, 153, 101, 155, 167, 43, 172, 9, 129, 22, 39, 253, 19, 98, 108, 110, 79,
+    113, 224, 232, 178, 185, 112, 104, 218, 246, 97, 228, 251, 34, 242, 193, 238, 210,
+    144, 12, 191, 179, 162, 241, 81, 51, 145, 235, 249, 14, 239, 107, 49, 192, 214, 31,
+    181, 199, 106, 157, 184, 84, 204, 176, 115, 121, 50, 45, 127, 4, 150, 254, 138, 236,
+    205, 93, 222, 114, 67, 29, 24, 72, 243, 141, 128, 195, 78, 66, 215, 61, 156, 180,
+]
+# fmt: on
+# the table is stored twice so lattice indices up to 511 (a hashed corner plus
+# the next coordinate) need no second `& 255` wrap. entries fit in a byte, so
+# the whole table is 512 bytes and stays resident in l1 cache. it is shared
+# read-only by every kernel and never rebuilt
+PERM = np.array(_PERM_256 * 2, dtype=np.uint8)
+PERM.flags.writeable = False
+
+# gradient directions (12 cube edges, padded to 16 for a cheap `& 15` lookup)
+GRAD3 = np.array(
+    [
+        [1, 1, 0],
+        [-1, 1, 0],
+        [1, -1, 0],
+        [-1, -1, 0],
+        [1, 0, 1],
+        [-1, 0, 1],
+        [1, 0, -1],
+        [-1, 0, -1],
+        [0, 1, 1],
+        [0, -1, 1],
+        [0, 1, -1],
+        [0, -1, -1],
+        [1, 0, -1],
+        [-1, 0, -1],
+        [0, -1, 1],
+        [0, 1, 1],
+    ],
+    dtype=np.float64,
+)
+
+# gradient components as separate contiguous tables, so the numpy paths
+# gather each component with a flat take instead of 2d fancy indexing
+_GRAD3_X = np.ascontiguousarray(GRAD3[:, 0])
+_GRAD3_Y = np.ascontiguousarray(GRAD3[:, 1])
+_GRAD3_Z = np.ascontiguousarray(GRAD3[:, 2])
+
+# eight evenly spaced unit gradients for the hashed variant, picked by `& 7`
+_DIAGONAL = math.sqrt(0.5)
+GRAD2 = np.array(
+    [
+        [1.0, 0.0],
+        [-1.0, 0.0],
+        [0.0, 1.0],
+        [0.0, -1.0],
+        [_DIAGONAL, _DIAGONAL],
+        [-_DIAGONAL, _DIAGONAL],
+        [_DIAGONAL, -_DIAGONAL],
+        [-_DIAGONAL, -_DIAGONAL],
+    ]
+)
+
+# murmur3 multiply constants used by the hashed variant
+_MURMUR_C1 = 0xCC9E2D51
+_MURMUR_C2 = 0x1B873593
+_MURMUR_F1 = 0x85EBCA6B
+_MURMUR_F2 = 0xC2B2AE35
+_UINT32_MASK = 0xFFFFFFFF
+
+
+def _fade(t: np.ndarray) -> np.ndarray:
+    """Quintic smoothstep 6t^5 - 15t^4 + 10t^3.
+
+    evaluated in horner form ((6t - 15)t + 10)t^3 inside a single buffer,
+    so the whole-array fade allocates one temporary instead of seven.
+    """
+    out = t * 6.0
+    out -= 15.0
+    out *= t
+    out += 10.0
+    out *= t
+    out *= t
+    out *= t
+    return out
+
+
+def _lerp(t: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Linearly interpolate between a and b."""
+    return cast("np.ndarray", a + t * (b - a))
+
+
+def _grad2(hash_: np.ndarray, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Dot the hashed lattice gradient with the offset vector (x, y)."""
+    h = hash_ & 15
+    return cast("np.ndarray", _GRAD3_X.take(h) * x + _GRAD3_Y.take(h) * y)
+
+
+def perlin2(x: npt.ArrayLike, y: npt.ArrayLike) -> np.ndarray:
+    """Evaluate single-octave 2D improved perlin noise.
+
+    Args:
+        x: x coordinates (scalar or array)
+        y: y coordinates (scalar or array, broadcast against x)
+
+    Returns:
+        noise values in range [-1.0, 1.0] with the broadcast shape of x and y
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # lattice cell containing each point
+    x_floor = np.floor(x)
+    y_floor = np.floor(y)
+    i = x_floor.astype(np.int32) & 255
+    j = y_floor.astype(np.int32) & 255
+
+    # position within the cell and its eased interpolation weights
+    x = x - x_floor
+    y = y - y_floor
+    fx = _fade(x)
+    fy = _fade(y)
+
+    # hash the four cell corners
+    a = PERM[i]
+    b = PERM[i + 1]
+    aa = PERM[PERM[a + j]]
+    ab = PERM[PERM[a + j + 1]]
+    ba = PERM[PERM[b + j]]
+    bb = PERM[PERM[b + j + 1]]
+
+    return _lerp(
+        fy,
+        _lerp(fx, _grad2(aa, x, y), _grad2(ba, x - 1, y)),
+        _lerp(fx, _grad2(ab, x, y - 1), _grad2(bb, x - 1, y - 1)),
+    )
+
+
+def _murmur_hash2(i: np.ndarray, j: np.ndarray) -> np.ndarray:
+    """Hash integer lattice coordinates to a gradient index in [0, 8).
+
+    mixes both coordinates with the murmur3 finalizer, so no table lookups
+    are needed and the lattice does not repeat every 256 cells.
+    """
+    # uint32 multiplies are meant to wrap
+    with np.errstate(over="ignore"):
+        h = (i.astype(np.uint32) * np.uint32(_MURMUR_C1)) ^ (
+            j.astype(np.uint32) * np.uint32(_MURMUR_C2)
+        )
+        h ^= h >> np.uint32(16)
+        h *= np.uint32(_MURMUR_F1)
+        h ^= h >> np.uint32(13)
+        h *= np.uint32(_MURMUR_F2)
+        h ^= h >> np.uint32(16)
+    return h & np.uint32(7)
+
+
+def _hashed_grad2(
+    i: np.ndarray, j: np.ndarray, x: np.ndarray, y: np.ndarray
+) -> np.ndarray:
+    """Dot the gradient hashed from lattice corner (i, j) with (x, y)."""
+    h = _murmur_hash2(i, j)
+    return cast("np.ndarray", GRAD2[h, 0] * x + GRAD2[h, 1] * y)
+
+
+def perlin2_hashed(x: npt.ArrayLike, y: npt.ArrayLike) -> np.ndarray:
+    """Evaluate single-octave 2D perlin noise with hashed gradients.
+
+    same lattice, fade and interpolation as perlin2, but each corner's
+    gradient comes from a murmur3 integer mix of its coordinates instead of
+    chained permutation table gathers. the pattern therefore differs from
+    perlin2 (and from the `noise` package).
+
+    Args:
+        x: x coordinates (scalar or array)
+        y: y coordinates (scalar or array, broadcast against x)
+
+    Returns:
+        noise values in range [-1.0, 1.0] with the broadcast shape of x and y
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    x_floor = np.floor(x)
+    y_floor = np.floor(y)
+    i = x_floor.astype(np.int64)
+    j = y_floor.astype(np.int64)
+
+    x = x - x_floor
+    y = y - y_floor
+    fx = _fade(x)
+    fy = _fade(y)
+
+    return _lerp(
+        fy,
+        _lerp(fx, _hashed_grad2(i, j, x, y), _hashed_grad2(i + 1, j, x - 1, y)),
+        _lerp(
+            fx,
+            _hashed_grad2(i, j + 1, x, y - 1),
+            _hashed_grad2(i + 1, j + 1, x - 1, y - 1),
+        ),
+    )
+
+
+def _grad3(
+    hash_: np.ndarray, x: np.ndarray, y: np.ndarray, z: np.ndarray
+) -> np.ndarray:
+    """Dot the hashed lattice gradient with the offset vector (x, y, z)."""
+    h = hash_ & 15
+    return cast(
+        "np.ndarray", _GRAD3_X.take(h) * x + _GRAD3_Y.take(h) * y + _GRAD3_Z.take(h) * z
+    )
+
+
+def perlin3(x: npt.ArrayLike, y: npt.ArrayLike, z: npt.ArrayLike) -> np.ndarray:
+    """Evaluate single-octave 3D improved perlin noise.
+
+    Args:
+        x: x coordinates (scalar or array)
+        y: y coordinates (scalar or array)
+        z: z coordinates (scalar or array, use for time-based animation)
+
+    Returns:
+        noise values in range [-1.0, 1.0] with the broadcast shape of x, y, z
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    z = np.asarray(z, dtype=np.float64)
+
+    # lattice cell containing each point
+    x_floor = np.floor(x)
+    y_floor = np.floor(y)
+    z_floor = np.floor(z)
+    i = x_floor.astype(np.int32) & 255
+    j = y_floor.astype(np.int32) & 255
+    k = z_floor.astype(np.int32) & 255
+
+    # position within the cell and its eased interpolation weights
+    x = x - x_floor
+    y = y - y_floor
+    z = z - z_floor
+    fx = _fade(x)
+    fy = _fade(y)
+    fz = _fade(z)
+
+    # hash the cell corners
+    a = PERM[i]
+    b = PERM[i + 1]
+    aa = PERM[a + j]
+    ab = PERM[a + j + 1]
+    ba = PERM[b + j]
+    bb = PERM[b + j + 1]
+
+    near = _lerp(
+        fy,
+        _lerp(fx, _grad3(PERM[aa + k], x, y, z), _grad3(PERM[ba + k], x - 1, y, z)),
+        _lerp(
+            fx,
+            _grad3(PERM[ab + k], x, y - 1, z),
+            _grad3(PERM[bb + k], x - 1, y - 1, z),
+        ),
+    )
+    far = _lerp(
+        fy,
+        _lerp(
+            fx,
+            _grad3(PERM[aa + k + 1], x, y, z - 1),
+            _grad3(PERM[ba + k + 1], x - 1, y, z - 1),
+        ),
+        _lerp(
+            fx,
+            _grad3(PERM[ab + k + 1], x, y - 1, z - 1),
+            _grad3(PERM[bb + k + 1], x - 1, y - 1, z - 1),
+        ),
+    )
+    return _lerp(fz, near, far)
+
+
+def pnoise2(
+    x: npt.ArrayLike,
+    y: npt.ArrayLike,
+    octaves: int = 1,
+    persistence: float = 0.5,
+    lacunarity: float = 2.0,
+    *,
+    hashed: bool = False,
+) -> np.ndarray:
+    """Generate 2D fractal Brownian motion perlin noise over arrays.
+
+    vectorized replacement for noise.pnoise2() - each octave is one pass over
+    the full array rather than one call per coordinate.
+
+    Args:
+        x: x coordinates (scalar or array)
+        y: y coordinates (scalar or array, broadcast against x)
+        octaves: number of noise layers (default 1)
+        persistence: amplitude multiplier per octave (default 0.5)
+        lacunarity: frequency multiplier per octave (default 2.0)
+        hashed: use murmur-hashed gradients (perlin2_hashed) instead of the
+            reference permutation table
+
+    Returns:
+        noise values in range [-1.0, 1.0] with the broadcast shape of x and y
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # with numba, every octave runs inside one compiled pass over the batch
+    if NUMBA_AVAILABLE:
+        x, y = np.broadcast_arrays(x, y)
+        flat = _pnoise2_batch(
+            np.ravel(x), np.ravel(y), octaves, persistence, lacunarity, hashed=hashed
+        )
+        return flat.reshape(x.shape)
+
+    noise = perlin2_hashed if hashed else perlin2
+    total = np.zeros(np.broadcast_shapes(x.shape, y.shape))
+    amplitude = 1.0
+    frequency = 1.0
+    max_amplitude = 0.0
+
+    for _ in range(octaves):
+        total += noise(x * frequency, y * frequency) * amplitude
+        max_amplitude += amplitude
+        amplitude *= persistence
+        frequency *= lacunarity
+
+    return total / max_amplitude
+
+
+def pnoise3(
+    x: npt.ArrayLike,
+    y: npt.ArrayLike,
+    z: npt.ArrayLike,
+    octaves: int = 1,
+    persistence: float = 0.5,
+    lacunarity: float = 2.0,
+) -> np.ndarray:
+    """Generate 3D fractal Brownian motion perlin noise over arrays.
+
+    vectorized replacement for noise.pnoise3().
+
+    Args:
+        x: x coordinates (scalar or array)
+        y: y coordinates (scalar or array)
+        z: z coordinates (scalar or array, use for time-based animation)
+        octaves: number of noise layers (default 1)
+        persistence: amplitude multiplier per octave (default 0.5)
+        lacunarity: frequency multiplier per octave (default 2.0)
+
+    Returns:
+        noise values in range [-1.0, 1.0] with the broadcast shape of x, y, z
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    z = np.asarray(z, dtype=np.float64)
+
+    # with numba, every octave runs inside one compiled pass over the batch
+    if NUMBA_AVAILABLE:
+        x, y, z = np.broadcast_arrays(x, y, z)
+        flat = _pnoise3_batch(
+            np.ravel(x), np.ravel(y), np.ravel(z), octaves, persistence, lacunarity
+        )
+        return flat.reshape(x.shape)
+
+    total = np.zeros(np.broadcast_shapes(x.shape, y.shape, z.shape))
+    amplitude = 1.0
+    frequency = 1.0
+    max_amplitude = 0.0
+
+    for _ in range(octaves):
+        total += perlin3(x * frequency, y * frequency, z * frequency) * amplitude
+        max_amplitude += amplitude
+        amplitude *= persistence
+        frequency *= lacunarity
+
+    return total / max_amplitude
+
+
+@njit(cache=True, fastmath=True)
+def _fade_scalar(t: float) -> float:
+    """Quintic smoothstep in horner form, which fastmath contracts to FMAs."""
+    return ((t * 6.0 - 15.0) * t + 10.0) * t * t * t
+
+
+@njit(cache=True, fastmath=True)
+def _lerp_scalar(t: float, a: float, b: float) -> float:
+    """Linearly interpolate between two scalars."""
+    return a + t * (b - a)
+
+
+@njit(cache=True, fastmath=True)
+def _grad2_scalar(hash_: int, x: float, y: float) -> float:
+    """Dot the hashed lattice gradient with the offset vector (x, y)."""
+    h = hash_ & 15
+    return float(GRAD3[h, 0] * x + GRAD3[h, 1] * y)
+
+
+@njit(cache=True, fastmath=True)
+def _grad3_scalar(hash_: int, x: float, y: float, z: float) -> float:
+    """Dot the hashed lattice gradient with the offset vector (x, y, z)."""
+    h = hash_ & 15
+    return float(GRAD3[h, 0] * x + GRAD3[h, 1] * y + GRAD3[h, 2] * z)
+
+
+@njit(cache=True, fastmath=True)
+def perlin2_scalar(x: float, y: float) -> float:
+    """Evaluate single-octave 2D improved perlin noise at one point.
+
+    Args:
+        x: x coordinate
+        y: y coordinate
+
+    Returns:
+        noise value in range [-1.0, 1.0]
+    """
+    x_floor = math.floor(x)
+    y_floor = math.floor(y)
+    i = int(x_floor) & 255
+    j = int(y_floor) & 255
+
+    x -= x_floor
+    y -= y_floor
+    fx = _fade_scalar(x)
+    fy = _fade_scalar(y)
+
+    a = PERM[i]
+    b = PERM[i + 1]
+
+    return _lerp_scalar(
+        fy,
+        _lerp_scalar(
+            fx,
+            _grad2_scalar(PERM[PERM[a + j]], x, y),
+            _grad2_scalar(PERM[PERM[b + j]], x - 1, y),
+        ),
+        _lerp_scalar(
+            fx,
+            _grad2_scalar(PERM[PERM[a + j + 1]], x, y - 1),
+            _grad2_scalar(PERM[PERM[b + j + 1]], x - 1, y - 1),
+        ),
+    )
+
+
+@njit(cache=True, fastmath=True)
+def _hashed_grad2_scalar(i: int, j: int, x: float, y: float) -> float:
+    """Dot the gradient hashed from lattice corner (i, j) with (x, y)."""
+    # only the low 32 bits matter, so int64 wraparound is harmless
+    h = ((i * _MURMUR_C1) ^ (j * _MURMUR_C2)) & _UINT32_MASK
+    h ^= h >> 16
+    h = (h * _MURMUR_F1) & _UINT32_MASK
+    h ^= h >> 13
+    h = (h * _MURMUR_F2) & _UINT32_MASK
+    h ^= h >> 16
+    h &= 7
+    return float(GRAD2[h, 0] * x + GRAD2[h, 1] * y)
+
+
+@njit(cache=True, fastmath=True)
+def perlin2_hashed_scalar(x: float, y: float) -> float:
+    """Evaluate single-octave hashed-gradient 2D perlin noise at one point.
+
+    Args:
+        x: x coordinate
+        y: y coordinate
+
+    Returns:
+        noise value in range [-1.0, 1.0]
+    """
+    x_floor = math.floor(x)
+    y_floor = math.floor(y)
+    i = int(x_floor)
+    j = int(y_floor)
+
+    x -= x_floor
+    y -= y_floor
+    fx = _fade_scalar(x)
+    fy = _fade_scalar(y)
+
+    return _lerp_scalar(
+        fy,
+        _lerp_scalar(
+            fx,
+            _hashed_grad2_scalar(i, j, x, y),
+            _hashed_grad2_scalar(i + 1, j, x - 1, y),
+        ),
+        _lerp_scalar(
+            fx,
+            _hashed_grad2_scalar(i, j + 1, x, y - 1),
+            _hashed_grad2_scalar(i + 1, j + 1, x - 1, y - 1),
+        ),
+    )
+
+
+@njit(cache=True, fastmath=True)
+def perlin3_scalar(x: float, y: float, z: float) -> float:
+    """Evaluate single-octave 3D improved perlin noise at one point.
+
+    compiled with numba when available so it can be called from other jitted
+    loops without crossing back into the interpreter.
+
+    Args:
+        x: x coordinate
+        y: y coordinate
+        z: z coordinate (use for time-based animation)
+
+    Returns:
+        noise value in range [-1.0, 1.0]
+    """
+    x_floor = math.floor(x)
+    y_floor = math.floor(y)
+    z_floor = math.floor(z)
+    i = int(x_floor) & 255
+    j = int(y_floor) & 255
+    k = int(z_floor) & 255
+
+    x -= x_floor
+    y -= y_floor
+    z -= z_floor
+    fx = _fade_scalar(x)
+    fy = _fade_scalar(y)
+    fz = _fade_scalar(z)
+
+    a = PERM[i]
+    b = PERM[i + 1]
+    aa = PERM[a + j]
+    ab = PERM[a + j + 1]
+    ba = PERM[b + j]
+    bb = PERM[b + j + 1]
+
+    near = _lerp_scalar(
+        fy,
+        _lerp_scalar(
+            fx,
+            _grad3_scalar(PERM[aa + k], x, y, z),
+            _grad3_scalar(PERM[ba + k], x - 1, y, z),
+        ),
+        _lerp_scalar(
+            fx,
+            _grad3_scalar(PERM[ab + k], x, y - 1, z),
+            _grad3_scalar(PERM[bb + k], x - 1, y - 1, z),
+        ),
+    )
+    far = _lerp_scalar(
+        fy,
+        _lerp_scalar(
+            fx,
+            _grad3_scalar(PERM[aa + k + 1], x, y, z - 1),
+            _grad3_scalar(PERM[ba + k + 1], x - 1, y, z - 1),
+        ),
+        _lerp_scalar(
+            fx,
+            _grad3_scalar(PERM[ab + k + 1], x, y - 1, z - 1),
+            _grad3_scalar(PERM[bb + k + 1], x - 1, y - 1, z - 1),
+        ),
+    )
+    return _lerp_scalar(fz, near, far)
+
+
+@njit(cache=True, fastmath=True)
+def pnoise2_scalar(
+    x: float,
+    y: float,
+    octaves: int = 1,
+    persistence: float = 0.5,
+    lacunarity: float = 2.0,
+) -> float:
+    """Generate 2D fractal Brownian motion perlin noise at one point.
+
+    scalar replacement for noise.pnoise2() meant to be called from jitted code.
+
+    Args:
+        x: x coordinate
+        y: y coordinate
+        octaves: number of noise layers (default 1)
+        persistence: amplitude multiplier per octave (default 0.5)
+        lacunarity: frequency multiplier per octave (default 2.0)
+
+    Returns:
+        noise value in range [-1.0, 1.0]
+    """
+    total = 0.0
+    amplitude = 1.0
+    frequency = 1.0
+    max_amplitude = 0.0
+
+    for _ in range(octaves):
+        total += perlin2_scalar(x * frequency, y * frequency) * amplitude
+        max_amplitude += amplitude
+        amplitude *= persistence
+        frequency *= lacunarity
+
+    return total / max_amplitude
+
+
+@njit(cache=True, fastmath=True)
+def pnoise3_scalar(
+    x: float,
+    y: float,
+    z: float,
+    octaves: int = 1,
+    persistence: float = 0.5,
+    lacunarity: float = 2.0,
+) -> float:
+    """Generate 3D fractal Brownian motion perlin noise at one point.
+
+    scalar replacement for noise.pnoise3() meant to be called from jitted code.
+
+    Args:
+        x: x coordinate
+        y: y coordinate
+        z: z coordinate (use for time-based animation)
+        octaves: number of noise layers (default 1)
+        persistence: amplitude multiplier per octave (default 0.5)
+        lacunarity: frequency multiplier per octave (default 2.0)
+
+    Returns:
+        noise value in range [-1.0, 1.0]
+    """
+    total = 0.0
+    amplitude = 1.0
+    frequency = 1.0
+    max_amplitude = 0.0
+
+    for _ in range(octaves):
+        total += perlin3_scalar(x * frequency, y * frequency, z * frequency) * amplitude
+        max_amplitude += amplitude
+        amplitude *= persistence
+        frequency *= lacunarity
+
+    return total / max_amplitude
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _pnoise2_batch(
+    xs: np.ndarray,
+    ys: np.ndarray,
+    octaves: int,
+    persistence: float,
+    lacunarity: float,
+    *,
+    hashed: bool,
+) -> np.ndarray:
+    """Evaluate 2D fBm over flat coordinate arrays in one compiled loop.
+
+    every coordinate is independent, so the loop is split across cpu cores.
+    """
+    out = np.empty(xs.shape[0])
+    for n in prange(xs.shape[0]):
+        total = 0.0
+        amplitude = 1.0
+        frequency = 1.0
+        max_amplitude = 0.0
+        for _ in range(octaves):
+            if hashed:
+                value = perlin2_hashed_scalar(xs[n] * frequency, ys[n] * frequency)
+            else:
+                value = perlin2_scalar(xs[n] * frequency, ys[n] * frequency)
+            total += value * amplitude
+            max_amplitude += amplitude
+            amplitude *= persistence
+            frequency *= lacunarity
+        out[n] = total / max_amplitude
+    return out
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _pnoise3_batch(
+    xs: np.ndarray,
+    ys: np.ndarray,
+    zs: np.ndarray,
+    octaves: int,
+    persistence: float,
+    lacunarity: float,
+) -> np.ndarray:
+    """Evaluate 3D fBm over flat coordinate arrays in one compiled loop.
+
+    every coordinate is independent, so the loop is split across cpu cores.
+    """
+    out = np.empty(xs.shape[0])
+    for n in prange(xs.shape[0]):
+        out[n] = pnoise3_scalar(xs[n], ys[n], zs[n], octaves, persistence, lacunarity)
+    return out
@@ -0,0 +1,109 @@
+"""Line segment batching for py5 sketches.
+
+every py5 draw call crosses from python into the jvm, so stroking hundreds of
+thousands of individual line() segments is dominated by call overhead. these
+helpers flatten traced paths into segment arrays, group the segments into
+a small number of color buckets and tessellate them into filled triangles so
+each bucket can be drawn with a single fill() + vertices() pair.
+"""
+
+import numpy as np
+
+# color channel bucket width used when grouping segments by stroke color
+DEFAULT_COLOR_QUANTUM = 16
+
+
+def paths_to_segments(
+    paths: np.ndarray, lengths: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Flatten padded per-particle paths into a list of line segments.
+
+    Args:
+        paths: (N, max_points, 2) array of path positions
+        lengths: (N,) number of valid points in each path
+
+    Returns:
+        tuple of (segments, path_ids, step_ids) where segments is a (K, 4)
+        array of (x1, y1, x2, y2) rows, path_ids gives the path each segment
+        came from and step_ids its index along that path
+    """
+    num_paths, max_points = paths.shape[:2]
+    max_segments = max_points - 1
+
+    # segment k of a path joins point k to point k + 1
+    all_segments = np.concatenate([paths[:, :-1], paths[:, 1:]], axis=2)
+    step_grid = np.arange(max_segments)
+    valid = step_grid[np.newaxis, :] < (lengths - 1)[:, np.newaxis]
+
+    segments = all_segments[valid]
+    path_ids = np.broadcast_to(
+        np.arange(num_paths)[:, np.newaxis], (num_paths, max_segments)
+    )[valid]
+    step_ids = np.broadcast_to(step_grid, (num_paths, max_segments))[valid]
+    return segments, path_ids, step_ids
+
+
+def segments_to_triangles(segments: np.ndarray, width: float) -> np.ndarray:
+    """Tessellate line segments into two triangles each.
+
+    each segment becomes a quad of the given width, without caps or joins,
+    split along its diagonal.
+
+    Args:
+        segments: (K, 4) array of (x1, y1, x2, y2) segments
+        width: line width in pixels
+
+    Returns:
+        (K * 6, 2) array of triangle vertices, three per triangle
+    """
+    start = segments[:, :2]
+    end = segments[:, 2:]
+    delta = end - start
+    length = np.hypot(delta[:, 0], delta[:, 1])[:, np.newaxis]
+
+    # offset perpendicular to each segment by half the line width, zero-length
+    # segments collapse to invisible degenerate triangles
+    scale = np.divide(width / 2, length, out=np.zeros_like(length), where=length > 0)
+    normal = np.stack([-delta[:, 1], delta[:, 0]], axis=1) * scale
+
+    corners = [start + normal, start - normal, end + normal, end - normal]
+    order = (0, 1, 2, 1, 3, 2)
+    return np.stack([corners[i] for i in order], axis=1).reshape(-1, 2)
+
+
+def group_segments_by_color(
+    segments: np.ndarray,
+    colors: np.ndarray,
+    quantum: int = DEFAULT_COLOR_QUANTUM,
+) -> list[tuple[tuple[int, int, int, int], np.ndarray]]:
+    """Group segments into buckets of similar RGBA stroke color.
+
+    each channel is clipped to [0, 255] and quantized to `quantum` wide
+    buckets; every bucket is drawn with the color at its center.
+
+    Args:
+        segments: (K, 4) array of (x1, y1, x2, y2) segments
+        colors: (K, 4) array of RGBA colors, one per segment
+        quantum: width of each color bucket per channel
+
+    Returns:
+        list of ((r, g, b, a), bucket_segments) pairs, one per non-empty bucket
+    """
+    if len(segments) == 0:
+        return []
+
+    levels = 255 // quantum + 1
+    buckets = np.clip(colors, 0, 255).astype(np.int64) // quantum
+
+    # pack the four channel buckets into a single sortable key
+    keys = ((buckets[:, 0] * levels + buckets[:, 1]) * levels + buckets[:, 2]) * levels
+    keys += buckets[:, 3]
+    order = np.argsort(keys, kind="stable")
+    boundaries = np.flatnonzero(np.diff(keys[order])) + 1
+
+    groups = []
+    for indices in np.split(order, boundaries):
+        center = np.minimum(buckets[indices[0]] * quantum + quantum // 2, 255)
+        color = (int(center[0]), int(center[1]), int(center[2]), int(center[3]))
+        groups.append((color, segments[indices]))
+    return groups
@@ -453,8 +453,9 @@ class GrassGenerator:
             # check not inside obstacle
             valid = True
             for obs in self.terrain.obstacles:
-                dist = math.sqrt((x - obs.center_x) ** 2 + (z - obs.center_z) ** 2)
-                if dist < obs.radius:
+                dx = x - obs.center_x
+                dz = z - obs.center_z
+                if dx * dx + dz * dz < obs.radius * obs.radius:
                     valid = False
                     break
 
@@ -374,11 +374,9 @@ class TerrainAnalyzer:
                 if used[j]:
                     continue
 
-                dist = np.sqrt(
-                    (obs1.center_x - obs2.center_x) ** 2
-                    + (obs1.center_z - obs2.center_z) ** 2
-                )
-                if dist < merge_distance:
+                dx = obs1.center_x - obs2.center_x
+                dz = obs1.center_z - obs2.center_z
+                if dx * dx + dz * dz < merge_distance * merge_distance:
                     group.append(obs2)
                     used[j] = True
 
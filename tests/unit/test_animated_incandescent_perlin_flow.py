@@ -1,8 +1,21 @@
 """Unit tests for animated_incandescent_perlin_flow module."""
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
 import pytest
 
-from generative_art.animated_incandescent_perlin_flow import parse_resolution
+from generative_art.animated_incandescent_perlin_flow import (
+    AnimatedIncandesceeentPerlinFlow,
+    FfmpegVideoWriter,
+    _advect_particles_jit,
+    _advect_particles_numpy,
+    advect_particles,
+)
+from generative_art.export import parse_resolution
+from generative_art.particles import build_step_color_lut
 
 
 def test_parse_resolution_with_1080p_shorthand() -> None:
@@ -189,3 +202,146 @@ def test_parse_resolution_raises_error_for_non_numeric_dimensions() -> None:
 
     # then
     assert "invalid resolution" in str(exc_info.value)
+
+
+def test_advect_particles_paths_start_at_particle_positions() -> None:
+    """test that each traced path begins at its particle's start position."""
+    # given
+    xs = np.array([100.0, 500.0, 900.0])
+    ys = np.array([200.0, 400.0, 600.0])
+
+    # when
+    paths, lengths = advect_particles(xs, ys, 0.0, 0.003, 2.0, 50, 1920.0, 1080.0)
+
+    # then
+    assert paths.shape == (3, 51, 2)
+    assert np.array_equal(paths[:, 0, 0], xs)
+    assert np.array_equal(paths[:, 0, 1], ys)
+    assert np.all(lengths >= 1)
+    assert np.all(lengths <= 51)
+
+
+def test_advect_particles_stay_on_canvas() -> None:
+    """test that traced points never leave the canvas."""
+    # given
+    rng = np.random.default_rng(42)
+    width, height = 400.0, 300.0
+    xs = rng.uniform(0, width, 200)
+    ys = rng.uniform(0, height, 200)
+
+    # when
+    paths, lengths = advect_particles(xs, ys, 0.5, 0.01, 3.0, 250, width, height)
+
+    # then
+    for path, length in zip(paths, lengths, strict=True):
+        valid = path[:length]
+        assert np.all((valid[:, 0] >= 0) & (valid[:, 0] <= width))
+        assert np.all((valid[:, 1] >= 0) & (valid[:, 1] <= height))
+
+
+def test_advect_particles_step_length_matches_flow_strength() -> None:
+    """test that every step moves a particle exactly flow_strength pixels."""
+    # given
+    xs = np.array([960.0])
+    ys = np.array([540.0])
+    flow_strength = 2.0
+
+    # when
+    paths, lengths = advect_particles(
+        xs, ys, 0.0, 0.003, flow_strength, 20, 1920.0, 1080.0
+    )
+
+    # then
+    steps = np.diff(paths[0, : lengths[0]], axis=0)
+    assert np.allclose(np.hypot(steps[:, 0], steps[:, 1]), flow_strength)
+
+
+def test_advect_particles_numpy_fallback_matches_kernel() -> None:
+    """test that the vectorized numpy path traces the same lines as the kernel."""
+    # given
+    rng = np.random.default_rng(3)
+    xs = rng.uniform(0, 640, 100)
+    ys = rng.uniform(0, 480, 100)
+    args = (0.25, 0.003, 2.0, 120, 640.0, 480.0)
+
+    # when
+    kernel_paths, kernel_lengths = _advect_particles_jit(xs, ys, *args)
+    numpy_paths, numpy_lengths = _advect_particles_numpy(xs, ys, *args)
+
+    # then
+    assert np.array_equal(kernel_lengths, numpy_lengths)
+    for i, length in enumerate(kernel_lengths):
+        assert np.allclose(kernel_paths[i, :length], numpy_paths[i, :length])
+
+
+def test_ffmpeg_video_writer_pipes_raw_rgb_frames(tmp_path: Path) -> None:
+    """test that every frame reaches the encoder's stdin as packed rgb bytes."""
+    # given - a stand-in encoder that copies stdin to its last argument
+    fake_ffmpeg = tmp_path / "ffmpeg"
+    fake_ffmpeg.write_text('#!/bin/sh\nfor last; do :; done\ncat > "$last"\n')
+    fake_ffmpeg.chmod(0o755)
+    output_file = tmp_path / "out.mp4"
+    writer = FfmpegVideoWriter(str(fake_ffmpeg), output_file)
+    frames = [np.full((4, 6, 3), value, dtype=np.uint8) for value in (10, 20)]
+
+    # when
+    for frame in frames:
+        writer.write(frame)
+    writer.close()
+
+    # then
+    assert output_file.read_bytes() == b"".join(frame.tobytes() for frame in frames)
+
+
+class FakeGraphics:
+    """records the triangle vertices drawn into an offscreen buffer."""
+
+    def __init__(self) -> None:
+        """Initialize with nothing drawn."""
+        self.vertex_count = 0
+
+    @contextmanager
+    def begin_draw(self) -> Iterator[None]:
+        """Open the buffer for drawing."""
+        yield
+
+    @contextmanager
+    def begin_shape(self, _kind: int) -> Iterator[None]:
+        """Open a shape."""
+        yield
+
+    def no_stroke(self) -> None:
+        """Disable strokes."""
+
+    def fill(self, *_color: float) -> None:
+        """Set the fill color."""
+
+    def rect(self, *_bounds: float) -> None:
+        """Draw the fade rectangle."""
+
+    def vertices(self, coordinates: np.ndarray) -> None:
+        """Count submitted vertices."""
+        self.vertex_count += len(coordinates)
+
+
+def test_draw_trails_advances_and_restarts_particles() -> None:
+    """test that trail heads move on each frame and restart at their seeds."""
+    # given
+    sketch = AnimatedIncandesceeentPerlinFlow(width=640, height=480, seed=3)
+    sketch.TRIANGLES = 9
+    sketch._step_lut = build_step_color_lut(sketch.line_steps)
+    sketch.px = np.array([320.0, -50.0], dtype=np.float32)
+    sketch.py = np.array([240.0, 240.0], dtype=np.float32)
+    sketch.head_x = sketch.px.astype(np.float64)
+    sketch.head_y = sketch.py.astype(np.float64)
+    sketch.head_age = np.array([0, 0])
+    buffer = FakeGraphics()
+
+    # when
+    sketch.draw_trails(buffer, z=0.0)
+
+    # then - the on-canvas particle moved a full trail, the other restarted
+    assert sketch.head_age.tolist() == [sketch.trail_steps, 0]
+    assert (sketch.head_x[0], sketch.head_y[0]) != (320.0, 240.0)
+    assert (sketch.head_x[1], sketch.head_y[1]) == (-50.0, 240.0)
+    assert buffer.vertex_count == sketch.trail_steps * 6
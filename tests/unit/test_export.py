@@ -0,0 +1,163 @@
+"""Unit tests for export module."""
+
+from pathlib import Path
+
+import pytest
+
+from generative_art.export import (
+    SHORTHAND_MAP,
+    export_multi_resolution,
+    get_resolution_shorthand,
+    parse_resolution,
+)
+
+
+class FakeSketch:
+    """minimal stand-in for py5.Sketch that records calls and runs frames."""
+
+    def __init__(self) -> None:
+        """Initialize at a default size."""
+        self.canvas_width = 100
+        self.canvas_height = 100
+        self.calls: list[tuple] = []
+        self.exited = False
+        self.looping = True
+        self.redraw_requested = False
+
+    def size(self, width: int, height: int) -> None:
+        """Record the requested canvas size."""
+        self.calls.append(("size", width, height))
+
+    def settings(self) -> None:
+        """Size the canvas from the sketch's own attributes."""
+        self.size(self.canvas_width, self.canvas_height)
+
+    def setup(self) -> None:
+        """Record setup at the current size, stopping the loop like a still."""
+        self.calls.append(("setup", self.canvas_width, self.canvas_height))
+        self.no_loop()
+
+    def draw(self) -> None:
+        """Record a frame at the current size."""
+        self.calls.append(("draw", self.canvas_width, self.canvas_height))
+
+    def save(self, filename: str) -> None:
+        """Record the saved file name."""
+        self.calls.append(("save", Path(filename).name))
+
+    def window_resize(self, width: int, height: int) -> None:
+        """Record a window resize."""
+        self.calls.append(("resize", width, height))
+
+    def loop(self) -> None:
+        """Keep running frames."""
+        self.looping = True
+
+    def no_loop(self) -> None:
+        """Stop running frames after the current one."""
+        self.looping = False
+
+    def redraw(self) -> None:
+        """Request another frame."""
+        self.redraw_requested = True
+
+    def exit_sketch(self) -> None:
+        """Stop running frames."""
+        self.exited = True
+
+    def run_sketch(self, *, block: bool | None = None) -> None:  # noqa: ARG002
+        """Run settings, setup, then frames while looping until exit.
+
+        like processing, a redraw requested during draw() is cleared as soon
+        as draw() returns, so it never produces another frame.
+        """
+        self.settings()
+        self.setup()
+        while not self.exited:
+            self.draw()
+            self.redraw_requested = False
+            if not self.looping:
+                break
+
+
+def test_get_resolution_shorthand_for_common_resolution() -> None:
+    """test that common resolutions use their shorthand name."""
+    # given
+    width, height = 1440, 2560
+
+    # when
+    result = get_resolution_shorthand(width, height)
+
+    # then
+    assert result == "1440p_portrait"
+
+
+def test_get_resolution_shorthand_for_custom_resolution() -> None:
+    """test that other resolutions fall back to WIDTHxHEIGHT."""
+    # given
+    width, height = 1000, 750
+
+    # when
+    result = get_resolution_shorthand(width, height)
+
+    # then
+    assert result == "1000x750"
+
+
+def test_get_resolution_shorthand_round_trips_through_parse() -> None:
+    """test that every shorthand parses back to its resolution."""
+    # given
+    resolutions = [(3840, 2160), (2560, 1440), (1920, 1080), (1280, 720), (800, 600)]
+
+    # when / then
+    for width, height in resolutions:
+        shorthand = get_resolution_shorthand(width, height)
+        assert parse_resolution(shorthand) == (width, height)
+
+
+def test_parse_resolution_rejects_extra_dimensions() -> None:
+    """test that only exactly two dimensions are accepted."""
+    # given
+    resolution_str = "1920x1080x2"
+
+    # when / then
+    with pytest.raises(ValueError, match="invalid resolution"):
+        parse_resolution(resolution_str)
+
+
+def test_shorthand_map_is_read_only() -> None:
+    """test that the shared shorthand map cannot be modified."""
+    # when / then
+    with pytest.raises(TypeError):
+        SHORTHAND_MAP["8k"] = (7680, 4320)  # type: ignore[index]
+
+
+def test_export_multi_resolution_renders_every_size_in_one_sketch(
+    tmp_path: Path,
+) -> None:
+    """test that one sketch run renders, saves and resizes for each resolution."""
+    # given
+    resolutions = {"small": (40, 30), "large": (80, 60)}
+    sketches: list[FakeSketch] = []
+
+    class RecordingSketch(FakeSketch):
+        def __init__(self) -> None:
+            super().__init__()
+            sketches.append(self)
+
+    # when
+    export_multi_resolution(RecordingSketch, "demo", str(tmp_path), resolutions)
+
+    # then
+    assert len(sketches) == 1
+    assert sketches[0].calls == [
+        ("size", 40, 30),
+        ("setup", 40, 30),
+        ("draw", 40, 30),
+        ("save", "demo_small.png"),
+        ("resize", 80, 60),
+        ("setup", 80, 60),
+        ("draw", 80, 60),
+        ("save", "demo_large.png"),
+    ]
+    assert sketches[0].exited
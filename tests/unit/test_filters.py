@@ -0,0 +1,87 @@
+"""Unit tests for filters module."""
+
+import numpy as np
+import pytest
+
+from generative_art import filters
+from generative_art.filters import blur, blur_kernel
+
+
+class TestBlurKernel:
+    """tests for blur_kernel function."""
+
+    def test_blur_kernel_matches_processing_radius_one(self) -> None:
+        """test that radius 1 gives processing's quadratic five-tap kernel."""
+        # when
+        kernel = blur_kernel(1)
+
+        # then
+        assert kernel.tolist() == [1, 4, 9, 4, 1]
+
+    def test_blur_kernel_has_at_least_one_tap(self) -> None:
+        """test that tiny radii still produce an identity kernel."""
+        # when
+        kernel = blur_kernel(0.1)
+
+        # then
+        assert kernel.tolist() == [1]
+
+
+class TestBlur:
+    """tests for blur function."""
+
+    def test_blur_leaves_flat_image_unchanged(self) -> None:
+        """test that blurring a single color keeps every pixel the same."""
+        # given
+        image = np.full((12, 17, 3), (200, 90, 7), dtype=np.uint8)
+
+        # when
+        result = blur(image, radius=2)
+
+        # then
+        assert result.dtype == np.uint8
+        assert np.array_equal(result, image)
+
+    def test_blur_spreads_single_pixel_with_integer_weights(self) -> None:
+        """test that a lone bright pixel spreads by the kernel, rounding down."""
+        # given
+        image = np.zeros((9, 9, 1), dtype=np.uint8)
+        image[4, 4] = 190
+
+        # when
+        result = blur(image, radius=1)
+
+        # then
+        # rows give 190 * [1, 4, 9, 4, 1] // 19, columns repeat the weighting
+        row = [10, 40, 90, 40, 10]
+        expected = [[value * tap // 19 for value in row] for tap in (1, 4, 9, 4, 1)]
+        assert result[2:7, 2:7, 0].tolist() == expected
+
+    def test_blur_renormalizes_at_image_edges(self) -> None:
+        """test that taps outside the image are left out of the weighting."""
+        # given
+        image = np.zeros((1, 3, 1), dtype=np.uint8)
+        image[0, 0] = 140
+
+        # when
+        result = blur(image, radius=1)
+
+        # then
+        # the end pixels only see three taps and the middle one three of five
+        assert result[0, :, 0].tolist() == [140 * 9 // 14, 140 * 4 // 17, 140 // 14]
+
+    def test_blur_compiled_and_numpy_paths_agree(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """test that the compiled and numpy blurs produce identical pixels."""
+        # given
+        rng = np.random.default_rng(41)
+        image = rng.integers(0, 256, (40, 60, 3), dtype=np.uint8)
+        compiled = blur(image, radius=2)
+
+        # when
+        monkeypatch.setattr(filters, "NUMBA_AVAILABLE", False)
+        vectorized = blur(image, radius=2)
+
+        # then
+        assert np.array_equal(compiled, vectorized)
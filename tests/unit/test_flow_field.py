@@ -1,7 +1,15 @@
 """Unit tests for flow_field module."""
 
 import math
+from collections.abc import Iterator
+from dataclasses import FrozenInstanceError, replace
+from functools import lru_cache
 
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from generative_art import flow_field as flow_field_module
 from generative_art.flow_field import (
     ClusteringConfig,
     FlowField,
@@ -17,6 +25,59 @@ from generative_art.flow_field import (
 CONTINUITY_THRESHOLD = 1.2  # max radians between adjacent samples (~69 deg)
 TIME_CONTINUITY_THRESHOLD = 0.5  # max radians between time steps
 
+# shared obstacles, built once - only pass these to tests that never mutate them
+_OBS_CENTER_50 = Obstacle(x=500, y=500, radius=50)
+_OBS_CENTER_50_150 = Obstacle(x=500, y=500, radius=50, influence_radius=150)
+_OBS_100_100_50_150 = Obstacle(x=100, y=100, radius=50, influence_radius=150)
+
+
+def _angle_diff(a: npt.ArrayLike, b: npt.ArrayLike) -> np.ndarray:
+    """Unsigned difference between angles in [-pi, pi], wrapping around at pi."""
+    return np.pi - np.abs(np.abs(np.subtract(a, b)) - np.pi)
+
+
+def _squared_distances(
+    points: list[tuple[float, float]], x: float, y: float
+) -> np.ndarray:
+    """Squared distance from (x, y) to each point, to compare against radius**2."""
+    dx, dy = (np.asarray(points, dtype=np.float64) - (x, y)).T
+    return dx * dx + dy * dy
+
+
+class _CachedFlowField(FlowField):
+    """Default flow field that memoizes its base noise samples.
+
+    with a fixed config and noise seed the base flow depends only on position
+    and time, so sampling a point again is a cache lookup.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with default config and an empty cache."""
+        super().__init__()
+        self._cached_base_flow = lru_cache(maxsize=4096)(super().get_base_flow)
+
+    def get_base_flow(
+        self, x: float, y: float, time: float = 0.0
+    ) -> tuple[float, float]:
+        """Get the base flow vector, sampling the noise once per position."""
+        return self._cached_base_flow(x, y, time)
+
+
+@pytest.fixture(scope="module")
+def default_flow_field() -> FlowField:
+    """Shared default flow field for tests that only sample it."""
+    return _CachedFlowField()
+
+
+@pytest.fixture
+def flow_field_with_obstacle(default_flow_field: FlowField) -> Iterator[FlowField]:
+    """Shared flow field with an obstacle at (100, 100), removed afterwards."""
+    default_flow_field.add_obstacle(_OBS_100_100_50_150)
+    try:
+        yield default_flow_field
+    finally:
+        default_flow_field.clear_obstacles()
+
 
 class TestObstacle:
     """Tests for Obstacle dataclass."""
@@ -45,6 +106,25 @@ class TestObstacle:
         # then
         assert obstacle.strength == 1.0
 
+    def test_obstacle_caches_squared_radii(self) -> None:
+        """test that squared radii are computed once at construction."""
+        # given
+        obstacle = Obstacle(x=100, y=100, radius=40)
+
+        # then
+        assert obstacle.radius_sq == 1600.0
+        assert obstacle.influence_radius_sq == 10000.0
+
+    def test_obstacle_is_frozen_and_hashable(self) -> None:
+        """test that obstacles cannot be edited in place and can be hashed."""
+        # given
+        obstacle = Obstacle(x=100, y=100, radius=40)
+
+        # when / then
+        with pytest.raises(FrozenInstanceError):
+            obstacle.radius = 50  # type: ignore[misc]
+        assert hash(obstacle) == hash(Obstacle(x=100, y=100, radius=40))
+
 
 class TestFlowFieldConfig:
     """Tests for FlowFieldConfig dataclass."""
@@ -79,6 +159,16 @@ class TestFlowFieldConfig:
         assert config.persistence == 0.6
         assert config.time_scale == 0.02
 
+    def test_config_is_frozen(self) -> None:
+        """test that a config is replaced rather than edited in place."""
+        # given
+        config = FlowFieldConfig()
+
+        # when / then
+        with pytest.raises(FrozenInstanceError):
+            config.flow_strength = 5.0  # type: ignore[misc]
+        assert replace(config, flow_strength=5.0).flow_strength == 5.0
+
 
 class TestFlowField:
     """Tests for FlowField class."""
@@ -129,13 +219,10 @@ class TestFlowField:
         # then
         assert len(flow_field.obstacles) == 0
 
-    def test_get_base_flow_returns_vector(self) -> None:
+    def test_get_base_flow_returns_vector(self, default_flow_field: FlowField) -> None:
         """test that base flow returns a 2d vector."""
-        # given
-        flow_field = FlowField()
-
         # when
-        vx, vy = flow_field.get_base_flow(100, 100)
+        vx, vy = default_flow_field.get_base_flow(100, 100)
 
         # then
         assert isinstance(vx, (int, float))
@@ -149,41 +236,137 @@ class TestFlowField:
 
         # when
         vx, vy = flow_field.get_base_flow(100, 100)
-        magnitude = math.sqrt(vx**2 + vy**2)
+        magnitude = math.hypot(vx, vy)
 
         # then - magnitude should be close to flow_strength
         assert 0 < magnitude <= config.flow_strength * 1.1
 
-    def test_get_flow_deflects_near_obstacle(self) -> None:
+    def test_get_flow_deflects_near_obstacle(
+        self, flow_field_with_obstacle: FlowField
+    ) -> None:
         """test that flow is deflected when near obstacle."""
-        # given
-        flow_field = FlowField()
-        obstacle = Obstacle(x=100, y=100, radius=50, influence_radius=150)
-        flow_field.add_obstacle(obstacle)
+        # given - the fixture's obstacle at (100, 100)
 
-        # when - get flow just outside obstacle
-        flow_without_obstacle = FlowField().get_flow(120, 100)
-        flow_with_obstacle = flow_field.get_flow(120, 100)
+        # when - get flow just outside obstacle, without it that is the base flow
+        flow_without_obstacle = flow_field_with_obstacle.get_base_flow(120, 100)
+        flow_with_obstacle = flow_field_with_obstacle.get_flow(120, 100)
 
         # then - flows should differ due to deflection
         # (we can't predict exact values due to noise, but they should be different)
         assert flow_without_obstacle != flow_with_obstacle
 
-    def test_get_flow_unchanged_far_from_obstacle(self) -> None:
+    def test_get_flow_unchanged_far_from_obstacle(
+        self, flow_field_with_obstacle: FlowField
+    ) -> None:
         """test that flow is unchanged when far from obstacle."""
-        # given
-        flow_field = FlowField()
-        obstacle = Obstacle(x=100, y=100, radius=50, influence_radius=150)
-        flow_field.add_obstacle(obstacle)
+        # given - the fixture's obstacle at (100, 100)
 
-        # when - get flow far from obstacle
+        # when - get flow far from obstacle, without it that is the base flow
         far_x, far_y = 500, 500
-        flow_without_obstacle = FlowField().get_flow(far_x, far_y)
-        flow_with_obstacle = flow_field.get_flow(far_x, far_y)
+        flow_without_obstacle = flow_field_with_obstacle.get_base_flow(far_x, far_y)
+        flow_with_obstacle = flow_field_with_obstacle.get_flow(far_x, far_y)
 
         # then - flows should be identical
         assert flow_without_obstacle == flow_with_obstacle
 
+    def test_get_flow_follows_edits_to_obstacle_list(self) -> None:
+        """test that obstacles added or removed through the list take effect."""
+        # given
+        flow_field = FlowField()
+        base = flow_field.get_flow(120, 100)
+
+        # when
+        flow_field.obstacles.append(_OBS_100_100_50_150)
+        deflected = flow_field.get_flow(120, 100)
+        flow_field.obstacles.remove(_OBS_100_100_50_150)
+        restored = flow_field.get_flow(120, 100)
+
+        # then
+        assert deflected != base
+        assert restored == base
+
+    def test_get_flow_batch_numpy_path_matches_compiled(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """test that masked numpy deflection agrees with the compiled loop."""
+        # given
+        flow_field = FlowField()
+        flow_field.add_obstacle(_OBS_100_100_50_150)
+        flow_field.add_obstacle(Obstacle(x=160, y=60, radius=20, strength=0.5))
+        rng = np.random.default_rng(12)
+        xs = np.concatenate([rng.uniform(0, 300, 400), [100.0, 160.0, 150.0]])
+        ys = np.concatenate([rng.uniform(0, 300, 400), [100.0, 60.0, 100.0]])
+        compiled = flow_field.get_flow_batch(xs, ys)
+
+        # when
+        monkeypatch.setattr(flow_field_module, "NUMBA_AVAILABLE", False)
+        masked = flow_field.get_flow_batch(xs, ys)
+
+        # then
+        assert np.allclose(compiled, masked)
+
+    def test_get_flow_batch_numpy_path_skips_distant_obstacles(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """test that obstacles out of reach of a batch leave it unchanged."""
+        # given
+        flow_field = FlowField()
+        flow_field.add_obstacle(_OBS_100_100_50_150)
+        flow_field.add_obstacle(Obstacle(x=900, y=900, radius=40))
+        rng = np.random.default_rng(4)
+        xs = rng.uniform(50, 250, 300)
+        ys = rng.uniform(50, 250, 300)
+        compiled = flow_field.get_flow_batch(xs, ys)
+
+        # when
+        monkeypatch.setattr(flow_field_module, "NUMBA_AVAILABLE", False)
+        masked = flow_field.get_flow_batch(xs, ys)
+
+        # then
+        assert np.allclose(compiled, masked)
+        assert not np.allclose(masked, flow_field.get_base_flow_array(xs, ys))
+
+    def test_get_flow_pushes_out_of_obstacle_wider_than_its_influence(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """test that the outward push applies past an influence radius under radius."""
+        # given
+        flow_field = FlowField(
+            obstacles=[Obstacle(x=100, y=100, radius=50, influence_radius=20)]
+        )
+        base = flow_field.get_base_flow(130, 100)
+
+        # when
+        compiled = flow_field.get_flow(130, 100)
+        compiled_batch = flow_field.get_flow_batch([130.0], [100.0])
+        monkeypatch.setattr(flow_field_module, "NUMBA_AVAILABLE", False)
+        python = flow_field.get_flow(130, 100)
+        masked_batch = flow_field.get_flow_batch([130.0], [100.0])
+
+        # then - pushed toward +x, away from the center
+        assert compiled[0] > base[0]
+        assert np.allclose(compiled, python)
+        assert np.allclose(compiled, np.ravel(compiled_batch))
+        assert np.allclose(compiled, np.ravel(masked_batch))
+
+    def test_get_flow_python_path_matches_compiled(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """test that the per-obstacle python loop and the compiled loop agree."""
+        # given
+        flow_field = FlowField()
+        flow_field.add_obstacle(_OBS_100_100_50_150)
+        flow_field.add_obstacle(Obstacle(x=160, y=60, radius=20, strength=0.5))
+        points = [(100, 100), (120, 100), (150, 150), (165, 60), (400, 400)]
+        compiled = [flow_field.get_flow(x, y) for x, y in points]
+
+        # when
+        monkeypatch.setattr(flow_field_module, "NUMBA_AVAILABLE", False)
+        python = [flow_field.get_flow(x, y) for x, y in points]
+
+        # then
+        assert np.allclose(compiled, python)
+
     def test_get_flow_inside_obstacle_pushes_outward(self) -> None:
         """test that flow inside obstacle pushes outward."""
         # given
@@ -197,25 +380,155 @@ class TestFlowField:
         # then - should have significant rightward component (pushing out)
         assert vx > 0
 
-    def test_get_flow_angle_returns_radians(self) -> None:
+    def test_get_flow_angle_returns_radians(
+        self, default_flow_field: FlowField
+    ) -> None:
         """test that flow angle is in valid radian range."""
+        # when
+        angle = default_flow_field.get_flow_angle(100, 100)
+
+        # then
+        assert -math.pi <= angle <= math.pi
+
+    def test_get_flow_angle_array_matches_scalar_angles(self) -> None:
+        """test that batched angles equal per-point angles, obstacles included."""
         # given
         flow_field = FlowField()
+        flow_field.add_obstacle(_OBS_100_100_50_150)
+        flow_field.add_obstacle(Obstacle(x=300, y=200, radius=30, strength=0.5))
+        rng = np.random.default_rng(8)
+        xs = np.concatenate([rng.uniform(0, 400, 300), [100.0, 110.0]])
+        ys = np.concatenate([rng.uniform(0, 400, 300), [100.0, 100.0]])
 
         # when
-        angle = flow_field.get_flow_angle(100, 100)
+        batched = flow_field.get_flow_angle_array(xs, ys, time=2.0)
+        scalar = [
+            flow_field.get_flow_angle(x, y, time=2.0)
+            for x, y in zip(xs, ys, strict=True)
+        ]
 
         # then
-        assert -math.pi <= angle <= math.pi
+        assert batched.shape == (302,)
+        assert np.allclose(batched, scalar)
 
-    def test_get_flow_with_time_evolution(self) -> None:
-        """test that flow changes over time."""
+    def test_get_flow_batch_matches_scalar_flow(self) -> None:
+        """test that batched flow vectors equal per-point vectors on a grid."""
+        # given
+        flow_field = FlowField()
+        flow_field.add_obstacle(_OBS_100_100_50_150)
+        flow_field.add_obstacle(Obstacle(x=160, y=60, radius=20, strength=0.5))
+        xs, ys = np.meshgrid(np.linspace(0, 200, 21), np.linspace(0, 200, 11))
+
+        # when
+        vx, vy = flow_field.get_flow_batch(xs, ys)
+
+        # then
+        assert vx.shape == vy.shape == (11, 21)
+        scalar = np.array(
+            [
+                flow_field.get_flow(x, y)
+                for x, y in zip(xs.ravel(), ys.ravel(), strict=True)
+            ]
+        )
+        assert np.allclose(vx.ravel(), scalar[:, 0])
+        assert np.allclose(vy.ravel(), scalar[:, 1])
+
+    def test_precompute_interpolates_baked_flow(self) -> None:
+        """test that baked lookups hit node values exactly and stay close between."""
+        # given
+        flow_field = FlowField(obstacles=[_OBS_100_100_50_150])
+        xs = np.linspace(0, 320, 41)
+        ys = np.full_like(xs, 36.0)
+        exact_node = flow_field.get_flow(40, 80)
+        exact_vx, exact_vy = flow_field.get_flow_batch(xs, ys)
+
+        # when
+        flow_field.precompute(320, 240, tile=8)
+        baked_node = flow_field.get_flow(40, 80)
+        vx, vy = flow_field.get_flow_batch(xs, ys)
+
+        # then - float32 nodes, and at most a tile of interpolation between
+        assert np.allclose(baked_node, exact_node, atol=1e-6)
+        assert np.abs(vx - exact_vx).max() < 0.5
+        assert np.abs(vy - exact_vy).max() < 0.5
+
+    def test_precompute_is_dropped_when_obstacles_change(self) -> None:
+        """test that changing obstacles or time falls back to exact flow."""
+        # given
+        flow_field = FlowField()
+        flow_field.precompute(200, 200, tile=20)
+        point = (130.0, 110.0)
+
+        # when
+        later = flow_field.get_flow(*point, time=5.0)
+        flow_field.add_obstacle(_OBS_100_100_50_150)
+        deflected = flow_field.get_flow(*point)
+
+        # then
+        assert later == FlowField().get_flow(*point, time=5.0)
+        assert deflected == FlowField(obstacles=[_OBS_100_100_50_150]).get_flow(*point)
+
+    def test_precompute_is_dropped_when_config_is_replaced(self) -> None:
+        """test that replacing the config falls back to exact flow."""
+        # given
+        flow_field = FlowField()
+        flow_field.precompute(200, 200, tile=20)
+        point = (130.0, 110.0)
+
+        # when
+        flow_field.config = replace(flow_field.config, flow_strength=5.0)
+        flow = flow_field.get_flow(*point)
+        vx, vy = flow_field.get_flow_batch([point[0]], [point[1]])
+
+        # then
+        expected = FlowField(replace(FlowFieldConfig(), flow_strength=5.0))
+        assert flow == expected.get_flow(*point)
+        assert (vx[0], vy[0]) == flow
+
+    def test_precompute_rejects_non_positive_tile(self) -> None:
+        """test that a zero tile size raises ValueError."""
         # given
         flow_field = FlowField()
 
+        # when / then
+        with pytest.raises(ValueError, match="must be positive"):
+            flow_field.precompute(100, 100, tile=0)
+
+    def test_cache_base_flow_snaps_to_whole_pixels(self) -> None:
+        """test that cached samples equal the exact flow at the nearest pixel."""
+        # given
+        flow_field = FlowField()
+        exact = flow_field.get_base_flow(120, 45, time=0.5)
+        flow_field.cache_base_flow()
+
+        # when
+        first = flow_field.get_base_flow(120.3, 44.8, time=0.5)
+        second = flow_field.get_base_flow(119.6, 45.2, time=0.5)
+
+        # then
+        assert first == exact
+        assert second == exact
+
+    def test_cache_base_flow_is_dropped_when_config_changes(self) -> None:
+        """test that replacing the config stops serving cached samples."""
+        # given
+        flow_field = FlowField()
+        flow_field.cache_base_flow()
+        flow_field.get_base_flow(120.3, 44.8)
+
         # when
-        flow_t0 = flow_field.get_flow(100, 100, time=0.0)
-        flow_t100 = flow_field.get_flow(100, 100, time=100.0)
+        flow_field.config = FlowFieldConfig(flow_strength=5.0)
+        vx, vy = flow_field.get_base_flow(120.3, 44.8)
+
+        # then
+        assert math.hypot(vx, vy) == pytest.approx(5.0)
+        assert (vx, vy) != flow_field.get_base_flow(120, 45)
+
+    def test_get_flow_with_time_evolution(self, default_flow_field: FlowField) -> None:
+        """test that flow changes over time."""
+        # when
+        flow_t0 = default_flow_field.get_flow(100, 100, time=0.0)
+        flow_t100 = default_flow_field.get_flow(100, 100, time=100.0)
 
         # then - flows should differ at different times
         assert flow_t0 != flow_t100
@@ -254,10 +567,9 @@ class TestPointClusterer:
         """test that obstacles can be added to clusterer."""
         # given
         clusterer = PointClusterer(width=1000, height=1000)
-        obstacle = Obstacle(x=500, y=500, radius=50)
 
         # when
-        clusterer.add_obstacle(obstacle)
+        clusterer.add_obstacle(_OBS_CENTER_50)
 
         # then
         assert len(clusterer.obstacles) == 1
@@ -277,7 +589,7 @@ class TestPointClusterer:
         """test that density is 0 inside obstacle."""
         # given
         clusterer = PointClusterer(width=1000, height=1000)
-        clusterer.add_obstacle(Obstacle(x=500, y=500, radius=50))
+        clusterer.add_obstacle(_OBS_CENTER_50)
 
         # when
         density = clusterer.get_density_at(500, 500)  # center of obstacle
@@ -293,7 +605,7 @@ class TestPointClusterer:
             edge_offset=10.0,
         )
         clusterer = PointClusterer(width=1000, height=1000, config=config)
-        clusterer.add_obstacle(Obstacle(x=500, y=500, radius=50, influence_radius=150))
+        clusterer.add_obstacle(_OBS_CENTER_50_150)
 
         # when
         density_near = clusterer.get_density_at(560, 500)  # 10px from edge
@@ -317,7 +629,7 @@ class TestPointClusterer:
         """test that points inside obstacles are invalid."""
         # given
         clusterer = PointClusterer(width=1000, height=1000)
-        clusterer.add_obstacle(Obstacle(x=500, y=500, radius=50))
+        clusterer.add_obstacle(_OBS_CENTER_50)
 
         # then
         assert not clusterer.is_valid_point(500, 500, [])
@@ -333,6 +645,18 @@ class TestPointClusterer:
         assert not clusterer.is_valid_point(510, 500, existing)  # 10px away
         assert clusterer.is_valid_point(530, 500, existing)  # 30px away
 
+    def test_is_valid_point_accepts_point_array(self) -> None:
+        """test that existing points may be passed as an (N, 2) array."""
+        # given
+        config = ClusteringConfig(min_distance=20.0)
+        clusterer = PointClusterer(width=1000, height=1000, config=config)
+        existing = np.array([[100.0, 100.0], [500.0, 500.0]])
+
+        # then
+        assert not clusterer.is_valid_point(500, 515, existing)  # 15px away
+        assert clusterer.is_valid_point(500, 520, existing)  # exactly min distance
+        assert clusterer.is_valid_point(500, 500, np.empty((0, 2)))
+
     def test_generate_points_returns_requested_count(self) -> None:
         """test that generate_points returns approximately the requested count."""
         # given
@@ -345,6 +669,22 @@ class TestPointClusterer:
         assert len(points) > 50  # should get reasonable number
         assert len(points) <= 100
 
+    def test_generate_points_keeps_min_distance(self) -> None:
+        """test that accepted points are never closer than min_distance."""
+        # given
+        config = ClusteringConfig(min_distance=12.0)
+        clusterer = PointClusterer(width=300, height=200, config=config, seed=9)
+
+        # when
+        points = clusterer.generate_points(300)
+
+        # then
+        pts = np.asarray(points)
+        gaps = ((pts[:, np.newaxis] - pts[np.newaxis]) ** 2).sum(axis=2)
+        np.fill_diagonal(gaps, np.inf)
+        assert len(points) > 100
+        assert gaps.min() >= config.min_distance**2
+
     def test_generate_points_avoids_obstacles(self) -> None:
         """test that generated points are not inside obstacles."""
         # given
@@ -356,9 +696,92 @@ class TestPointClusterer:
         points = clusterer.generate_points(200)
 
         # then
-        for x, y in points:
-            dist = math.sqrt((x - 500) ** 2 + (y - 500) ** 2)
-            assert dist >= obstacle.radius
+        sqdist = _squared_distances(points, 500, 500)
+        assert (sqdist >= obstacle.radius**2).all()
+
+    def test_get_density_python_path_matches_compiled(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """test that the per-obstacle python loop and the compiled loop agree."""
+        # given
+        clusterer = PointClusterer(width=1000, height=1000)
+        clusterer.add_obstacle(_OBS_CENTER_50_150)
+        clusterer.add_obstacle(Obstacle(x=200, y=700, radius=80))
+        points = [(500, 500), (560, 500), (620, 540), (200, 800), (900, 100)]
+        compiled = [clusterer.get_density_at(x, y) for x, y in points]
+
+        # when
+        monkeypatch.setattr(flow_field_module, "NUMBA_AVAILABLE", False)
+        python = [clusterer.get_density_at(x, y) for x, y in points]
+
+        # then
+        assert np.allclose(compiled, python)
+
+    def test_get_density_array_is_zero_inside_obstacle_wider_than_its_influence(
+        self,
+    ) -> None:
+        """test that points inside an obstacle count even past its influence radius."""
+        # given
+        clusterer = PointClusterer(width=1000, height=1000)
+        clusterer.add_obstacle(Obstacle(x=500, y=500, radius=50, influence_radius=20))
+        xs = np.array([525.0, 530.0])
+        ys = np.array([500.0, 500.0])
+
+        # when
+        density = clusterer.get_density_array(xs, ys)
+
+        # then
+        assert (density == 0.0).all()
+
+    def test_get_density_array_matches_scalar_density(self) -> None:
+        """test that batched densities equal per-point densities."""
+        # given
+        clusterer = PointClusterer(width=1000, height=1000)
+        clusterer.add_obstacle(_OBS_CENTER_50_150)
+        clusterer.add_obstacle(Obstacle(x=200, y=700, radius=80))
+        rng = np.random.default_rng(6)
+        xs = rng.uniform(0, 1000, 400)
+        ys = rng.uniform(0, 1000, 400)
+
+        # when
+        batched = clusterer.get_density_array(xs, ys)
+        scalar = [clusterer.get_density_at(x, y) for x, y in zip(xs, ys, strict=True)]
+
+        # then
+        assert np.allclose(batched, scalar)
+        assert (batched == 0.0).any()
+
+    def test_generate_points_bridson_keeps_points_apart(self) -> None:
+        """test that bridson points respect min distance and avoid obstacles."""
+        # given
+        config = ClusteringConfig(min_distance=8.0)
+        clusterer = PointClusterer(width=400, height=300, config=config, seed=1)
+        obstacle = Obstacle(x=200, y=150, radius=40)
+        clusterer.add_obstacle(obstacle)
+
+        # when
+        points = clusterer.generate_points_bridson(500)
+
+        # then
+        pts = np.asarray(points)
+        gaps = ((pts[:, np.newaxis] - pts[np.newaxis]) ** 2).sum(axis=2)
+        np.fill_diagonal(gaps, np.inf)
+        assert 400 <= len(points) <= 500
+        assert gaps.min() >= config.min_distance**2
+        assert (_squared_distances(points, 200, 150) >= obstacle.radius**2).all()
+        assert ((pts >= 0) & (pts < [400, 300])).all()
+
+    def test_generate_points_bridson_returns_empty_for_zero_points(self) -> None:
+        """test that asking bridson sampling for no points yields none."""
+        # given
+        clusterer = PointClusterer(width=400, height=300, seed=1)
+        clusterer.add_obstacle(Obstacle(x=200, y=150, radius=40))
+
+        # when
+        points = clusterer.generate_points_bridson(0)
+
+        # then
+        assert points == []
 
     def test_generate_points_grid_based_returns_points(self) -> None:
         """test that grid-based generation returns points."""
@@ -374,10 +797,26 @@ class TestPointClusterer:
             assert 0 <= x <= 1000
             assert 0 <= y <= 1000
 
+    def test_generate_points_grid_based_avoids_obstacles(self) -> None:
+        """test that neither grid nor edge-ring points land inside obstacles."""
+        # given
+        clusterer = PointClusterer(width=600, height=400, seed=8)
+        clusterer.add_obstacle(Obstacle(x=300, y=200, radius=60))
+        clusterer.add_obstacle(Obstacle(x=330, y=240, radius=40))
+
+        # when
+        points = clusterer.generate_points_grid_based(800)
+
+        # then
+        assert len(points) > 800
+        for obstacle in clusterer.obstacles:
+            sqdist = _squared_distances(points, obstacle.x, obstacle.y)
+            assert (sqdist >= obstacle.radius_sq).all()
+
     def test_generate_points_clusters_around_obstacle(self) -> None:
         """test that generated points cluster more densely near obstacles.
 
-        uses rejection sampling (not grid-based) which respects density better.
+        uses bridson sampling (not grid-based) which respects density better.
         """
         # given
         config = ClusteringConfig(
@@ -390,19 +829,15 @@ class TestPointClusterer:
         obstacle = Obstacle(x=500, y=500, radius=50, influence_radius=200)
         clusterer.add_obstacle(obstacle)
 
-        # when - use rejection sampling which better respects density
-        points = clusterer.generate_points(1000)
+        # when - use bridson sampling which better respects density
+        points = clusterer.generate_points_bridson(1000)
 
         # then - count points in different regions
-        near_obstacle_count = 0
-        far_from_obstacle_count = 0
-
-        for x, y in points:
-            dist = math.sqrt((x - 500) ** 2 + (y - 500) ** 2)
-            if 50 < dist < 200:  # in influence zone
-                near_obstacle_count += 1
-            elif dist > 400:
-                far_from_obstacle_count += 1
+        sqdist = _squared_distances(points, 500, 500)
+        r1sq, r2sq, r3sq = 50**2, 200**2, 400**2
+        # in influence zone, or well clear of it
+        near_obstacle_count = int(((sqdist > r1sq) & (sqdist < r2sq)).sum())
+        far_from_obstacle_count = int((sqdist > r3sq).sum())
 
         # normalize by area
         near_area = math.pi * (200**2 - 50**2)
@@ -412,7 +847,7 @@ class TestPointClusterer:
         far_density = far_from_obstacle_count / far_area if far_area > 0 else 0
 
         # density near obstacle should be higher (or at least have points there)
-        # note: rejection sampling is probabilistic, so we just check we got points
+        # note: sampling is probabilistic, so we just check we got points
         assert len(points) > 100  # should have generated reasonable number
         assert near_obstacle_count > 0  # should have some points near obstacle
 
@@ -427,7 +862,7 @@ class TestPointClusterer:
         points2 = clusterer2.generate_points_grid_based(50)
 
         # then
-        assert points1 == points2
+        assert np.array_equal(np.asarray(points1), np.asarray(points2))
 
 
 class TestConvenienceFunctions:
@@ -482,44 +917,29 @@ class TestConvenienceFunctions:
         # then
         assert len(points) > 0
         # check no points inside obstacle
-        for x, y in points:
-            dist = math.sqrt((x - 500) ** 2 + (y - 500) ** 2)
-            assert dist >= 50
+        assert (_squared_distances(points, 500, 500) >= 50**2).all()
 
 
 class TestFlowFieldContinuity:
     """Tests for flow field continuity and organic patterns."""
 
-    def test_base_flow_continuity(self) -> None:
+    def test_base_flow_continuity(self, default_flow_field: FlowField) -> None:
         """test that nearby points have similar flow vectors (spatial continuity)."""
         # given
-        flow_field = FlowField()
         grid_size = 10
         step = 10.0  # spacing between samples
+        coords = np.arange(grid_size - 1) * step
+        xs, ys = (axis.ravel() for axis in np.meshgrid(coords, coords))
 
-        # when - sample a grid of points and compute angle differences
-        max_angle_diff = 0.0
-        for i in range(grid_size - 1):
-            for j in range(grid_size - 1):
-                x = i * step
-                y = j * step
-
-                # get angles at current and adjacent points
-                angle_current = flow_field.get_flow_angle(x, y)
-                angle_right = flow_field.get_flow_angle(x + step, y)
-                angle_down = flow_field.get_flow_angle(x, y + step)
-
-                # compute angle differences (accounting for wrap-around)
-                diff_right = abs(angle_current - angle_right)
-                diff_down = abs(angle_current - angle_down)
-
-                # handle wrap-around at +/- pi
-                if diff_right > math.pi:
-                    diff_right = 2 * math.pi - diff_right
-                if diff_down > math.pi:
-                    diff_down = 2 * math.pi - diff_down
+        # when - sample a grid of points and their right/down neighbors at once
+        angles = default_flow_field.get_flow_angle_array(
+            np.concatenate([xs, xs + step, xs]), np.concatenate([ys, ys, ys + step])
+        )
+        angle_current, angle_right, angle_down = angles.reshape(3, -1)
 
-                max_angle_diff = max(max_angle_diff, diff_right, diff_down)
+        # compute angle differences (accounting for wrap-around at +/- pi)
+        diff = _angle_diff(angle_current, np.stack([angle_right, angle_down]))
+        max_angle_diff = diff.max()
 
         # then - angle differences should be less than threshold
         assert max_angle_diff < CONTINUITY_THRESHOLD, (
@@ -527,22 +947,18 @@ class TestFlowFieldContinuity:
             f"threshold {CONTINUITY_THRESHOLD}"
         )
 
-    def test_base_flow_time_continuity(self) -> None:
+    def test_base_flow_time_continuity(self, default_flow_field: FlowField) -> None:
         """test that animation is smooth over time (no discontinuities)."""
         # given
-        flow_field = FlowField()
         x, y = 100.0, 100.0
         time_steps = [0.0, 0.1, 0.2]
 
         # when - sample same point at consecutive time steps
-        angles = [flow_field.get_flow_angle(x, y, time=t) for t in time_steps]
+        angles = [default_flow_field.get_flow_angle(x, y, time=t) for t in time_steps]
 
         # then - angle changes should be gradual
         for i in range(len(angles) - 1):
-            angle_diff = abs(angles[i] - angles[i + 1])
-            # handle wrap-around at +/- pi
-            if angle_diff > math.pi:
-                angle_diff = 2 * math.pi - angle_diff
+            angle_diff = _angle_diff(angles[i], angles[i + 1])
 
             assert angle_diff < TIME_CONTINUITY_THRESHOLD, (
                 f"time step {time_steps[i]} -> {time_steps[i + 1]}: "
@@ -550,35 +966,24 @@ class TestFlowFieldContinuity:
                 f"threshold {TIME_CONTINUITY_THRESHOLD}"
             )
 
-    def test_base_flow_angle_distribution(self) -> None:
+    def test_base_flow_angle_distribution(self, default_flow_field: FlowField) -> None:
         """test that angles cover reasonable range (not all pointing same direction)."""
         # given
-        flow_field = FlowField()
         num_samples = 100
         sample_range = 500.0
 
         # when - sample many points across a large area
-        angles = []
-        for i in range(num_samples):
-            x = (i % 10) * (sample_range / 10)
-            y = (i // 10) * (sample_range / 10)
-            angle = flow_field.get_flow_angle(x, y)
-            angles.append(angle)
+        index = np.arange(num_samples)
+        xs = (index % 10) * (sample_range / 10)
+        ys = (index // 10) * (sample_range / 10)
+        angles = default_flow_field.get_flow_angle_array(xs, ys)
 
         # then - angles should be distributed (not all similar)
         # compute histogram bins (8 bins covering -pi to pi)
-        num_bins = 8
-        bin_width = 2 * math.pi / num_bins
-        bin_counts = [0] * num_bins
-
-        for angle in angles:
-            # shift from [-pi, pi] to [0, 2*pi] for binning
-            shifted = angle + math.pi
-            bin_idx = min(int(shifted / bin_width), num_bins - 1)
-            bin_counts[bin_idx] += 1
+        bin_counts, _ = np.histogram(angles, bins=8, range=(-math.pi, math.pi))
 
         # at least 3 bins should have points (not all in same direction)
-        non_empty_bins = sum(1 for count in bin_counts if count > 0)
+        non_empty_bins = int((bin_counts > 0).sum())
         assert non_empty_bins >= 3, (
             f"only {non_empty_bins} bins have angles - flow may be too monotonic"
         )
@@ -0,0 +1,95 @@
+"""Unit tests for fluffy_clouds module."""
+
+import numpy as np
+
+from generative_art.fluffy_clouds import FluffyClouds, upsample_bilinear
+
+# largest acceptable warp offset error from tiling, in pixels
+MAX_WARP_ERROR_PX = 0.1
+
+
+def test_fbm_noise_cutoff_keeps_values_above_cutoff() -> None:
+    """test that culling never changes a value that reaches the cutoff."""
+    # given
+    sketch = FluffyClouds(width=400, height=300)
+    xs, ys = np.meshgrid(np.arange(0, 400, 4.0), np.arange(0, 300, 4.0))
+    cutoff = 0.5
+
+    # when
+    full = sketch.fbm_noise(xs, ys)
+    culled = sketch.fbm_noise(xs, ys, cutoff=cutoff)
+
+    # then
+    above = full >= cutoff
+    assert above.any()
+    assert np.allclose(culled[above], full[above])
+    assert np.all(culled[~above] < cutoff)
+
+
+def test_fbm_noise_accepts_non_contiguous_positions() -> None:
+    """test that transposed coordinate grids give transposed results."""
+    # given
+    sketch = FluffyClouds(width=400, height=300)
+    xs, ys = np.meshgrid(np.arange(0, 400, 8.0), np.arange(0, 300, 8.0))
+
+    # when
+    result = sketch.fbm_noise(xs, ys)
+    transposed = sketch.fbm_noise(xs.T, ys.T, cutoff=0.3)
+
+    # then
+    assert np.allclose(transposed, result.T)
+
+
+def test_upsample_bilinear_reproduces_linear_field() -> None:
+    """test that a linear field is interpolated exactly between lattice points."""
+    # given
+    rows, cols = np.meshgrid(np.arange(4.0), np.arange(5.0), indexing="ij")
+    coarse = 3.0 * rows - 2.0 * cols + 1.0
+    row_pos = np.linspace(0.0, 3.0, 13)
+    col_pos = np.linspace(0.0, 4.0, 17)
+
+    # when
+    result = upsample_bilinear(coarse, row_pos, col_pos)
+
+    # then
+    expected = 3.0 * row_pos[:, np.newaxis] - 2.0 * col_pos + 1.0
+    assert np.allclose(result, expected)
+
+
+def test_tiled_warp_field_matches_direct_warp() -> None:
+    """test that the upsampled warp stays within a fraction of a pixel."""
+    # given
+    sketch = FluffyClouds(width=640, height=360)
+    xs, ys = np.meshgrid(np.arange(0, 640, 2.0), np.arange(0, 360, 2.0))
+
+    # when
+    tiled_x, tiled_y = sketch.tiled_warp_field(xs.shape)
+    direct_x, direct_y = sketch.warp_offsets(xs, ys)
+
+    # then
+    max_offset_error = sketch.warp_strength * max(
+        np.abs(tiled_x - direct_x).max(), np.abs(tiled_y - direct_y).max()
+    )
+    assert max_offset_error < MAX_WARP_ERROR_PX
+
+
+def test_cloud_color_lookup_matches_float_gradient() -> None:
+    """test that the integer lookup colors stay within one level of float math."""
+    # given
+    sketch = FluffyClouds(width=200, height=300)
+    sketch.gradient_lut, sketch.brightness_lut = sketch.build_color_luts()
+    rng = np.random.default_rng(9)
+    cloud_value = rng.uniform(sketch.cloud_threshold, 1.0, 1000)
+    y = rng.integers(0, 300, 1000).astype(np.float64)
+
+    # when
+    colors = sketch.cloud_color(cloud_value, np.zeros_like(y), y)
+
+    # then
+    gradient_pos = y[:, np.newaxis] / 300
+    pink = np.array([255, 182, 193])
+    blue = np.array([176, 196, 222])
+    base = (pink + (blue - pink) * gradient_pos).astype(int)
+    brightness = 0.9 + cloud_value[:, np.newaxis] * 0.3
+    expected = np.minimum(255, base * brightness).astype(int)
+    assert np.abs(colors[:, :3].astype(int) - expected).max() <= 1
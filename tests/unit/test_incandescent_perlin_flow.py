@@ -1,8 +1,22 @@
 """Unit tests for incandescent_perlin_flow module."""
 
+import math
+
+import numpy as np
 import pytest
 
-from generative_art.incandescent_perlin_flow import parse_resolution
+from generative_art import incandescent_perlin_flow
+from generative_art.export import parse_resolution
+from generative_art.incandescent_perlin_flow import (
+    IncandesceeentPerlinFlow,
+    build_flow_field,
+    sample_field,
+    sample_flow_noise,
+    trace_flow_lines,
+)
+
+# largest flow angle error, in radians, from interpolating the noise field
+MAX_FIELD_ANGLE_ERROR = 0.05
 
 
 def test_parse_resolution_with_1080p_shorthand() -> None:
@@ -189,3 +203,190 @@ def test_parse_resolution_raises_error_for_non_numeric_dimensions() -> None:
 
     # then
     assert "invalid resolution" in str(exc_info.value)
+
+
+def test_build_flow_field_covers_the_canvas() -> None:
+    """test that the grid reaches past the canvas and holds exact noise."""
+    # given
+    width, height = 640, 480
+
+    # when
+    field, spacing = build_flow_field(0.003, width, height)
+
+    # then
+    rows, cols = field.shape
+    assert field.dtype == np.float32
+    assert (cols - 1) * spacing >= width
+    assert (rows - 1) * spacing >= height
+    assert field[3, 5] == pytest.approx(
+        float(
+            sample_flow_noise(
+                np.array(5 * spacing * 0.003), np.array(3 * spacing * 0.003)
+            )
+        )
+    )
+
+
+def test_build_flow_field_reuses_read_only_fields() -> None:
+    """test that repeated builds share one field that cannot be modified."""
+    # given
+    first, _ = build_flow_field(0.004, 320, 240)
+
+    # when
+    second, _ = build_flow_field(0.004, 320, 240)
+
+    # then
+    assert second is first
+    with pytest.raises(ValueError, match="read-only"):
+        second[0, 0] = 1.0
+
+
+def test_sample_field_stays_close_to_direct_noise() -> None:
+    """test that interpolated flow angles track the exact noise field."""
+    # given
+    noise_scale = 0.003
+    field, spacing = build_flow_field(noise_scale, 1920, 1080)
+    rng = np.random.default_rng(4)
+    x = rng.uniform(0, 1920, 10_000)
+    y = rng.uniform(0, 1080, 10_000)
+
+    # when
+    sampled = sample_field(field, spacing, x, y)
+
+    # then
+    exact = sample_flow_noise(x * noise_scale, y * noise_scale)
+    angle_error = np.abs(sampled - exact) * math.tau * 2
+    assert angle_error.max() < MAX_FIELD_ANGLE_ERROR
+
+
+def test_trace_flow_lines_matches_stepping_each_particle_alone() -> None:
+    """test that batched tracing follows the same path as a per-particle loop."""
+    # given
+    xs = np.array([100.0, 400.0, 250.0])
+    ys = np.array([80.0, 300.0, 10.0])
+    flow_strength = 2.0
+    width, height = 500.0, 400.0
+    field, spacing = build_flow_field(0.003, width, height)
+
+    # when
+    paths, lengths = trace_flow_lines(
+        xs, ys, field, spacing, flow_strength, 40, width, height
+    )
+
+    # then
+    for i in range(len(xs)):
+        x, y = xs[i], ys[i]
+        expected = [(x, y)]
+        for _ in range(40):
+            noise_val = sample_field(field, spacing, np.array(x), np.array(y))
+            angle = float(noise_val) * math.tau * 2
+            x += math.cos(angle) * flow_strength
+            y += math.sin(angle) * flow_strength
+            if x < 0 or x > width or y < 0 or y > height:
+                break
+            expected.append((x, y))
+        assert lengths[i] == len(expected)
+        assert np.allclose(paths[i, : lengths[i]], expected)
+
+
+def test_trace_flow_lines_stops_particles_at_canvas_edge() -> None:
+    """test that particles leaving the canvas keep no further points."""
+    # given
+    xs = np.array([1.0, 50.0])
+    ys = np.array([1.0, 50.0])
+    size = 100.0
+    steps = 100
+    field, spacing = build_flow_field(0.003, size, size)
+
+    # when
+    paths, lengths = trace_flow_lines(xs, ys, field, spacing, 5.0, steps, size, size)
+
+    # then
+    for i in range(len(xs)):
+        points = paths[i, : lengths[i]]
+        assert np.all((points >= 0) & (points <= size))
+    assert np.all(lengths <= steps + 1)
+
+
+def test_trace_flow_lines_keeps_positions_in_float32() -> None:
+    """test that float64 inputs are traced into float32 paths."""
+    # given
+    xs = np.array([10.0, 20.0])
+    ys = np.array([30.0, 40.0])
+    field, spacing = build_flow_field(0.003, 64, 64)
+
+    # when
+    paths, _ = trace_flow_lines(xs, ys, field, spacing, 2.0, 8, 64, 64)
+
+    # then
+    assert paths.dtype == np.float32
+    assert paths.flags.c_contiguous
+
+
+def test_trace_flow_lines_compiled_and_numpy_paths_agree(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """test that the numba kernel and the numpy fallback trace the same lines."""
+    # given
+    rng = np.random.default_rng(8)
+    xs = rng.uniform(0, 640, 200)
+    ys = rng.uniform(0, 480, 200)
+    field, spacing = build_flow_field(0.003, 640, 480)
+    compiled = trace_flow_lines(xs, ys, field, spacing, 2.0, 60, 640, 480)
+
+    # when
+    monkeypatch.setattr(incandescent_perlin_flow, "NUMBA_AVAILABLE", False)
+    vectorized = trace_flow_lines(xs, ys, field, spacing, 2.0, 60, 640, 480)
+
+    # then
+    assert np.array_equal(compiled[1], vectorized[1])
+    for i in range(len(xs)):
+        length = compiled[1][i]
+        assert np.allclose(compiled[0][i, :length], vectorized[0][i, :length])
+
+
+class RecordingGraphics:
+    """records the strokes and lines drawn into an offscreen buffer."""
+
+    def __init__(self) -> None:
+        """Initialize with nothing drawn."""
+        self.strokes: list[tuple[float, ...]] = []
+        self.line_batches: list[np.ndarray] = []
+
+    def stroke_weight(self, _weight: float) -> None:
+        """Set the stroke weight."""
+
+    def no_fill(self) -> None:
+        """Disable fills."""
+
+    def stroke(self, *color: float) -> None:
+        """Record the stroke color."""
+        self.strokes.append(color)
+
+    def lines(self, coordinates: np.ndarray) -> None:
+        """Record a batch of line segments."""
+        self.line_batches.append(coordinates)
+
+
+def test_draw_segments_batches_lines_by_stroke_color() -> None:
+    """test that similar colors share one stroke and one lines call."""
+    # given
+    sketch = IncandesceeentPerlinFlow(width=640, height=480, seed=3)
+    segments = np.arange(16, dtype=float).reshape(4, 4)
+    colors = np.array(
+        [
+            [180, 190, 220, 100],
+            [181, 191, 221, 101],
+            [180, 190, 220, 10],
+            [100, 190, 220, 100],
+        ]
+    )
+    target = RecordingGraphics()
+
+    # when
+    sketch.draw_segments(target, segments, colors)
+
+    # then
+    assert len(target.strokes) == len(target.line_batches) == 3
+    drawn = np.concatenate(target.line_batches)
+    assert sorted(map(tuple, drawn)) == sorted(map(tuple, segments))
@@ -1,6 +1,16 @@
 """Unit tests for noise_utils module."""
 
-from generative_art.noise_utils import fbm_noise1, fbm_noise2, fbm_noise3, init_noise
+import numpy as np
+import opensimplex
+
+from generative_art.noise_utils import (
+    fbm_noise1,
+    fbm_noise2,
+    fbm_noise2_grid,
+    fbm_noise3,
+    fbm_noise3_array,
+    init_noise,
+)
 
 # continuity threshold - small coordinate changes should produce small value changes
 CONTINUITY_THRESHOLD = 0.1
@@ -61,6 +71,19 @@ class TestFbmNoise2:
         # then
         assert isinstance(result, float)
 
+    def test_fbm_noise2_matches_opensimplex_octave_sum(self) -> None:
+        """test that the compiled octave loop equals summing opensimplex octaves."""
+        # given
+        init_noise(5)
+        x, y = 3.7, -1.2
+        octaves = [opensimplex.noise2(x * 2**i, y * 2**i) * 0.5**i for i in range(4)]
+
+        # when
+        result = fbm_noise2(x, y, octaves=4)
+
+        # then
+        assert np.isclose(result, sum(octaves) / sum(0.5**i for i in range(4)))
+
     def test_fbm_noise2_output_in_range(self) -> None:
         """test that output is always in [-1.0, 1.0] range."""
         # given
@@ -215,6 +238,59 @@ class TestFbmNoise3:
             assert -1.0 <= result <= 1.0, f"out of range at ({x}, {y}, {z}): {result}"
 
 
+class TestFbmNoise3Array:
+    """tests for fbm_noise3_array function."""
+
+    def test_fbm_noise3_array_matches_scalar_evaluation(self) -> None:
+        """test that evaluating an array equals evaluating each point alone."""
+        # given
+        init_noise(42)
+        rng = np.random.default_rng(4)
+        points = rng.uniform(-30, 30, (200, 3))
+
+        # when
+        batched = fbm_noise3_array(
+            points[:, 0], points[:, 1], points[:, 2], octaves=3, persistence=0.6
+        )
+        scalar = [fbm_noise3(x, y, z, octaves=3, persistence=0.6) for x, y, z in points]
+
+        # then
+        assert np.array_equal(batched, scalar)
+
+    def test_fbm_noise3_array_broadcasts_scalar_z(self) -> None:
+        """test that a scalar time coordinate broadcasts over point grids."""
+        # given
+        x = np.linspace(0, 5, 7)
+        y = np.linspace(0, 3, 4)[:, np.newaxis]
+
+        # when
+        result = fbm_noise3_array(x, y, 0.5, octaves=2)
+
+        # then
+        assert result.shape == (4, 7)
+        assert np.all(np.abs(result) <= 1.0)
+
+
+class TestFbmNoise2Grid:
+    """tests for fbm_noise2_grid function."""
+
+    def test_fbm_noise2_grid_matches_scalar_evaluation(self) -> None:
+        """test that each grid cell equals fbm_noise2 at its coordinates."""
+        # given
+        init_noise(42)
+        xs = np.linspace(-2.0, 6.0, 9)
+        ys = np.linspace(1.0, 3.0, 5)
+
+        # when
+        grid = fbm_noise2_grid(xs, ys, octaves=4, lacunarity=1.8)
+
+        # then
+        assert grid.shape == (5, 9)
+        assert grid.dtype == np.float32
+        scalar = [[fbm_noise2(x, y, octaves=4, lacunarity=1.8) for x in xs] for y in ys]
+        assert np.array_equal(grid, np.asarray(scalar, dtype=np.float32))
+
+
 class TestFbmNoise1:
     """tests for fbm_noise1 function."""
 
@@ -0,0 +1,109 @@
+"""Unit tests for particles module."""
+
+import math
+
+import numpy as np
+import pytest
+
+from generative_art.particles import (
+    build_step_color_lut,
+    flow_line_colors,
+    particle_base_colors,
+    seed_particles,
+)
+
+
+def test_build_step_color_lut_matches_per_step_formulas() -> None:
+    """test that each lut row holds the color shifts and alpha for its step."""
+    # given
+    steps = 250
+
+    # when
+    lut = build_step_color_lut(steps)
+
+    # then
+    assert lut.shape == (steps, 4)
+    for step in (0, 1, 99, 249):
+        expected = (
+            np.sin(step * 0.1) * 20,
+            np.cos(step * 0.1) * 20,
+            np.sin(step * 0.15) * 20,
+            255 * (1 - step / steps) * 0.4,
+        )
+        assert np.allclose(lut[step], expected, atol=1e-4)
+
+
+def test_seed_particles_is_deterministic_for_a_seed() -> None:
+    """test that the same seed always places particles in the same spots."""
+    # given
+    first_rng = np.random.default_rng(42)
+    second_rng = np.random.default_rng(42)
+
+    # when
+    first = seed_particles(first_rng, 3000, 1920, 1080)
+    second = seed_particles(second_rng, 3000, 1920, 1080)
+
+    # then
+    assert np.array_equal(first[0], second[0])
+    assert np.array_equal(first[1], second[1])
+
+
+def test_seed_particles_layout() -> None:
+    """test the random, ring and center particle groups."""
+    # given
+    rng = np.random.default_rng(7)
+    width, height = 1920, 1080
+    num_particles = 3000
+
+    # when
+    px, py = seed_particles(rng, num_particles, width, height)
+
+    # then - 1500 random, 5 rings of 120, 900 at the center
+    assert px.dtype == np.float32
+    assert len(px) == len(py) == num_particles
+    assert np.all((px[:1500] >= 0) & (px[:1500] <= width))
+    assert np.all((py[:1500] >= 0) & (py[:1500] <= height))
+    radius = np.hypot(px - width / 2, py - height / 2)
+    rings = radius[1500:2100].reshape(5, 120)
+    for ring, ring_radii in enumerate(rings):
+        assert np.all(np.abs(ring_radii - (ring + 1) * 80) <= 30 + 1e-3)
+    assert np.all(radius[2100:] <= 5 + 1e-3)
+
+
+def test_particle_base_colors_follow_id_and_start_position() -> None:
+    """test that base colors depend on particle id and starting x."""
+    # given
+    xs = np.array([0.0, 0.0, 300.0])
+
+    # when
+    colors = particle_base_colors(xs)
+
+    # then
+    hue = (2 * 0.5 + 300.0 * 0.1) % 360
+    assert colors.shape == (3, 3)
+    assert colors[2].tolist() == [
+        int((math.sin(hue * 0.02) + 1) * 100 + 80),
+        int((math.cos(hue * 0.03 + 2) + 1) * 90 + 100),
+        int((math.sin(hue * 0.025 + 4) + 1) * 100 + 120),
+    ]
+    assert colors[0].tolist() != colors[1].tolist()
+
+
+def test_flow_line_colors_drift_and_fade_along_the_line() -> None:
+    """test that segment colors shift with step and fade towards the end."""
+    # given
+    base_colors = np.array([[180, 190, 220], [180, 190, 220], [100, 120, 140]])
+    step_ids = np.array([0, 125, 37])
+    steps = 250
+
+    # when
+    colors = flow_line_colors(base_colors, step_ids, build_step_color_lut(steps))
+
+    # then
+    for (r, g, b), step, color in zip(base_colors, step_ids, colors, strict=True):
+        assert color[:3].tolist() == [
+            int(r + math.sin(step * 0.1) * 20),
+            int(g + math.cos(step * 0.1) * 20),
+            int(b + math.sin(step * 0.15) * 20),
+        ]
+        assert color[3] == pytest.approx(255 * (1 - step / steps) * 0.4, rel=1e-6)
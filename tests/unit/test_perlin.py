@@ -0,0 +1,346 @@
+"""Unit tests for perlin module."""
+
+import numpy as np
+import pytest
+
+from generative_art import perlin
+from generative_art.perlin import (
+    perlin2,
+    perlin2_hashed,
+    perlin2_hashed_scalar,
+    perlin3,
+    perlin3_scalar,
+    pnoise2,
+    pnoise2_scalar,
+    pnoise3,
+    pnoise3_scalar,
+)
+
+# continuity threshold - small coordinate changes should produce small value changes
+CONTINUITY_THRESHOLD = 0.1
+
+
+class TestPerlin2:
+    """tests for perlin2 function."""
+
+    def test_perlin2_is_zero_on_lattice_points(self) -> None:
+        """test that noise vanishes at integer lattice coordinates."""
+        # given
+        xs, ys = np.meshgrid(np.arange(-3, 4), np.arange(-3, 4))
+
+        # when
+        result = perlin2(xs, ys)
+
+        # then
+        assert np.allclose(result, 0.0)
+
+    def test_perlin2_output_in_range(self) -> None:
+        """test that output is always in [-1.0, 1.0] range."""
+        # given
+        rng = np.random.default_rng(42)
+        x = rng.uniform(-500, 500, 10_000)
+        y = rng.uniform(-500, 500, 10_000)
+
+        # when
+        result = perlin2(x, y)
+
+        # then
+        assert np.all(result >= -1.0)
+        assert np.all(result <= 1.0)
+
+    def test_perlin2_broadcasts_inputs(self) -> None:
+        """test that x and y are broadcast against each other."""
+        # given
+        x = np.linspace(0, 4, 7)
+        y = np.linspace(0, 3, 5)[:, np.newaxis]
+
+        # when
+        result = perlin2(x, y)
+
+        # then
+        assert result.shape == (5, 7)
+
+
+class TestPerlin2Hashed:
+    """tests for the murmur-hashed perlin2 variant."""
+
+    def test_perlin2_hashed_is_zero_on_lattice_points(self) -> None:
+        """test that noise vanishes at integer lattice coordinates."""
+        # given
+        xs, ys = np.meshgrid(np.arange(-3, 4), np.arange(-3, 4))
+
+        # when
+        result = perlin2_hashed(xs, ys)
+
+        # then
+        assert np.allclose(result, 0.0)
+
+    def test_perlin2_hashed_matches_scalar_kernel(self) -> None:
+        """test that the array and scalar hashed kernels agree."""
+        # given
+        rng = np.random.default_rng(23)
+        points = rng.uniform(-1000, 1000, (200, 2))
+
+        # when
+        batched = perlin2_hashed(points[:, 0], points[:, 1])
+        scalar = [perlin2_hashed_scalar(x, y) for x, y in points]
+
+        # then
+        assert np.allclose(batched, scalar)
+        assert np.all(np.abs(batched) <= 1.0)
+
+    def test_perlin2_hashed_does_not_repeat_every_256_cells(self) -> None:
+        """test that the hashed lattice is not periodic like the table."""
+        # given
+        x = np.linspace(0.1, 9.9, 50)
+        y = np.full_like(x, 3.3)
+
+        # when
+        tiled = perlin2(x + 256, y)
+        hashed = perlin2_hashed(x + 256, y)
+
+        # then
+        assert np.allclose(tiled, perlin2(x, y))
+        assert not np.allclose(hashed, perlin2_hashed(x, y))
+
+
+class TestPnoise2:
+    """tests for pnoise2 function."""
+
+    def test_pnoise2_array_matches_scalar_evaluation(self) -> None:
+        """test that evaluating an array equals evaluating each point alone."""
+        # given
+        rng = np.random.default_rng(7)
+        x = rng.uniform(0, 50, 64)
+        y = rng.uniform(0, 50, 64)
+
+        # when
+        batched = pnoise2(x, y, octaves=4)
+        scalar = np.array(
+            [pnoise2(px, py, octaves=4) for px, py in zip(x, y, strict=True)]
+        )
+
+        # then
+        assert np.array_equal(batched, scalar)
+
+    def test_pnoise2_scalar_matches_array_version(self) -> None:
+        """test that the scalar kernel agrees with the array version."""
+        # given
+        rng = np.random.default_rng(31)
+        points = rng.uniform(-50, 50, (100, 2))
+
+        # when
+        batched = pnoise2(points[:, 0], points[:, 1], octaves=3)
+        scalar = [pnoise2_scalar(x, y, 3, 0.5, 2.0) for x, y in points]
+
+        # then
+        assert np.allclose(batched, scalar)
+
+    def test_pnoise2_is_deterministic(self) -> None:
+        """test that the same coordinates always produce the same values."""
+        # given
+        x = np.linspace(0.1, 10.0, 100)
+        y = np.linspace(5.0, 0.2, 100)
+
+        # when
+        first = pnoise2(x, y, octaves=3)
+        second = pnoise2(x, y, octaves=3)
+
+        # then
+        assert np.array_equal(first, second)
+
+    def test_pnoise2_single_octave_equals_perlin2(self) -> None:
+        """test that one octave is plain perlin noise."""
+        # given
+        x = np.linspace(0.3, 8.7, 50)
+        y = np.linspace(1.1, 4.2, 50)
+
+        # when / then
+        assert np.allclose(pnoise2(x, y), perlin2(x, y))
+
+    def test_pnoise2_octaves_affect_output(self) -> None:
+        """test that different octave counts produce different outputs."""
+        # given
+        x, y = 0.5, 0.5
+
+        # when
+        value_1_octave = pnoise2(x, y, octaves=1)
+        value_4_octaves = pnoise2(x, y, octaves=4)
+
+        # then
+        assert value_1_octave != value_4_octaves
+
+    def test_pnoise2_output_normalized_with_many_octaves(self) -> None:
+        """test that output stays in [-1.0, 1.0] with many octaves."""
+        # given
+        rng = np.random.default_rng(3)
+        x = rng.uniform(-100, 100, 5_000)
+        y = rng.uniform(-100, 100, 5_000)
+
+        # when
+        result = pnoise2(x, y, octaves=8, persistence=0.7)
+
+        # then
+        assert np.all(np.abs(result) <= 1.0)
+
+    def test_pnoise2_continuous(self) -> None:
+        """test that nearby inputs produce nearby outputs (continuity)."""
+        # given
+        x, y = 0.5, 0.5
+        delta = 0.001
+
+        # when
+        value_base = pnoise2(x, y, octaves=6)
+        value_nearby = pnoise2(x + delta, y, octaves=6)
+
+        # then
+        difference = abs(value_base - value_nearby)
+        assert difference < CONTINUITY_THRESHOLD, f"discontinuity: {difference}"
+
+
+class TestPnoise3Scalar:
+    """tests for the scalar 3D kernels."""
+
+    def test_perlin3_scalar_is_zero_on_lattice_points(self) -> None:
+        """test that noise vanishes at integer lattice coordinates."""
+        # given
+        points = [(0, 0, 0), (3, -2, 7), (-5, 11, 1)]
+
+        # when / then
+        for x, y, z in points:
+            assert perlin3_scalar(x, y, z) == 0.0
+
+    def test_pnoise3_scalar_output_in_range(self) -> None:
+        """test that output is always in [-1.0, 1.0] range."""
+        # given
+        rng = np.random.default_rng(11)
+        points = rng.uniform(-200, 200, (500, 3))
+
+        # when / then
+        for x, y, z in points:
+            result = pnoise3_scalar(x, y, z, 3, 0.5, 2.0)
+            assert -1.0 <= result <= 1.0, f"out of range at ({x}, {y}, {z}): {result}"
+
+    def test_pnoise3_scalar_z_affects_output(self) -> None:
+        """test that the z (time) coordinate changes the output."""
+        # given
+        x, y = 1.3, 2.7
+
+        # when
+        value_t0 = pnoise3_scalar(x, y, 0.25, 3, 0.5, 2.0)
+        value_t1 = pnoise3_scalar(x, y, 0.75, 3, 0.5, 2.0)
+
+        # then
+        assert value_t0 != value_t1
+
+    def test_pnoise3_scalar_continuous(self) -> None:
+        """test that nearby inputs produce nearby outputs (continuity)."""
+        # given
+        x, y, z = 0.5, 0.5, 0.5
+        delta = 0.001
+
+        # when
+        value_base = pnoise3_scalar(x, y, z, 3, 0.5, 2.0)
+        value_nearby = pnoise3_scalar(x, y, z + delta, 3, 0.5, 2.0)
+
+        # then
+        difference = abs(value_base - value_nearby)
+        assert difference < CONTINUITY_THRESHOLD, f"discontinuity: {difference}"
+
+
+class TestPnoise3:
+    """tests for pnoise3 function."""
+
+    def test_perlin3_is_zero_on_lattice_points(self) -> None:
+        """test that noise vanishes at integer lattice coordinates."""
+        # given
+        grid = np.arange(-2, 3)
+
+        # when
+        result = perlin3(grid[:, None, None], grid[None, :, None], grid[None, None, :])
+
+        # then
+        assert result.shape == (5, 5, 5)
+        assert np.allclose(result, 0.0)
+
+    def test_pnoise3_matches_scalar_kernel(self) -> None:
+        """test that the array version agrees with the scalar kernel."""
+        # given
+        rng = np.random.default_rng(5)
+        points = rng.uniform(-20, 20, (200, 3))
+
+        # when
+        batched = pnoise3(points[:, 0], points[:, 1], points[:, 2], octaves=3)
+        scalar = np.array([pnoise3_scalar(x, y, z, 3, 0.5, 2.0) for x, y, z in points])
+
+        # then
+        assert np.allclose(batched, scalar)
+
+    def test_pnoise3_broadcasts_scalar_z(self) -> None:
+        """test that a scalar time coordinate broadcasts over point arrays."""
+        # given
+        x = np.linspace(0, 5, 10)
+        y = np.linspace(0, 3, 10)
+
+        # when
+        result = pnoise3(x, y, 0.5, octaves=2)
+
+        # then
+        assert result.shape == (10,)
+        assert np.all(np.abs(result) <= 1.0)
+
+
+class TestBatchKernels:
+    """tests for the compiled whole-batch fBm path."""
+
+    def test_pnoise2_batch_matches_numpy_path(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """test that the compiled batch and the numpy octave loop agree."""
+        # given
+        rng = np.random.default_rng(13)
+        x = rng.uniform(-40, 40, (30, 20))
+        y = rng.uniform(-40, 40, (30, 20))
+        batched = pnoise2(x, y, octaves=5, persistence=0.6)
+
+        # when
+        monkeypatch.setattr(perlin, "NUMBA_AVAILABLE", False)
+        vectorized = pnoise2(x, y, octaves=5, persistence=0.6)
+
+        # then
+        assert batched.shape == (30, 20)
+        assert np.allclose(batched, vectorized)
+
+    def test_pnoise2_hashed_batch_matches_numpy_path(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """test that both hashed-gradient paths agree."""
+        # given
+        rng = np.random.default_rng(29)
+        x = rng.uniform(-40, 40, 500)
+        y = rng.uniform(-40, 40, 500)
+        batched = pnoise2(x, y, octaves=3, hashed=True)
+
+        # when
+        monkeypatch.setattr(perlin, "NUMBA_AVAILABLE", False)
+        vectorized = pnoise2(x, y, octaves=3, hashed=True)
+
+        # then
+        assert np.allclose(batched, vectorized)
+
+    def test_pnoise3_batch_matches_numpy_path(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """test that the compiled batch and the numpy octave loop agree."""
+        # given
+        rng = np.random.default_rng(17)
+        x = rng.uniform(-40, 40, 500)
+        y = rng.uniform(-40, 40, 500)
+        batched = pnoise3(x, y, 0.75, octaves=3)
+
+        # when
+        monkeypatch.setattr(perlin, "NUMBA_AVAILABLE", False)
+        vectorized = pnoise3(x, y, 0.75, octaves=3)
+
+        # then
+        assert np.allclose(batched, vectorized)
@@ -0,0 +1,148 @@
+"""Unit tests for segments module."""
+
+import numpy as np
+
+from generative_art.segments import (
+    group_segments_by_color,
+    paths_to_segments,
+    segments_to_triangles,
+)
+
+
+class TestPathsToSegments:
+    """tests for paths_to_segments function."""
+
+    def test_paths_to_segments_joins_consecutive_points(self) -> None:
+        """test that each segment joins a point to the next one on its path."""
+        # given
+        paths = np.array(
+            [
+                [[0.0, 0.0], [1.0, 0.0], [2.0, 0.0]],
+                [[5.0, 5.0], [5.0, 6.0], [9.0, 9.0]],
+            ]
+        )
+        lengths = np.array([3, 2])
+
+        # when
+        segments, path_ids, step_ids = paths_to_segments(paths, lengths)
+
+        # then
+        assert segments.tolist() == [
+            [0.0, 0.0, 1.0, 0.0],
+            [1.0, 0.0, 2.0, 0.0],
+            [5.0, 5.0, 5.0, 6.0],
+        ]
+        assert path_ids.tolist() == [0, 0, 1]
+        assert step_ids.tolist() == [0, 1, 0]
+
+    def test_paths_to_segments_skips_single_point_paths(self) -> None:
+        """test that paths with fewer than two points produce no segments."""
+        # given
+        paths = np.zeros((2, 4, 2))
+        lengths = np.array([1, 1])
+
+        # when
+        segments, path_ids, step_ids = paths_to_segments(paths, lengths)
+
+        # then
+        assert segments.shape == (0, 4)
+        assert len(path_ids) == 0
+        assert len(step_ids) == 0
+
+
+class TestSegmentsToTriangles:
+    """tests for segments_to_triangles function."""
+
+    def test_segments_to_triangles_builds_quad_of_line_width(self) -> None:
+        """test that a segment becomes two triangles spanning its width."""
+        # given
+        segments = np.array([[0.0, 0.0, 4.0, 0.0]])
+
+        # when
+        vertices = segments_to_triangles(segments, width=2.0)
+
+        # then
+        assert vertices.tolist() == [
+            [0.0, 1.0],
+            [0.0, -1.0],
+            [4.0, 1.0],
+            [0.0, -1.0],
+            [4.0, -1.0],
+            [4.0, 1.0],
+        ]
+
+    def test_segments_to_triangles_collapses_zero_length_segments(self) -> None:
+        """test that zero-length segments produce degenerate triangles."""
+        # given
+        segments = np.array([[3.0, 5.0, 3.0, 5.0], [0.0, 0.0, 0.0, 2.0]])
+
+        # when
+        vertices = segments_to_triangles(segments, width=1.5)
+
+        # then
+        assert vertices.shape == (12, 2)
+        assert np.all(vertices[:6] == [3.0, 5.0])
+        assert np.allclose(np.abs(vertices[6:, 0]), 0.75)
+
+
+class TestGroupSegmentsByColor:
+    """tests for group_segments_by_color function."""
+
+    def test_group_segments_by_color_keeps_every_segment(self) -> None:
+        """test that grouping neither drops nor duplicates segments."""
+        # given
+        rng = np.random.default_rng(42)
+        segments = rng.uniform(0, 100, (500, 4))
+        colors = rng.uniform(0, 255, (500, 4))
+
+        # when
+        groups = group_segments_by_color(segments, colors)
+
+        # then
+        grouped = np.concatenate([bucket for _, bucket in groups])
+        assert len(grouped) == len(segments)
+        assert {tuple(row) for row in grouped} == {tuple(row) for row in segments}
+
+    def test_group_segments_by_color_merges_similar_colors(self) -> None:
+        """test that colors within one bucket share a single stroke."""
+        # given
+        segments = np.arange(12, dtype=float).reshape(3, 4)
+        colors = np.array(
+            [
+                [100, 50, 20, 200],
+                [103, 52, 25, 205],
+                [200, 50, 20, 200],
+            ]
+        )
+
+        # when
+        groups = group_segments_by_color(segments, colors, quantum=16)
+
+        # then
+        assert len(groups) == 2
+        assert sorted(len(bucket) for _, bucket in groups) == [1, 2]
+
+    def test_group_segments_by_color_clips_out_of_range_channels(self) -> None:
+        """test that bucket colors are always valid 0-255 channel values."""
+        # given
+        segments = np.zeros((2, 4))
+        colors = np.array([[300, -20, 255, 40], [0, 0, 0, 0]])
+
+        # when
+        groups = group_segments_by_color(segments, colors)
+
+        # then
+        for color, _ in groups:
+            assert all(0 <= channel <= 255 for channel in color)
+
+    def test_group_segments_by_color_handles_no_segments(self) -> None:
+        """test that an empty segment array yields no groups."""
+        # given
+        segments = np.empty((0, 4))
+        colors = np.empty((0, 4))
+
+        # when
+        groups = group_segments_by_color(segments, colors)
+
+        # then
+        assert groups == []